@@ -1,4 +1,6 @@
 # Create a comprehensive dataset for workforce development programs and initiatives
+import pandas as pd
+
 workforce_programs_data = {
     'Program/Initiative': [
         'UpSkill Houston Participants',
@@ -1,7 +1,19 @@
 # Create a comprehensive summary of key findings for the Houston STR market analysis
 
+import sys
+from pathlib import Path
+
 import pandas as pd
 
+# dp5 lives one folder up; put it on the path so the script also runs by hand from here
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from dp5.consensus import consensus, summary_values  # noqa: E402
+
+# Consensus of the providers' figures: listing-weighted, with 95% bootstrap intervals
+provider_df = pd.read_csv('houston_str_market_data.csv')
+consensus_df = consensus(provider_df)
+consensus_values = summary_values(consensus_df)
+
 # Market Performance Summary
 market_summary = {
     'Metric': [
@@ -15,10 +27,10 @@ market_summary = {
         'Effective Date'
     ],
     'Value': [
-        '8,656 - 20,161 listings',
-        '51.0% (43-59% range)',
-        '$127 - $279 ($189 average)',
-        '$11,854 - $27,000 ($16,896 average)',
+        consensus_values['Total Active Listings (Range)'],
+        consensus_values['Average Occupancy Rate'],
+        consensus_values['Average Daily Rate (Range)'],
+        consensus_values['Average Annual Revenue (Range)'],
         'Midtown, EaDo, The Heights',
         'New ordinance adopted',
         '$275 annual fee',
@@ -26,9 +38,9 @@ market_summary = {
     ],
     'Source': [
         'Multiple data providers',
-        'Weighted average across sources',
-        'Market data analysis',
-        'Market data analysis', 
+        'Listing-weighted average across sources',
+        'Listing-weighted average across sources',
+        'Listing-weighted average across sources',
         'Neighborhood performance data',
         'Houston City Council',
         'City ordinance',
@@ -102,6 +114,10 @@ print("\n📊 MARKET PERFORMANCE SUMMARY:")
 print("-" * 50)
 print(summary_df.to_string(index=False))
 
+print("\n📐 PROVIDER CONSENSUS (95% bootstrap intervals):")
+print("-" * 50)
+print(consensus_df[['metric', 'value', 'value_low', 'value_high', 'source_min', 'source_max']].round(1).to_string(index=False))
+
 print("\n🏛️ REGULATORY IMPACT ANALYSIS:")
 print("-" * 50)
 print(regulatory_df.to_string(index=False))
@@ -112,6 +128,7 @@ print(tier_df.to_string(index=False))
 
 # Save summary data
 summary_df.to_csv('houston_str_market_summary.csv', index=False)
+consensus_df.round(2).to_csv('houston_str_consensus.csv', index=False)
 regulatory_df.to_csv('houston_str_regulatory_impact.csv', index=False)
 tier_df.to_csv('houston_str_neighborhood_tiers.csv', index=False)
 
@@ -1,4 +1,6 @@
 # Create neighborhood rental comparison data based on the research
+import pandas as pd
+
 neighborhood_data = {
     'Neighborhood': ['Downtown Houston', 'The Heights', 'Montrose', 'Energy Corridor', 'Medical Center', 
                     'Katy', 'Cypress', 'Sugar Land', 'The Woodlands', 'Clear Lake'],
@@ -1,4 +1,6 @@
 # Create supply and construction data based on the research findings
+import pandas as pd
+
 construction_data = {
     'Year': [2020, 2021, 2022, 2023, 2024, 2025],
     'Units_Under_Construction': [32100, 28500, 25400, 20300, 16700, 13700],
@@ -1,4 +1,6 @@
 # Create comprehensive housing affordability data for visualization
+import pandas as pd
+
 housing_affordability_data = {
     'Housing Metric': [
         'Cost-Burdened Renters (>30% income)',
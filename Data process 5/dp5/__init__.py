@@ -0,0 +1,14 @@
+"""Data Process 5 pipeline tooling.
+
+Runs the topic scripts under ``Data process 5/`` as one dependency-aware build.
+Invoke from the ``Data process 5`` folder::
+
+    python -m dp5 graph
+    python -m dp5 run --jobs 8
+"""
+from pathlib import Path
+
+DATA_ROOT = Path(__file__).resolve().parent.parent
+BUILD_DIR = DATA_ROOT / '.dp5'
+
+__all__ = ['DATA_ROOT', 'BUILD_DIR']
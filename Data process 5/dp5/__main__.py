@@ -0,0 +1,426 @@
+"""Command line entry point: ``python -m dp5 <command>``."""
+from __future__ import annotations
+
+import argparse
+import functools
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+from . import DATA_ROOT
+from .graph import build_graph, critical_path, discover, topo_order
+from .manifest import Manifest
+from .render import RenderService, serve
+from .render_cache import RenderCache
+from .runner import incremental, run_graph, run_script
+from .stages import STAGES, run_stages
+from .warm import WarmPool
+
+
+def cmd_graph(args) -> int:
+    scripts = discover()
+    deps = build_graph(scripts)
+    for script in topo_order(deps):
+        needed = ', '.join(sorted(d.key for d in deps[script])) or '-'
+        print(f'{script.key}\n    <- {needed}')
+    length, chain = critical_path(deps, {s: 1.0 for s in scripts})
+    print(f'\n{len(scripts)} scripts, {sum(map(len, deps.values()))} edges, '
+          f'longest chain {int(length)} scripts:')
+    for script in chain:
+        print(f'  {script.key}')
+    return 0
+
+
+def cmd_run(args) -> int:
+    scripts = discover()
+    deps = build_graph(scripts)
+
+    def report(result):
+        print(f'[{result.status:>7}] {result.seconds:6.2f}s  {result.script.key}', flush=True)
+
+    start = time.perf_counter()
+    service = None
+    if args.render_workers > 0:
+        cache = RenderCache(max_bytes=args.render_cache_mb * 1024 * 1024) if args.render_cache_mb > 0 else None
+        service = RenderService(workers=args.render_workers, cache=cache)
+    render_env = serve(service) if service is not None else None
+    columnar = not args.no_columnar and columnar_available()
+    profile_dir = None
+    if args.profile:
+        from .profiling import PROFILE_DIR
+        shutil.rmtree(PROFILE_DIR, ignore_errors=True)
+        profile_dir = PROFILE_DIR
+    warm = None
+    if args.warm:
+        warm = WarmPool(args.jobs or min(os.cpu_count() or 1, len({s.folder for s in scripts})),
+                        render_env, columnar, profile_dir)
+        base = warm.execute
+    else:
+        base = functools.partial(run_script, render_env=render_env, columnar=columnar, profile_dir=profile_dir)
+    manifest = Manifest()
+    execute = incremental(manifest, deps, base, force=args.force)
+    try:
+        try:
+            results = run_graph(deps, jobs=args.jobs, execute=execute, on_result=report)
+        finally:
+            manifest.save()
+            if warm is not None:
+                warm.close()
+        return _run_summary(args, deps, results, time.perf_counter() - start, warm, service, profile_dir)
+    finally:
+        if service is not None:
+            service.close()
+
+
+def _run_summary(args, deps, results, wall: float, warm, service, profile_dir) -> int:
+    """Report a ``run`` and, when every script succeeded, run the post-build stages;
+    the ``charts`` stage renders through the run's service, with its pool and cache."""
+
+    durations = {r.script: r.seconds for r in results}
+    chain_seconds, _ = critical_path(deps, durations)
+    failed = [r for r in results if r.status == 'failed']
+    skipped = [r for r in results if r.status == 'skipped']
+    cached = [r for r in results if r.status == 'cached']
+    print(f'\n{len(results)} scripts in {wall:.2f}s wall '
+          f'({sum(durations.values()):.2f}s serial, {chain_seconds:.2f}s critical path); '
+          f'{len(cached)} up to date, {len(failed)} failed, {len(skipped)} skipped')
+    if warm is not None and warm.startups:
+        print(f'interpreter start-up paid {len(warm.startups)}x, '
+              f'{sum(warm.startups) / len(warm.startups):.2f}s each')
+    if profile_dir is not None:
+        print_profile(profile_dir)
+    for result in failed:
+        print(f'  FAILED {result.script.key} (log: {result.log})')
+    if not failed and not args.no_stages:
+        charts = {'service': service} if service is not None else {'cache': args.render_cache_mb > 0}
+        run_stages(on_result=report_stage, options={'charts': charts})
+    if service is not None:
+        print_render_stats(service.stats())
+    return 1 if failed else 0
+
+
+def print_profile(profile_dir, top: int = 15):
+    from .profiling import by_topic, format_table, load_summaries, write_summary
+    summaries = sorted(load_summaries(profile_dir), key=lambda s: -s['wall'])
+    if not summaries:
+        print('\nno scripts were profiled (all up to date?); use --force to profile every script')
+        return
+    print(f'\nslowest scripts (of {len(summaries)} profiled):')
+    print(format_table(summaries[:top], 'script'))
+    print('\nby topic folder:')
+    print(format_table(by_topic(summaries), 'topic'))
+    print(f'\nprofiles, collapsed stacks and {write_summary(profile_dir).name} in {profile_dir}')
+
+
+def report_stage(entry):
+    name, seconds, result = entry
+    size = f', {len(result)} outputs' if hasattr(result, '__len__') else ''
+    print(f'[  stage] {seconds:6.2f}s  {name}{size}', flush=True)
+
+
+def cmd_charts(args) -> int:
+    from .chartspec import VARIANTS_DIR, SpecError, build_all, load_specs, render_all, write_manifest
+    start = time.perf_counter()
+    try:
+        charts = build_all(load_specs(match=args.match))
+    except SpecError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    built = time.perf_counter() - start
+    if args.dry_run:
+        for chart in charts:
+            print(f'[  built] {chart.key}')
+        print(f'\n{len(charts)} charts built in {built:.2f}s')
+        return 0
+    if args.interactive:
+        from .interactive import EXPORT_DIR, export_interactive
+        out_dir = args.out or EXPORT_DIR
+        files = export_interactive(charts, out_dir, merge=args.match is not None)
+        sizes = [path.stat().st_size for path in files]
+        for chart, size in zip(charts, sizes):
+            print(f'[ export] {size / 1e3:6.1f} kB  {chart.key}')
+        print(f'\n{len(files)} charts exported to {out_dir} in {time.perf_counter() - start:.2f}s '
+              f'({built:.2f}s building figures), {sum(sizes) / 1e3:.1f} kB of figure JSON')
+        return 0
+
+    failed, rendered = [], []
+
+    def report(chart, results):
+        if isinstance(results, Exception):
+            failed.append(chart)
+            print(f'[ failed] {chart.key}: {results}', flush=True)
+            return
+        rendered.append(chart)
+        status = 'cached' if all(r.cached for r in results) else 'ok'
+        print(f'[{status:>7}] {results[0].queued:6.2f}s  {chart.key} ({len(results)} images)', flush=True)
+
+    variants_dir = None if args.no_variants else VARIANTS_DIR
+    cache = None if args.no_cache else RenderCache()
+    with RenderService(workers=args.render_workers, cache=cache) as service:
+        render_all(charts, service, on_result=report, variants_dir=variants_dir)
+        stats = service.stats()
+    print(f'\n{len(charts)} charts in {time.perf_counter() - start:.2f}s wall '
+          f'({built:.2f}s building figures); {len(failed)} failed')
+    if variants_dir is not None and rendered:
+        print(f'variants and manifest in {write_manifest(rendered, merge=args.match is not None).parent}')
+    print_render_stats(stats)
+    return 1 if failed else 0
+
+
+def cmd_stage(args) -> int:
+    unknown = [name for name in args.names if name not in STAGES]
+    if unknown:
+        print(f'unknown stage(s): {", ".join(unknown)}; available: {", ".join(STAGES)}', file=sys.stderr)
+        return 2
+    run_stages(args.names or None, on_result=report_stage)
+    return 0
+
+
+def cmd_schemas(args) -> int:
+    from .columnar import SCHEMA_PATH, check_registry, update_registry
+    if args.update:
+        changed = update_registry()
+        for name in changed:
+            print(f'declared {name}')
+        print(f'{len(changed)} schema(s) written to {SCHEMA_PATH}; review them before committing')
+        return 0
+    problems = check_registry()
+    for name, problem in sorted(problems.items()):
+        print(f'{name}: {problem}')
+    if problems:
+        print(f'\n{len(problems)} dataset(s) do not match {SCHEMA_PATH.name}; '
+              'run `python -m dp5 schemas --update`', file=sys.stderr)
+        return 1
+    print(f'all datasets match {SCHEMA_PATH.name}')
+    return 0
+
+
+def cmd_sql(args) -> int:
+    import pandas as pd
+    from .warehouse import Warehouse
+    with Warehouse() as warehouse:
+        if args.zip:
+            found = warehouse.zip_profile(args.zip)
+        else:
+            found = {'result': warehouse.query(args.query or 'SELECT * FROM _datasets ORDER BY name')}
+    with pd.option_context('display.width', 200, 'display.max_columns', 20, 'display.max_rows', 200):
+        for name, rows in found.items():
+            print(f'== {name} ({len(rows)} rows)\n{rows.to_string(index=False)}\n')
+    return 0
+
+
+def cmd_strsim(args) -> int:
+    import pandas as pd
+    from .strsim import load_market, revenue_percentiles, simulate
+    market = load_market()
+    start = time.perf_counter()
+    revenue = simulate(market, args.draws, args.seed, args.workers)
+    elapsed = time.perf_counter() - start
+    with pd.option_context('display.width', 200, 'display.max_columns', 20):
+        print(revenue_percentiles(market, revenue).round(0).to_string(index=False))
+    print(f'\n{revenue.size:,} draws in {elapsed:.2f}s ({args.workers} worker(s)), '
+          f'net of the ${market.fee:,.0f} registration fee')
+    return 0
+
+
+def cmd_sweep(args) -> int:
+    import pandas as pd
+    from .columnar import available
+    from .sweep import SWEEP_DIR, grid, parse_axis, run_sweep
+    if not args.no_write and not available():
+        print('writing the scenario rows needs pyarrow: pip install pyarrow, or pass --no-write', file=sys.stderr)
+        return 2
+    parameters = grid(**{name: parse_axis(getattr(args, name))
+                         for name in ('fertility', 'mortality', 'international', 'domestic')})
+    out = None if args.no_write else (args.out or SWEEP_DIR / 'scenarios.parquet')
+    start = time.perf_counter()
+    fan = run_sweep(parameters, years=args.years, workers=args.workers, out=out, summary=args.summary)
+    elapsed = time.perf_counter() - start
+    if fan is not None:
+        SWEEP_DIR.mkdir(parents=True, exist_ok=True)
+        fan.to_csv(SWEEP_DIR / 'fan_chart.csv', index=False, float_format='%.4f')
+        shown = fan[(fan['county'] == args.county) & (fan['measure'] == 'population')]
+        with pd.option_context('display.width', 200, 'display.max_columns', 20):
+            print(shown.drop(columns=['county', 'measure']).round(0).to_string(index=False))
+    print(f'\n{len(parameters):,} scenarios in {elapsed:.2f}s ({args.workers} worker(s))'
+          + (f', rows in {out}' if out is not None else '')
+          + (f', fan chart in {SWEEP_DIR / "fan_chart.csv"}' if fan is not None else ''))
+    return 0
+
+
+def cmd_load(args) -> int:
+    from .dbload import MODELS, create_sqlite_schema, default_url, load_all, sqlite_path
+    url = args.database_url or default_url()
+    if not url:
+        print('no database: pass --database-url or set DATABASE_URL', file=sys.stderr)
+        return 2
+    unknown = [name for name in args.models if name not in MODELS]
+    if unknown:
+        print(f'unknown model(s): {", ".join(unknown)}; available: {", ".join(MODELS)}', file=sys.stderr)
+        return 2
+    if args.create_schema:
+        if not url.startswith('sqlite:'):
+            print('--create-schema only applies to SQLite; run prisma migrate for Postgres', file=sys.stderr)
+            return 2
+        create_sqlite_schema(sqlite_path(url))
+
+    def report(result):
+        print(f'[   load] {result.seconds:6.2f}s  {result.table}: {result.rows} rows '
+              f'({result.inserted} inserted, {result.updated} updated, {result.deleted} deleted, '
+              f'{result.unchanged} unchanged), {result.rows_per_second:,.0f} rows/s', flush=True)
+
+    results = load_all(url, args.models or None, batch_rows=args.batch_rows, on_result=report, full=args.full)
+    rows, seconds = sum(r.rows for r in results), sum(r.seconds for r in results)
+    print(f'\n{rows} rows into {len(results)} tables in {seconds:.2f}s')
+    return 0
+
+
+def cmd_bench(args) -> int:
+    from .bench import (BASELINE_PATH, SUITES, compare, environment, format_report, load_baseline,
+                        run_benchmarks, save_baseline)
+    unknown = [name for name in args.suites if name not in SUITES]
+    if unknown:
+        print(f'unknown suite(s): {", ".join(unknown)}; available: {", ".join(SUITES)}', file=sys.stderr)
+        return 2
+    path = args.baseline or BASELINE_PATH
+    baseline = load_baseline(path)
+
+    def report(m):
+        if m.error is not None:
+            print(f'[ failed] {m.id}: {m.error}', flush=True)
+        else:
+            print(f'[  bench] {m.median:8.3f}s  {m.id}  (min {min(m.runs):.3f}s of {len(m.runs)})', flush=True)
+
+    measurements = run_benchmarks(args.suites or SUITES, repeat=args.repeat, match=args.match,
+                                  on_measurement=report)
+    recorded = baseline.get('environment', {})
+    current = environment()
+    if recorded and any(recorded.get(k) != current[k] for k in ('machine', 'cpus', 'python')):
+        print(f'\nnote: the baseline was recorded on {recorded.get("platform")} '
+              f'({recorded.get("cpus")} CPUs, Python {recorded.get("python")})')
+    comparisons = compare(measurements, baseline, threshold=args.threshold)
+    print('\n' + format_report(comparisons))
+    if args.save:
+        save_baseline(measurements, path)
+        print(f'baseline written to {path}')
+        return 0
+    return 1 if any(c.status in ('regressed', 'over budget') for c in comparisons) else 0
+
+
+def columnar_available() -> bool:
+    import importlib.util
+    return importlib.util.find_spec('pyarrow') is not None
+
+
+def print_render_stats(stats: dict):
+    cache = stats.get('cache')
+    if cache and cache['hits'] + cache['misses']:
+        print(f'render cache: {cache["hits"]} hits, {cache["misses"]} misses, {cache["evictions"]} evicted, '
+              f'{cache["bytes"] / 1e6:.1f}/{cache["max_bytes"] / 1e6:.0f} MB')
+    if not stats.get('renders'):
+        return
+    cold = stats['cold_start_mean']
+    cold_note = f', worker start-up {cold:.2f}s x{stats["workers_started"]}' if cold is not None else ''
+    print(f'{stats["renders"]} charts rendered: mean {stats["render_mean"]:.3f}s, '
+          f'p50 {stats["render_p50"]:.3f}s, p95 {stats["render_p95"]:.3f}s{cold_note}')
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m dp5', description=f'Data Process 5 pipeline ({DATA_ROOT})')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('graph', help='show discovered scripts and their dependencies')
+    p.set_defaults(func=cmd_graph)
+
+    p = sub.add_parser('run', help='run every script, independent ones in parallel')
+    p.add_argument('-j', '--jobs', type=int, default=None, help='concurrent scripts (default: CPU count)')
+    p.add_argument('--force', action='store_true', help='ignore the build manifest and re-run everything')
+    p.add_argument('--render-workers', type=int, default=2,
+                   help='warm Kaleido workers shared by the charts stage and scripts that write images '
+                        '(0: each starts its own)')
+    p.add_argument('--warm', action='store_true',
+                   help='run scripts in pre-imported worker interpreters; data builders of a folder share a namespace')
+    p.add_argument('--render-cache-mb', type=int, default=256,
+                   help='size cap of the rendered-image cache (0 disables it)')
+    p.add_argument('--no-stages', action='store_true', help='do not run the post-build stages')
+    p.add_argument('--profile', action='store_true',
+                   help='profile every script (cProfile + tracemalloc) into .dp5/profile/; slows scripts down')
+    p.add_argument('--no-columnar', action='store_true',
+                   help='do not write or read Parquet/Arrow twins of the CSVs (default when pyarrow is missing)')
+    p.set_defaults(func=cmd_run)
+
+    p = sub.add_parser('charts', help='build every chart from its spec and render them in one batch')
+    p.add_argument('--match', help='only charts whose output path contains this text')
+    p.add_argument('--render-workers', type=int, default=2, help='Kaleido workers rendering the batch')
+    p.add_argument('--no-cache', action='store_true', help='render every chart, even when the image is cached')
+    p.add_argument('--no-variants', action='store_true',
+                   help='render only the images named in the specs, not the 1x/2x PNG, WebP and SVG variants')
+    p.add_argument('--dry-run', action='store_true', help='build and check the figures without rendering')
+    p.add_argument('--interactive', action='store_true',
+                   help='export compact figure JSON and the shared plotly.js for the site instead of rendering')
+    p.add_argument('--out', type=Path, help='directory of the --interactive export (default: derived/interactive)')
+    p.set_defaults(func=cmd_charts)
+
+    p = sub.add_parser('stage', help='run post-build stages on the current outputs')
+    p.add_argument('names', nargs='*', help=f'stages to run: {", ".join(STAGES)} (default: all)')
+    p.set_defaults(func=cmd_stage)
+
+    p = sub.add_parser('schemas', help='check the datasets against the declared column schemas')
+    p.add_argument('--update', action='store_true', help='declare schemas for new or changed datasets')
+    p.set_defaults(func=cmd_schemas)
+
+    p = sub.add_parser('sql', help='query the warehouse built by the warehouse stage')
+    p.add_argument('query', nargs='?', help='SQL to run (default: list the tables)')
+    p.add_argument('--zip', help='show every table\'s rows for a zip code and its neighborhoods')
+    p.set_defaults(func=cmd_sql)
+
+    p = sub.add_parser('strsim', help='simulate short-term rental revenue by neighborhood')
+    p.add_argument('--draws', type=int, default=1_000_000, help='draws in total, across neighborhoods')
+    p.add_argument('--workers', type=int, default=1, help='processes to shard the draws across')
+    p.add_argument('--seed', type=int, default=2026, help='random seed; the result does not depend on --workers')
+    p.set_defaults(func=cmd_strsim)
+
+    p = sub.add_parser('sweep', help='project a grid of population and migration scenarios across processes')
+    axis = 'multipliers as start:stop:count or a comma list'
+    p.add_argument('--international', default='0.5:1:11',
+                   help=f'international migration {axis} (default 0.5:1:11, i.e. -50%% to -0%%)')
+    p.add_argument('--domestic', default='0.5:1.5:11', help=f'domestic migration {axis} (default 0.5:1.5:11)')
+    p.add_argument('--fertility', default='1', help=f'fertility {axis} (default 1)')
+    p.add_argument('--mortality', default='1', help=f'mortality {axis} (default 1)')
+    p.add_argument('--years', type=int, default=30, help='years projected from the base year')
+    p.add_argument('--workers', type=int, default=1, help='processes to run the scenario chunks in')
+    p.add_argument('--out', type=Path, help='Parquet file for every scenario row (default: derived/sweep/scenarios.parquet)')
+    p.add_argument('--no-write', action='store_true', help='do not write the scenario rows')
+    p.add_argument('--summary', action='store_true',
+                   help='also write the percentiles across scenarios per county and year (fan_chart.csv)')
+    p.add_argument('--county', default='Harris County', help='county whose fan chart is printed')
+    p.set_defaults(func=cmd_sweep)
+
+    p = sub.add_parser('load', help='bulk upsert the outputs into the Prisma database tables')
+    p.add_argument('models', nargs='*', help='models to load (default: all)')
+    p.add_argument('--database-url', help='postgresql://... or sqlite:///path (default: $DATABASE_URL)')
+    p.add_argument('--create-schema', action='store_true',
+                   help='create the tables from prisma/schema.prisma first (SQLite only)')
+    p.add_argument('--full', action='store_true',
+                   help='write every row, not only those changed since the last load (e.g. after a database reset)')
+    p.add_argument('--batch-rows', type=int, default=500, help='rows per INSERT statement on SQLite')
+    p.set_defaults(func=cmd_load)
+
+    p = sub.add_parser('bench', help='time scripts, renders, loads and stages against the saved baseline')
+    p.add_argument('suites', nargs='*', help='suites to run: build, render, load, stage, db, startup, model (default: all)')
+    p.add_argument('--repeat', type=int, default=3, help='timed runs per benchmark and variant')
+    p.add_argument('--match', help='only benchmarks whose name contains this text')
+    p.add_argument('--threshold', type=float, default=0.25,
+                   help='relative slow-down reported as a regression (default 0.25 = 25%%)')
+    p.add_argument('--baseline', type=Path, help='baseline file (default: dp5/benchmarks.json)')
+    p.add_argument('--save', action='store_true', help='record the results as the new baseline')
+    p.set_defaults(func=cmd_bench)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
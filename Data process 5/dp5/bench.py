@@ -0,0 +1,480 @@
+"""Benchmarks of each piece of the pipeline, compared with a checked-in baseline.
+
+Every benchmark is timed ``repeat`` times in two variants:
+
+- ``cold``: what a fresh process pays, interpreter start-up and imports included
+  (a script run by hand, a render pool starting its browsers, a first read, a
+  load into an empty database);
+- ``warm``: the same work in a process that has already done it once (a warm
+  worker interpreter and render pool, repeated reads, a re-load of unchanged rows).
+
+Suites:
+
+======= ==========================================================
+build   every data script (``build/<script key>``)
+render  building every chart spec's figures (``render/build``) and rendering
+        them in one batch, uncached (``render/charts``)
+load    reading all datasets as CSV, Parquet and Arrow (``load/<format>``)
+stage   the ``typed``, ``facts`` and ``warehouse`` stages (``stage/<name>``)
+db      ``dp5.dbload`` into a scratch SQLite database (``db/load``)
+startup ``dp5.charts`` imports and a first figure (``startup/charts``, cold only)
+model   the analytics engines on synthetic inputs of production scale
+        (``model/<name>``, warm only)
+======= ==========================================================
+
+The median of each benchmark is saved to ``benchmarks.json`` next to this
+module; ``compare`` flags the ones that got slower than the baseline by more
+than a relative threshold (and an absolute floor, so millisecond jitter is not
+a regression). Benchmarks in ``BUDGETS`` must also stay under a fixed number of
+seconds whatever the baseline says.
+"""
+from __future__ import annotations
+
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from . import DATA_ROOT
+from .graph import Script, discover
+
+BASELINE_PATH = Path(__file__).with_name('benchmarks.json')
+SUITES = ('build', 'render', 'load', 'stage', 'db', 'startup', 'model')
+LOAD_FORMATS = ('csv', 'parquet', 'arrow')
+# Stages that are pure functions of the datasets; ``columnar`` is a no-op when
+# the twins are fresh and ``changes`` would advance its own state.
+BENCH_STAGES = ('typed', 'facts', 'warehouse')
+
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 0.25  # slower than baseline by more than 25%
+MIN_DELTA = 0.02  # seconds; smaller differences are never a regression
+
+# Hard limits in seconds, checked on every run
+BUDGETS = {'startup/charts': 0.4, 'model/timeseries': 0.5, 'model/rentindex': 1.5, 'model/strsim': 1.0,
+           'model/strcalendar': 1.0, 'model/cohort': 0.5,
+           'model/sweep': 2.0, 'model/valuation': 1.0}
+
+
+class BenchError(RuntimeError):
+    """A benchmarked script or stage failed, so its timing means nothing."""
+
+
+@dataclass
+class Measurement:
+    name: str
+    variant: str
+    runs: list[float]
+    error: str | None = None  # set when the benchmarked work failed; ``runs`` is then empty
+
+    @property
+    def id(self) -> str:
+        return f'{self.name} [{self.variant}]'
+
+    @property
+    def median(self) -> float | None:
+        return statistics.median(self.runs) if self.runs else None
+
+    def summary(self) -> dict:
+        return {
+            'median': round(self.median, 4),
+            'min': round(min(self.runs), 4),
+            'mean': round(statistics.fmean(self.runs), 4),
+            'stdev': round(statistics.stdev(self.runs), 4) if len(self.runs) > 1 else 0.0,
+            'runs': len(self.runs),
+        }
+
+
+@dataclass
+class Comparison:
+    id: str
+    baseline: float | None
+    current: float | None
+    status: str  # regressed, over budget, improved, ok, new, failed
+
+    @property
+    def change(self) -> float | None:
+        if not self.baseline or self.current is None:
+            return None
+        return self.current / self.baseline - 1
+
+
+def _time(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def _check(result):
+    if result.status != 'ok':
+        raise BenchError(f'{result.script.key} failed (log: {result.log})')
+    return result.seconds
+
+
+def _measure(name: str, variant: str, runs) -> Measurement:
+    """Measurement from ``runs()``, or one recording why it failed."""
+    try:
+        return Measurement(name, variant, runs())
+    except BenchError as exc:
+        return Measurement(name, variant, [], str(exc))
+
+
+# -- suites ----------------------------------------------------------------
+
+def _wanted(name: str, match: str | None) -> bool:
+    return match is None or match in name
+
+
+def _scripts(match: str | None) -> list[Script]:
+    return [s for s in sorted(discover(), key=lambda s: s.key)
+            if s.kind == 'data' and _wanted(f'build/{s.key}', match)]
+
+
+def bench_scripts(repeat: int, match: str | None = None):
+    """Data scripts, cold and in a warm worker."""
+    from .columnar import available
+    from .runner import run_script
+    from .warm import WarmPool
+    scripts = _scripts(match)
+    if not scripts:
+        return
+    columnar = available()  # as `run` does
+    pool = WarmPool(1, None, columnar)
+    try:
+        for script in scripts:
+            name = f'build/{script.key}'
+            yield _measure(name, 'cold', lambda: [_check(run_script(script, columnar=columnar))
+                                                  for _ in range(repeat)])
+            # the first warm run pays lazy imports
+            yield _measure(name, 'warm', lambda: [_check(pool.execute(script))
+                                                  for _ in range(repeat + 1)][1:])
+    finally:
+        pool.close()
+
+
+def bench_render(repeat: int, match: str | None = None):
+    """The ``charts`` stage in two parts: building the figures from every spec,
+    and rendering them with their variants in one batch into a scratch
+    directory, without the render cache. Cold rendering starts a new pool,
+    browsers included."""
+    import dataclasses
+    from .chartspec import RENDER_WORKERS, build_all, load_specs, render_all
+    from .render import RenderService
+    if _wanted('render/build', match):
+        code = ('import time; t = time.perf_counter(); from dp5.chartspec import build_all, load_specs; '
+                'build_all(load_specs()); print(time.perf_counter() - t)')
+        yield _measure('render/build', 'cold', lambda: [_cold(code) for _ in range(repeat)])
+        yield Measurement('render/build', 'warm', [_time(lambda: build_all(load_specs()))
+                                                   for _ in range(repeat + 1)][1:])
+    if not _wanted('render/charts', match):
+        return
+    scratch = Path(tempfile.mkdtemp(prefix='dp5-bench-'))
+    charts = [dataclasses.replace(c, path=scratch / f'{i}{c.path.suffix}')
+              for i, c in enumerate(build_all(load_specs()))]
+
+    def batch(service) -> float:
+        start = time.perf_counter()
+        results = render_all(charts, service, variants_dir=scratch / 'variants')
+        failed = [c.key for c, r in zip(charts, results) if isinstance(r, Exception)]
+        if failed:
+            raise BenchError(f'{len(failed)} chart(s) failed to render, first {failed[0]}')
+        return time.perf_counter() - start
+
+    def cold() -> float:
+        with RenderService(workers=RENDER_WORKERS, cache=None) as service:
+            return batch(service)
+
+    service = RenderService(workers=RENDER_WORKERS, cache=None)
+    try:
+        yield _measure('render/charts', 'cold', lambda: [cold() for _ in range(repeat)])
+        yield _measure('render/charts', 'warm', lambda: [batch(service) for _ in range(repeat + 1)][1:])
+    finally:
+        service.close()
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def time_load(fmt: str) -> float:
+    """Seconds to read every dataset into DataFrames from one format."""
+    import pandas as pd
+    from .columnar import twin_paths
+    from .datasets import discover_datasets
+    datasets = discover_datasets()
+    if fmt == 'csv':
+        return _time(lambda: [pd.read_csv(d.path) for d in datasets.values()])
+    paths = [twin_paths(name)[0 if fmt == 'parquet' else 1] for name in datasets]
+    missing = [p.name for p in paths if not p.exists()]
+    if missing:
+        raise BenchError(f'no {fmt} twins for {", ".join(missing)}; run `python -m dp5 stage columnar`')
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    def read_arrow(path):
+        with pa.memory_map(str(path)) as source:
+            return pa.ipc.open_file(source).read_all().to_pandas()
+
+    read = (lambda p: pq.read_table(p).to_pandas()) if fmt == 'parquet' else read_arrow
+    return _time(lambda: [read(p) for p in paths])
+
+
+def _cold(code: str) -> float:
+    """Run ``code`` in a new interpreter; it must print one number of seconds."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(DATA_ROOT), os.environ.get('PYTHONPATH')])))
+    proc = subprocess.run([sys.executable, '-c', code], cwd=DATA_ROOT, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise BenchError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else 'benchmark process failed')
+    return float(proc.stdout.split()[-1])
+
+
+def bench_load(repeat: int, match: str | None = None):
+    for fmt in LOAD_FORMATS:
+        if not _wanted(f'load/{fmt}', match):
+            continue
+        # cold: a new process with pandas imported; the first read pays the reader's imports
+        code = f'import pandas; from dp5.bench import time_load; print(time_load({fmt!r}))'
+        yield _measure(f'load/{fmt}', 'cold', lambda: [_cold(code) for _ in range(repeat)])
+        yield _measure(f'load/{fmt}', 'warm', lambda: [time_load(fmt) for _ in range(repeat + 1)][1:])
+
+
+def bench_stages(repeat: int, match: str | None = None):
+    from .stages import load_stage
+    for name in BENCH_STAGES:
+        if not _wanted(f'stage/{name}', match):
+            continue
+        code = (f'import time; t = time.perf_counter(); from dp5.stages import load_stage; '
+                f'load_stage({name!r})(); print(time.perf_counter() - t)')
+        yield _measure(f'stage/{name}', 'cold', lambda: [_cold(code) for _ in range(repeat)])
+        stage = load_stage(name)
+        yield _measure(f'stage/{name}', 'warm', lambda: [_time(stage) for _ in range(repeat + 1)][1:])
+
+
+def bench_db(repeat: int, match: str | None = None):
+    """Full load into an empty database (cold) and re-load of unchanged rows (warm)."""
+    from .dbload import _state_dir, create_sqlite_schema, load_all
+    if not _wanted('db/load', match):
+        return
+    scratch = Path(tempfile.mkdtemp(prefix='dp5-bench-'))
+    url = f'sqlite:///{scratch / "bench.sqlite"}'
+    try:
+        def fresh():
+            (scratch / 'bench.sqlite').unlink(missing_ok=True)
+            shutil.rmtree(_state_dir(url), ignore_errors=True)
+            create_sqlite_schema(scratch / 'bench.sqlite')
+            return _time(lambda: load_all(url))
+
+        yield Measurement('db/load', 'cold', [fresh() for _ in range(repeat)])
+        yield Measurement('db/load', 'warm', [_time(lambda: load_all(url)) for _ in range(repeat)])
+    finally:
+        shutil.rmtree(_state_dir(url), ignore_errors=True)
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def bench_startup(repeat: int, match: str | None = None):
+    """What a script building figures by hand pays before its own work:
+    ``dp5.charts``, plotly and the first figure, in a new interpreter. ``px``
+    must stay unimported."""
+    if not _wanted('startup/charts', match):
+        return
+    code = ('import sys, time; t = time.perf_counter(); from dp5.charts import go; '
+            'go.Figure(go.Bar(x=[0], y=[0])); elapsed = time.perf_counter() - t; '
+            'assert "plotly.express" not in sys.modules, "dp5.charts imported plotly.express"; '
+            'print(elapsed)')
+    yield _measure('startup/charts', 'cold', lambda: [_cold(code) for _ in range(repeat)])
+
+
+def _rent_panel_rows(series: int = 5000, months: int = 120, seed: int = 0):
+    """Long rows of monthly rent and occupancy for ``series`` series, 2% missing."""
+    import numpy as np
+    import pandas as pd
+    rng = np.random.default_rng(seed)
+    n = series * months
+    index = np.arange(series)
+    rows = pd.DataFrame({
+        'level': np.repeat(np.select([index == 0, index < 50], ['citywide', 'submarket'], 'zip'), months),
+        'name': np.repeat(index.astype(str), months),
+        'month': np.tile(pd.period_range('2016-01', periods=months, freq='M').astype(str), series),
+        'rent': 1500 + rng.normal(0, 20, n).cumsum() % 500,
+        'occupancy': rng.uniform(85, 95, n),
+    })
+    rows.loc[rng.random(n) < 0.02, 'rent'] = np.nan
+    return rows
+
+
+def _rent_observations(rows: int = 900_000, zips: int = 150, months: int = 24, seed: int = 0):
+    """Raw listing rows as an export would have them: text bedrooms and dates."""
+    import numpy as np
+    import pandas as pd
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(end='2025-07-31', periods=months * 30, freq='D').astype(str)
+    return pd.DataFrame({
+        'zip_code': rng.choice(np.arange(77001, 77001 + zips).astype(str), rows),
+        'beds': rng.choice(np.array(['Studio', '1', '2 bd', '3-Bedroom', '4', 'n/a']), rows),
+        'date': rng.choice(dates, rows),
+        'rent': rng.lognormal(7.3, 0.35, rows).round(),
+    })
+
+
+def bench_model(repeat: int, match: str | None = None):
+    """In-process throughput of the analytics engines; the inputs are built once
+    and only the engine's own work is timed."""
+    if _wanted('model/timeseries', match):
+        from .timeseries import Panel
+        rows = _rent_panel_rows()
+
+        def timeseries():
+            panel = Panel.from_long(rows, ['rent', 'occupancy'])
+            panel.derive()
+            panel.resample('Q')
+        yield Measurement('model/timeseries', 'warm', [_time(timeseries) for _ in range(repeat + 1)][1:])
+    if _wanted('model/rentindex', match):
+        from .rentindex import normalize_observations, rent_index
+        raw = _rent_observations()
+        yield Measurement('model/rentindex', 'warm',
+                          [_time(lambda: rent_index(normalize_observations(raw))) for _ in range(repeat + 1)][1:])
+    if _wanted('model/strsim', match):
+        from .strsim import DEFAULT_DRAWS, load_market, revenue_percentiles, simulate
+        market = load_market()
+
+        def strsim():
+            revenue_percentiles(market, simulate(market, DEFAULT_DRAWS))
+        yield Measurement('model/strsim', 'warm', [_time(strsim) for _ in range(repeat + 1)][1:])
+    if _wanted('model/strcalendar', match):
+        from .strcalendar import monthly_summary, simulate_calendar
+        from .strsim import load_market
+        market = load_market()
+
+        def strcalendar():  # every listing of the largest provider count, one year
+            monthly_summary(simulate_calendar(market))
+        yield Measurement('model/strcalendar', 'warm', [_time(strcalendar) for _ in range(repeat + 1)][1:])
+    if _wanted('model/cohort', match):
+        from itertools import product
+        from .cohort import Scenario, load_regions, project, projection_frame
+        regions = load_regions()
+        levels = (0.5, 1.0, 1.5)
+        scenarios = [Scenario(f's{i}', *m) for i, m in enumerate(product(levels, repeat=4))]
+
+        def cohort():  # 81 scenarios x every county x 30 years
+            projection_frame(regions, scenarios, populations=project(regions, scenarios))
+        yield Measurement('model/cohort', 'warm', [_time(cohort) for _ in range(repeat + 1)][1:])
+    if _wanted('model/sweep', match):
+        from .cohort import load_regions
+        from .sweep import grid, parse_axis, run_sweep
+        regions = load_regions()
+        parameters = grid(international=parse_axis('0.5:1:11'), domestic=parse_axis('0.5:1.5:11'),
+                          fertility=parse_axis('0.9,1,1.1'), mortality=parse_axis('0.9,1,1.1'))
+
+        def sweep():  # 1,089 scenarios streamed to Parquet, with the fan chart
+            with tempfile.TemporaryDirectory() as tmp:
+                run_sweep(parameters, regions, out=Path(tmp) / 'scenarios.parquet')
+        yield Measurement('model/sweep', 'warm', [_time(sweep) for _ in range(repeat + 1)][1:])
+    if _wanted('model/valuation', match):
+        import numpy as np
+        from .valuation import load_market, sample_portfolio, scenario_grid, value
+        market = load_market()
+        portfolio = sample_portfolio(market, 1000)
+        scenarios = scenario_grid(rent_growth=np.linspace(-0.02, 0.02, 5), occupancy=np.linspace(-0.04, 0.02, 4),
+                                  exit_cap_spread=np.linspace(0, 0.01, 5))
+
+        def valuation():  # 1,000 properties x 100 scenarios, 10-year hold
+            value(market, portfolio, scenarios)
+        yield Measurement('model/valuation', 'warm', [_time(valuation) for _ in range(repeat + 1)][1:])
+
+
+def run_benchmarks(suites=SUITES, repeat: int = DEFAULT_REPEAT, match: str | None = None,
+                   on_measurement=None) -> list[Measurement]:
+    """Run the named suites; ``match`` keeps only benchmarks whose name contains it."""
+    runners = {
+        'build': lambda: bench_scripts(repeat, match),
+        'render': lambda: bench_render(repeat, match),
+        'load': lambda: bench_load(repeat, match),
+        'stage': lambda: bench_stages(repeat, match),
+        'db': lambda: bench_db(repeat, match),
+        'startup': lambda: bench_startup(repeat, match),
+        'model': lambda: bench_model(repeat, match),
+    }
+    measurements = []
+    for suite in suites:
+        for measurement in runners[suite]():
+            measurements.append(measurement)
+            if on_measurement is not None:
+                on_measurement(measurement)
+    return measurements
+
+
+# -- baselines -------------------------------------------------------------
+
+def environment() -> dict:
+    import pandas as pd
+    return {
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict:
+    if not path.exists():
+        return {'environment': {}, 'results': {}}
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def save_baseline(measurements: list[Measurement], path: Path = BASELINE_PATH) -> dict:
+    """Record ``measurements`` in the baseline, keeping entries that were not re-run."""
+    baseline = load_baseline(path)
+    baseline['environment'] = environment()
+    baseline['updated'] = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    baseline['results'].update({m.id: m.summary() for m in measurements if m.error is None})
+    baseline['results'] = dict(sorted(baseline['results'].items()))
+    path.write_text(json.dumps(baseline, indent=2) + '\n', encoding='utf-8')
+    return baseline
+
+
+def compare(measurements: list[Measurement], baseline: dict, threshold: float = DEFAULT_THRESHOLD,
+            min_delta: float = MIN_DELTA) -> list[Comparison]:
+    """Each measurement against its baseline median; ``regressed`` when slower by
+    more than ``threshold`` (relative) and ``min_delta`` seconds, ``over budget``
+    when above its entry in ``BUDGETS``."""
+    results = baseline.get('results', {})
+    out = []
+    for m in measurements:
+        before = results.get(m.id, {}).get('median')
+        budget = BUDGETS.get(m.name)
+        if m.error is not None:
+            status = 'failed'
+        elif budget is not None and m.median > budget:
+            status = 'over budget'
+        elif before is None:
+            status = 'new'
+        elif m.median - before > max(threshold * before, min_delta):
+            status = 'regressed'
+        elif before - m.median > max(threshold * before, min_delta):
+            status = 'improved'
+        else:
+            status = 'ok'
+        out.append(Comparison(m.id, before, m.median, status))
+    return out
+
+
+def format_report(comparisons: list[Comparison]) -> str:
+    width = max((len(c.id) for c in comparisons), default=10)
+    lines = [f'{"benchmark":<{width}}  {"baseline":>9}  {"current":>9}  {"change":>8}  status']
+    for c in comparisons:
+        before = f'{c.baseline:8.3f}s' if c.baseline is not None else '        -'
+        change = f'{c.change:+7.1%}' if c.change is not None else '       -'
+        current = f'{c.current:8.3f}s' if c.current is not None else '        -'
+        lines.append(f'{c.id:<{width}}  {before}  {current}  {change}  {c.status}')
+    regressed = [c for c in comparisons if c.status == 'regressed']
+    lines.append(f'\n{len(comparisons)} benchmarks, {len(regressed)} regressed, '
+                 f'{sum(c.status == "over budget" for c in comparisons)} over budget, '
+                 f'{sum(c.status == "improved" for c in comparisons)} improved, '
+                 f'{sum(c.status == "new" for c in comparisons)} without baseline, '
+                 f'{sum(c.status == "failed" for c in comparisons)} failed')
+    return '\n'.join(lines)
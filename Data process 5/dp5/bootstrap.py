@@ -0,0 +1,47 @@
+"""Run a topic script under the pipeline: ``python -m dp5.bootstrap script.py``.
+
+Behaves like ``python script.py`` from the script's folder, except that when
+the runner has started a render service, figure exports are sent to it, that
+with ``DP5_COLUMNAR`` set, CSV reads and writes go through the columnar twins
+(see ``dp5.columnar``), and that with ``DP5_PROFILE`` set the script is
+profiled into that directory (see ``dp5.profiling``).
+"""
+from __future__ import annotations
+
+import os
+import runpy
+import sys
+from pathlib import Path
+
+from . import DATA_ROOT
+from .runner import COLUMNAR_ENV, PROFILE_ENV
+
+
+def main(argv=None) -> None:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv:
+        raise SystemExit('usage: python -m dp5.bootstrap <script.py> [args...]')
+    script = Path(argv[0]).resolve()
+
+    from .render import RemoteRenderer, install
+    renderer = RemoteRenderer.from_env()
+    if renderer is not None:
+        install(renderer)
+
+    if os.environ.get(COLUMNAR_ENV):
+        from .columnar import install as install_columnar
+        install_columnar()
+
+    sys.argv = [str(script), *argv[1:]]
+    sys.path[0] = str(script.parent)
+    profile_dir = os.environ.get(PROFILE_ENV)
+    if profile_dir:
+        from .profiling import profile_call
+        profile_call(lambda: runpy.run_path(str(script), run_name='__main__'),
+                     script.relative_to(DATA_ROOT).as_posix(), Path(profile_dir))
+    else:
+        runpy.run_path(str(script), run_name='__main__')
+
+
+if __name__ == '__main__':
+    main()
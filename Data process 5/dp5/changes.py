@@ -0,0 +1,167 @@
+"""Row-level changesets between versions of a dataset.
+
+A refresh rewrites every CSV even when most rows did not change. Here each
+row is reduced to two 64-bit hashes, one of its key columns and one of the
+whole row, and a *snapshot* (those hashes plus the key values) is kept for the
+version a consumer last saw. Comparing a new frame with a snapshot is then an
+index lookup on the key hashes:
+
+- ``inserted``: key not in the snapshot;
+- ``updated``: key present, row hash different;
+- ``deleted``: key in the snapshot only (returned as its key values).
+
+The ``changes`` stage does this for every dataset against the previous build
+and writes ``derived/changes/<dataset>.csv`` (changed rows with a ``_change``
+column) for the datasets that changed. ``dp5.dbload`` keeps its own snapshots
+of what it last loaded, so a load only writes the changed rows.
+"""
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .datasets import DERIVED_DIR, Dataset, discover_datasets, read_dataset
+
+CHANGES_DIR = DERIVED_DIR / 'changes'
+
+# Key inference: the shortest unique prefix of the columns, up to this many
+MAX_KEY_COLUMNS = 3
+
+
+@dataclass
+class Changeset:
+    key: list[str]
+    inserted: pd.DataFrame
+    updated: pd.DataFrame
+    deleted: pd.DataFrame  # key columns of the removed rows, as stored in the snapshot
+    unchanged: int
+
+    def __len__(self) -> int:
+        return len(self.inserted) + len(self.updated) + len(self.deleted)
+
+    @property
+    def upserts(self) -> pd.DataFrame:
+        return pd.concat([self.inserted, self.updated])
+
+    def counts(self) -> dict[str, int]:
+        return {'inserted': len(self.inserted), 'updated': len(self.updated),
+                'deleted': len(self.deleted), 'unchanged': self.unchanged}
+
+    def to_frame(self) -> pd.DataFrame:
+        """All changed rows in one frame, ``_change`` naming what happened to each."""
+        parts = [part.assign(_change=change) for change, part in
+                 (('insert', self.inserted), ('update', self.updated), ('delete', self.deleted)) if len(part)]
+        if not parts:
+            return pd.DataFrame(columns=['_change', *self.inserted.columns])
+        out = pd.concat(parts, ignore_index=True)
+        return out[['_change', *[c for c in out.columns if c != '_change']]]
+
+
+def _hash(frame: pd.DataFrame) -> np.ndarray:
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy()
+
+
+def key_hashes(frame: pd.DataFrame, key: list[str]) -> np.ndarray:
+    """One hash per row of its key columns; repeated keys are told apart by occurrence."""
+    hashes = _hash(frame[key]) if len(frame) else np.empty(0, dtype=np.uint64)
+    occurrence = pd.Series(hashes).groupby(hashes).cumcount().to_numpy()
+    if occurrence.any():
+        hashes = _hash(pd.DataFrame({'key': hashes, 'occurrence': occurrence}))
+    return hashes
+
+
+def infer_key(frame: pd.DataFrame) -> list[str]:
+    """Shortest prefix of the columns that identifies every row (else the first column)."""
+    columns = [str(c) for c in frame.columns]
+    for width in range(1, min(MAX_KEY_COLUMNS, len(columns)) + 1):
+        if not frame.duplicated(subset=columns[:width]).any():
+            return columns[:width]
+    return columns[:1]
+
+
+def snapshot(frame: pd.DataFrame, key: list[str], keys: pd.DataFrame | None = None) -> pd.DataFrame:
+    """``_key`` and ``_row`` hashes (as int64) plus the key columns of every row;
+    ``keys`` holds the key values to use instead of ``frame[key]``."""
+    keys = frame[key] if keys is None else keys
+    out = pd.DataFrame({'_key': key_hashes(keys, key).view(np.int64),
+                        '_row': _hash(frame).view(np.int64)})
+    for column in key:
+        out[column] = keys[column].to_numpy()
+    return out
+
+
+def diff(previous: pd.DataFrame | None, frame: pd.DataFrame, key: list[str],
+         keys: pd.DataFrame | None = None) -> tuple[Changeset, pd.DataFrame]:
+    """Changes from ``previous`` (a snapshot, or ``None``) to ``frame``; also returns
+    the snapshot of ``frame``. A snapshot taken with another key counts as all deleted."""
+    current = snapshot(frame, key, keys)
+    if previous is None or list(previous.columns[2:]) != list(key):
+        gone = previous.drop(columns=['_key', '_row']) if previous is not None else pd.DataFrame(columns=key)
+        return Changeset(list(key), frame, frame.iloc[:0], gone, 0), current
+    old = pd.Index(previous['_key'].to_numpy())
+    position = old.get_indexer(current['_key'].to_numpy())
+    found = position >= 0
+    old_rows = previous['_row'].to_numpy()[np.where(found, position, 0)]
+    inserted = ~found
+    updated = found & (old_rows != current['_row'].to_numpy())
+    deleted = ~old.isin(current['_key'].to_numpy())
+    changeset = Changeset(
+        key=list(key),
+        inserted=frame[inserted],
+        updated=frame[updated],
+        deleted=previous.loc[deleted, list(key)],
+        unchanged=int((found & ~updated).sum()),
+    )
+    return changeset, current
+
+
+def read_snapshot(path: Path) -> pd.DataFrame | None:
+    if not path.exists():
+        return None
+    # Key values stay text: they are only written out (deleted rows), never re-hashed
+    return pd.read_csv(path, dtype=str, keep_default_na=False, na_values=['']).astype(
+        {'_key': np.int64, '_row': np.int64})
+
+
+def write_snapshot(current: pd.DataFrame, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    current.to_csv(path, index=False)
+
+
+def build_changes(datasets: dict[str, Dataset] | None = None, out_dir: Path = CHANGES_DIR) -> dict[str, dict]:
+    """Write a changeset for every dataset that changed since the previous run.
+
+    Returns, and writes to ``changes.json``, the counts of every dataset; a
+    dataset without changes has no changeset file.
+    """
+    datasets = datasets if datasets is not None else discover_datasets()
+    state_dir = out_dir / 'state'
+    summary = {}
+    for name, dataset in datasets.items():
+        frame = read_dataset(dataset)
+        changeset, current = diff(read_snapshot(state_dir / f'{name}.csv'), frame, infer_key(frame))
+        target = out_dir / f'{name}.csv'
+        if len(changeset):
+            out_dir.mkdir(parents=True, exist_ok=True)
+            changeset.to_frame().to_csv(target, index=False)
+        else:
+            target.unlink(missing_ok=True)
+        write_snapshot(current, state_dir / f'{name}.csv')
+        summary[name] = {'key': changeset.key, **changeset.counts()}
+    for path in sorted(state_dir.glob('*.csv')):
+        if path.stem in datasets:
+            continue
+        previous = read_snapshot(path)  # dataset no longer produced: every row is deleted
+        changeset = Changeset(list(previous.columns[2:]), previous.iloc[:0, 2:], previous.iloc[:0, 2:],
+                              previous.iloc[:, 2:], 0)
+        changeset.to_frame().to_csv(out_dir / path.name, index=False)
+        path.unlink()
+        summary[path.stem] = {'key': changeset.key, **changeset.counts()}
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / 'changes.json').write_text(json.dumps(summary, indent=2) + '\n', encoding='utf-8')
+    return {name: counts for name, counts in summary.items()
+            if counts['inserted'] or counts['updated'] or counts['deleted']}
@@ -0,0 +1,127 @@
+"""Shared chart pieces: brand palette and template, lazy plotly imports and
+vectorized label formatting.
+
+    from dp5.charts import PALETTE, go, thousands, truncate
+
+The chart specs (``dp5.chartspec``) use the palette, the template as plain
+JSON (``template_spec``) and the label helpers; the rest is for figures built
+by hand, in a notebook or a one-off script.
+
+``go``, ``px``, ``pio`` and ``make_subplots`` are imported on first use, so a
+script that never uses ``px`` does not pay for importing it (and pandas with
+it). The first of them a script touches also registers the ``dp5`` template,
+plotly's default with ``cliponaxis=False`` on bar and scatter traces, and makes
+it the default for every figure the script creates. It keeps plotly's colorway,
+so a trace without explicit colours looks as it did before the template; the
+palette is only used where a chart asks for it.
+
+Outside a notebook, plotly's optional IPython display hooks are marked
+unavailable before the first figure is built: ``plotly.tools`` otherwise
+imports all of IPython, most of a script's start-up time, for display code
+that never runs when a figure is only written to an image.
+
+The label helpers take a column or list and return a list of strings built
+with numpy string operations rather than a Python call per value.
+"""
+from __future__ import annotations
+
+import importlib
+import sys
+
+PALETTE = ('#1FB8CD', '#FFC185', '#ECEBD5', '#5D878F', '#D2BA4C', '#B4413C', '#964325')
+TEMPLATE = 'dp5'
+LABEL_WIDTH = 15  # longest category label before truncation
+
+# Horizontal legend centred above the plot, for charts with five or fewer entries
+LEGEND_TOP = dict(orientation='h', yanchor='bottom', y=1.05, xanchor='center', x=0.5)
+
+# Trace types whose markers and text labels may be drawn outside the plot area
+UNCLIPPED_TRACES = ('bar', 'scatter', 'funnel', 'waterfall')
+
+_LAZY = {'go': 'plotly.graph_objects', 'px': 'plotly.express', 'pio': 'plotly.io', 'make_subplots': 'plotly.subplots'}
+_NOTEBOOK_MODULES = ('IPython', 'IPython.core.display')
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    use_template()
+    module = importlib.import_module(_LAZY[name])
+    value = module.make_subplots if name == 'make_subplots' else module
+    globals()[name] = value
+    return value
+
+
+def template_spec() -> dict:
+    """``plotly``'s default template with unclipped traces, as plain JSON."""
+    import json
+    import pkgutil
+    spec = json.loads(pkgutil.get_data('plotly', 'package_data/templates/plotly.json'))
+    for trace in UNCLIPPED_TRACES:
+        spec['data'][trace] = [{**entry, 'cliponaxis': False} for entry in spec['data'].get(trace, [{}])]
+    return spec
+
+
+def brand_template():
+    """``template_spec`` as a ``go.layout.Template``.
+
+    It is built unvalidated, the way plotly builds its own bundled templates;
+    going through ``pio.templates`` (``'plotly+dp5'``) would deep-copy and
+    re-validate the whole template in every script.
+    """
+    from plotly.graph_objs.layout import Template
+    return Template(template_spec(), _validate=False)
+
+
+def use_template() -> None:
+    """Register the ``dp5`` template once per process and make it the default."""
+    import plotly.io as pio
+    if 'IPython' not in sys.modules:
+        from _plotly_utils import optional_imports
+        optional_imports._not_importable.update(_NOTEBOOK_MODULES)
+    if TEMPLATE not in pio.templates:
+        pio.templates._templates[TEMPLATE] = brand_template()  # already valid; skip the validating setter
+    pio.templates.default = TEMPLATE
+
+
+# -- labels ----------------------------------------------------------------
+
+def _array(values):
+    import numpy as np
+    return np.asarray(values, dtype=float)
+
+
+def _format(values, decimals: int, scale: float = 1.0, prefix: str = '', suffix: str = ''):
+    import numpy as np
+    text = np.char.mod(f'%.{decimals}f', _array(values) / scale)
+    return np.char.add(np.char.add(prefix, text), suffix)
+
+
+def truncate(labels, width: int = LABEL_WIDTH) -> list[str]:
+    """Category labels cut to ``width`` characters."""
+    import numpy as np
+    return np.asarray(labels, dtype=str).astype(f'<U{width}').tolist()
+
+
+def thousands(values, decimals: int = 0, prefix: str = '') -> list[str]:
+    """``48250`` -> ``'48k'`` (``'$48k'`` with ``prefix='$'``)."""
+    return _format(values, decimals, 1e3, prefix, 'k').tolist()
+
+
+def abbreviate(values, decimals: int = 1, prefix: str = '') -> list[str]:
+    """Numbers as ``1.2m``/``48.3k`` by magnitude; below a thousand they are kept
+    as they are."""
+    import numpy as np
+    array = _array(values)
+    size = np.abs(array)
+    plain = np.char.add(prefix, np.asarray(values).astype(str))
+    return np.where(size >= 1e6, _format(array, decimals, 1e6, prefix, 'm'),
+                    np.where(size >= 1e3, _format(array, decimals, 1e3, prefix, 'k'), plain)).tolist()
+
+
+def percent(values, decimals: int | None = None) -> list[str]:
+    """``'12.5%'`` labels; ``decimals=None`` keeps each value as written."""
+    import numpy as np
+    if decimals is None:
+        return np.char.add(np.asarray(values).astype(str), '%').tolist()
+    return _format(values, decimals, suffix='%').tolist()
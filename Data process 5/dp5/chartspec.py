@@ -0,0 +1,432 @@
+"""Declarative chart specs, built into figures and rendered in one batch.
+
+Each topic folder lists its charts in ``charts.json``, one spec per image::
+
+    {
+      "output": "houston_rent_growth.png",
+      "data": "houston_neighborhood_comparison.csv",
+      "sort": {"by": "YoY_Growth"},
+      "title": "YoY Houston Rent Growth 2024-25",
+      "labels": {"x": "Rent Growth (%)", "y": "Neighborhood"},
+      "traces": [{"type": "bar", "orientation": "h", "x": "YoY_Growth", "y": "Neighborhood",
+                  "text": {"template": "{YoY_Growth:percent:1}"}}]
+    }
+
+A spec has:
+
+- ``output``: the image, relative to the folder; its suffix picks the format.
+- ``data``: a CSV file in the folder, ``{column: [values]}`` or a list of rows.
+- ``parse_dates`` (``{column: format}``), ``filter`` (a ``DataFrame.query``),
+  ``replace`` (``{column: {value: replacement}}``), ``derive`` (``{column:
+  DataFrame.eval expression}``), ``fit`` (``{column: {"x", "y", "degree"}}``, a
+  polynomial trend) and ``sort`` (``{"by", "ascending"}``), applied in that order.
+- ``each``: a column; one chart per distinct value, with ``output`` (and any
+  template) filled from that value's rows, e.g. ``"rent_{Zip}.png"``.
+- ``title``, ``labels`` (``x``, ``y``, ``legend`` titles) and ``legend``
+  (``"top"`` for ``LEGEND_TOP``).
+- ``traces``: plotly trace dicts. A string under one of ``ENCODINGS`` names a
+  column; a list is taken as it is. ``split`` makes one trace per distinct value
+  of a column, named after it and coloured from ``colors`` (a map or a list,
+  the palette by default). ``size_max`` sizes markers by area the way
+  ``px.scatter`` does.
+- ``layout``: plotly layout, merged over everything above.
+- ``width``, ``height`` and ``scale`` for the renderer.
+
+Anywhere in traces, layout and title, these objects stand for a value:
+
+- ``{"palette": 0}``: a brand colour;
+- ``{"column": "name"}``: a column;
+- ``{"template": "{Population:abbreviate} ({Share:.1f}%)"}``: a label per row;
+  a format spec is a ``dp5.charts`` helper name (``thousands``, ``abbreviate``,
+  ``percent``, ``truncate``, optionally ``:<digits>``) or a Python format spec.
+  Braces meant for plotly, as in ``%{x}``, are doubled;
+- ``{"when": "expression", "then": a, "else": b}``: a value per row;
+- ``{"map": "column", "values": {...}, "default": x}``: a value per row.
+
+In ``layout`` and ``title`` a per-row value stands for its first row's.
+
+Figures are plain dicts carrying the ``dp5`` template, so building one costs
+no plotly validation, and every chart is handed to one ``RenderService``
+instead of a Kaleido per script. Besides its own image, each chart is rendered
+in the same pass into the ``VARIANTS`` under ``derived/charts/`` (1x and 2x
+PNG, WebP, SVG), listed with their pixel sizes and bytes in
+``derived/charts/manifest.json`` for ``srcset``.
+"""
+from __future__ import annotations
+
+import json
+import string
+from dataclasses import dataclass
+from pathlib import Path
+
+from . import DATA_ROOT
+from .charts import LEGEND_TOP, PALETTE, abbreviate, percent, template_spec, thousands, truncate
+from .datasets import DERIVED_DIR
+from .graph import SKIP_DIRS
+
+SPEC_FILE = 'charts.json'
+RENDER_WORKERS = 2
+
+# Every chart is also rendered, in the same pass, into these variants for the
+# site: file name suffix -> (format, scale relative to the spec's own scale)
+VARIANTS = {'.png': ('png', 1), '@2x.png': ('png', 2), '.webp': ('webp', 1), '.svg': ('svg', 1)}
+VARIANTS_DIR = DERIVED_DIR / 'charts'
+MANIFEST_FILE = 'manifest.json'
+
+# Trace keys whose string values name a column
+ENCODINGS = ('x', 'y', 'z', 'labels', 'values', 'text', 'customdata', 'hovertext', 'ids')
+FORMATS = {'thousands': thousands, 'abbreviate': abbreviate, 'percent': percent, 'truncate': truncate}
+
+# Value objects by their string-valued key, with exactly these keys (``default`` optional)
+_VALUE_KEYS = {
+    'column': ({'column'},),
+    'template': ({'template'},),
+    'when': ({'when', 'then', 'else'},),
+    'map': ({'map', 'values'}, {'map', 'values', 'default'}),
+}
+
+
+class SpecError(ValueError):
+    """A chart spec is malformed or names data that does not exist."""
+
+
+@dataclass
+class ChartSpec:
+    folder: Path
+    spec: dict
+
+    @property
+    def key(self) -> str:
+        return (self.folder / self.spec['output']).relative_to(DATA_ROOT).as_posix()
+
+
+@dataclass
+class Chart:
+    key: str  # output path relative to the data root
+    path: Path
+    figure: dict
+    width: int | None = None
+    height: int | None = None
+    scale: float | None = None
+
+    def targets(self, variants_dir: Path | None = VARIANTS_DIR) -> list[tuple[Path, str, float]]:
+        """``(path, format, scale)`` of the chart's own image, then of each
+        variant under ``variants_dir`` (none when it is ``None``)."""
+        from .render import infer_format
+        scale = self.scale or 1
+        own = [(self.path, infer_format(self.path, None), scale)]
+        if variants_dir is None:
+            return own
+        stem = (variants_dir / self.key).with_suffix('')
+        return own + [(stem.with_name(stem.name + suffix), fmt, scale * factor)
+                      for suffix, (fmt, factor) in VARIANTS.items()]
+
+
+def _palette(value):
+    """``value`` with every ``{"palette": i}`` replaced by its colour."""
+    if isinstance(value, list):
+        return [_palette(v) for v in value]
+    if isinstance(value, dict):
+        if set(value) == {'palette'}:
+            return PALETTE[value['palette']]
+        return {k: _palette(v) for k, v in value.items()}
+    return value
+
+
+def load_specs(root: Path = DATA_ROOT, match: str | None = None) -> list[ChartSpec]:
+    """Every spec in the folders' ``charts.json``; ``match`` filters on the output key."""
+    specs = []
+    for path in sorted(root.rglob(SPEC_FILE)):
+        if any(part in SKIP_DIRS or part.startswith('.') for part in path.relative_to(root).parts[:-1]):
+            continue
+        for spec in json.loads(path.read_text(encoding='utf-8')):
+            if 'output' not in spec or not spec.get('traces'):
+                raise SpecError(f'{path.relative_to(root)}: every spec needs an output and traces')
+            chart = ChartSpec(path.parent, _palette(spec))
+            if match is None or match in chart.key:
+                specs.append(chart)
+    return specs
+
+
+# -- data ------------------------------------------------------------------
+
+def load_frame(chart: ChartSpec, frames: dict | None = None):
+    """The spec's data with its transforms applied; CSVs are read once per
+    ``frames``, from their typed columnar twins when those are fresh."""
+    import pandas as pd
+    from .columnar import read_table
+    from .datasets import Dataset
+    spec, data = chart.spec, chart.spec.get('data')
+    if data is None:
+        frame = pd.DataFrame()
+    elif isinstance(data, str):
+        path = chart.folder / data
+        if frames is None or path not in frames:
+            if not path.exists():
+                raise SpecError(f'{chart.key}: data file {data!r} not found')
+            frame = read_table(Dataset(path.stem, path), categories=False)
+            if frames is not None:
+                frames[path] = frame
+        frame = (frames[path] if frames is not None else frame).copy()
+    else:
+        frame = pd.DataFrame(data)
+    try:
+        for column, fmt in spec.get('parse_dates', {}).items():
+            frame[column] = pd.to_datetime(frame[column], format=fmt)
+        if 'filter' in spec:
+            frame = frame.query(spec['filter'])
+        for column, mapping in spec.get('replace', {}).items():
+            frame[column] = frame[column].replace(mapping)
+        for column, expression in spec.get('derive', {}).items():
+            frame[column] = frame.eval(expression)
+        for column, fit in spec.get('fit', {}).items():
+            import numpy as np
+            x, y = frame[fit['x']].to_numpy(float), frame[fit['y']].to_numpy(float)
+            frame[column] = np.polyval(np.polyfit(x, y, fit.get('degree', 1)), x)
+        if 'sort' in spec:
+            frame = frame.sort_values(spec['sort']['by'], ascending=spec['sort'].get('ascending', True))
+    except (KeyError, NameError, ValueError, SyntaxError) as exc:
+        raise SpecError(f'{chart.key}: {exc}') from exc
+    return frame.reset_index(drop=True)
+
+
+def _values(series) -> list:
+    """A column as JSON-ready values: ISO timestamps, ``None`` for missing."""
+    if series.dtype.kind == 'M':
+        return [None if value is None or value != value else value.isoformat() for value in series]
+    values = series.tolist()
+    if series.dtype.kind == 'f':
+        return [None if value != value else value for value in values]
+    return values
+
+
+def _column(frame, name: str):
+    if name not in frame.columns:
+        raise SpecError(f'no column {name!r} (have {", ".join(map(str, frame.columns)) or "no data"})')
+    return frame[name]
+
+
+def _format(series, spec: str) -> list[str]:
+    name, _, arg = spec.partition(':')
+    if name in FORMATS:
+        return FORMATS[name](series, int(arg)) if arg else FORMATS[name](series)
+    return [format(value, spec) for value in _values(series)]
+
+
+def render_template(template: str, frame) -> list[str]:
+    """``template`` filled from each row of ``frame``."""
+    import numpy as np
+    out = np.full(len(frame), '', dtype=object)
+    for literal, field, spec, _ in string.Formatter().parse(template):
+        if literal:
+            out = out + literal
+        if field is not None:
+            out = out + np.asarray(_format(_column(frame, field), spec or ''), dtype=object)
+    return out.tolist()
+
+
+def _kind(value: dict) -> str | None:
+    """Which value object ``value`` is, if any; plotly dicts such as a pie's
+    ``domain`` (``row``/``column``) never match."""
+    for kind, shapes in _VALUE_KEYS.items():
+        if set(value) in shapes and isinstance(value[kind], str):
+            return kind
+    return None
+
+
+def _resolve(value, frame, scalar: bool = False):
+    """``value`` with its value objects evaluated against ``frame``; with
+    ``scalar`` a per-row value becomes the first row's."""
+    if isinstance(value, list):
+        return [_resolve(v, frame, scalar) for v in value]
+    if not isinstance(value, dict):
+        return value
+    kind = _kind(value)
+    if kind is None:
+        return {k: _resolve(v, frame, scalar) for k, v in value.items()}
+    if kind == 'column':
+        rows = _values(_column(frame, value['column']))
+    elif kind == 'template':
+        rows = render_template(value['template'], frame)
+    elif kind == 'when':
+        rows = [value['then'] if hit else value['else'] for hit in frame.eval(value['when']).tolist()]
+    else:
+        mapping = value['values']
+        rows = [mapping.get(str(v), value.get('default')) for v in _values(_column(frame, value['map']))]
+    if scalar:
+        if not rows:
+            raise SpecError('a template in the layout needs at least one row of data')
+        return rows[0]
+    return rows
+
+
+# -- figures ---------------------------------------------------------------
+
+def _merge(base: dict, update: dict) -> dict:
+    """``update`` deep-merged over ``base``."""
+    merged = dict(base)
+    for key, value in update.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _encode(trace: dict, frame) -> dict:
+    out = {}
+    for key, value in trace.items():
+        if key in ENCODINGS and isinstance(value, str):
+            out[key] = _values(_column(frame, value))
+        else:
+            out[key] = _resolve(value, frame)
+    return out
+
+
+def build_traces(trace: dict, frame) -> list[dict]:
+    """One trace spec as plotly traces: several when it ``split``s its rows."""
+    trace = dict(trace)
+    split, colors = trace.pop('split', None), trace.pop('colors', None)
+    size_max = trace.pop('size_max', None)
+    if size_max is not None:
+        size = trace.get('marker', {}).get('size')
+        column = size['column'] if isinstance(size, dict) else size
+        peak = _column(frame, column).max()
+        trace['marker'] = {**trace['marker'], 'size': {'column': column}, 'sizemode': 'area',
+                           'sizeref': float(peak) / size_max ** 2}
+    if split is None:
+        return [_encode(trace, frame)]
+    traces = []
+    for i, value in enumerate(_column(frame, split).unique()):
+        rows = frame[frame[split] == value].reset_index(drop=True)
+        out = _encode(trace, rows)
+        out.setdefault('name', str(value))
+        if isinstance(colors, dict):
+            color = colors.get(str(value))
+        else:
+            palette = colors or PALETTE
+            color = palette[i % len(palette)]
+        if color is not None:
+            out['marker'] = {'color': color, **out.get('marker', {})}
+            if 'lines' in out.get('mode', ''):
+                out['line'] = {'color': color, **out.get('line', {})}
+        traces.append(out)
+    return traces
+
+
+def build_layout(spec: dict, frame, template: dict) -> dict:
+    layout = {'template': template}
+    title = _resolve(spec.get('title'), frame, scalar=True)
+    if title is not None:
+        layout['title'] = title if isinstance(title, dict) else {'text': title}
+    for name, text in spec.get('labels', {}).items():
+        target = 'legend' if name == 'legend' else f'{name}axis'
+        layout[target] = {'title': {'text': text}}
+    if spec.get('legend') == 'top':
+        layout['legend'] = {**layout.get('legend', {}), **LEGEND_TOP}
+    return _merge(layout, _resolve(spec.get('layout', {}), frame, scalar=True))
+
+
+def build_charts(chart: ChartSpec, frames: dict | None = None, template: dict | None = None) -> list[Chart]:
+    """The figures of one spec: one, or one per value of its ``each`` column."""
+    spec = chart.spec
+    frame = load_frame(chart, frames)
+    template = template or template_spec()
+    each = spec.get('each')
+    groups = [(spec['output'], frame)]
+    if each is not None:
+        groups = []
+        for value in _column(frame, each).unique():
+            rows = frame[frame[each] == value].reset_index(drop=True)
+            groups.append((render_template(spec['output'], rows)[0], rows))
+    charts = []
+    for output, rows in groups:
+        try:
+            figure = {'data': [out for trace in spec['traces'] for out in build_traces(trace, rows)],
+                      'layout': build_layout(spec, rows, template)}
+        except (SpecError, KeyError, ValueError, SyntaxError) as exc:
+            raise SpecError(f'{chart.key}: {exc}') from exc
+        path = chart.folder / output
+        charts.append(Chart(path.relative_to(DATA_ROOT).as_posix(), path, figure,
+                            spec.get('width'), spec.get('height'), spec.get('scale')))
+    return charts
+
+
+def build_all(specs: list[ChartSpec]) -> list[Chart]:
+    """Every figure of ``specs``, sharing CSV reads and the template."""
+    frames, template = {}, template_spec()
+    return [c for spec in specs for c in build_charts(spec, frames, template)]
+
+
+# -- rendering -------------------------------------------------------------
+
+def render_all(charts: list[Chart], service, on_result=None, variants_dir: Path | None = VARIANTS_DIR) -> list:
+    """Submit every chart with its variants to ``service`` at once; results come
+    back in order, a list of ``RenderResult`` per chart (its own image first).
+
+    A chart that fails to render has its exception in place of the list.
+    Figures go out as plain JSON, so plotly is only ever imported by the
+    render workers.
+    """
+    futures = []
+    for chart in charts:
+        targets = chart.targets(variants_dir)
+        for path, _, _ in targets[1:]:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        futures.append(service.submit_set(json.dumps(chart.figure), targets, chart.width, chart.height))
+    results = []
+    for chart, future in zip(charts, futures):
+        try:
+            result = future.result()
+        except Exception as exc:  # one bad figure should not lose the rest of the batch
+            result = exc
+        results.append(result)
+        if on_result is not None:
+            on_result(chart, result)
+    return results
+
+
+def write_manifest(charts: list[Chart], variants_dir: Path = VARIANTS_DIR, merge: bool = False) -> Path:
+    """``manifest.json`` in ``variants_dir``: per chart key, its CSS pixel size
+    and every variant's path (relative to ``variants_dir``), format, scale,
+    pixel size and bytes. With ``merge`` other charts' entries are kept."""
+    from .render import svg_size
+    path = variants_dir / MANIFEST_FILE
+    manifest = json.loads(path.read_text(encoding='utf-8')) if merge and path.exists() else {}
+    for chart in charts:
+        variants = chart.targets(variants_dir)[1:]
+        svg = next(p for p, fmt, _ in variants if fmt == 'svg')
+        with open(svg, 'rb') as fh:
+            width, height = svg_size(fh.read(2048))
+        manifest[chart.key] = {'width': round(width), 'height': round(height), 'variants': [
+            {'path': p.relative_to(variants_dir).as_posix(), 'format': fmt, 'scale': scale,
+             'width': round(width * (1 if fmt == 'svg' else scale)),
+             'height': round(height * (1 if fmt == 'svg' else scale)), 'bytes': p.stat().st_size}
+            for p, fmt, scale in variants]}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(dict(sorted(manifest.items())), indent=2) + '\n', encoding='utf-8')
+    return path
+
+
+def render_charts(match: str | None = None, workers: int = RENDER_WORKERS, cache: bool = True,
+                  service=None) -> list[Path]:
+    """Build and render every chart spec with its variants and write the
+    variant manifest (the ``charts`` stage); returns the charts' own images.
+
+    ``service`` is a running ``RenderService`` to render with (``run`` passes
+    its own); otherwise one of ``workers`` is started, with the default cache
+    if ``cache``.
+    """
+    from .render import RenderService
+    from .render_cache import RenderCache
+    charts = build_all(load_specs(match=match))
+    if service is not None:
+        results = render_all(charts, service)
+    else:
+        with RenderService(workers=workers, cache=RenderCache() if cache else None) as service:
+            results = render_all(charts, service)
+    failed = [f'{c.key} ({r})' for c, r in zip(charts, results) if isinstance(r, Exception)]
+    write_manifest([c for c, r in zip(charts, results) if not isinstance(r, Exception)], merge=match is not None)
+    if failed:
+        raise RuntimeError(f'{len(failed)} chart(s) failed to render: {"; ".join(failed)}')
+    return [c.path for c in charts]
@@ -0,0 +1,311 @@
+"""Cohort-component population projection for Harris County and its neighbors.
+
+Each county's population is a vector of ``AGE_GROUPS`` (5-year, ``0-4`` to
+``95+``) by sex, females first, with a trailing 1 so that one year of aging,
+survival, births and net migration is a single matrix product
+(a Leslie matrix plus a migration column):
+
+- survival: a share ``1 - q`` of each group lives through the year, and a
+  fifth of the survivors move up a group (all of ``95+`` stay);
+- births: ``FERTILITY`` (per woman and year, ages 15-49) times the women of
+  each group, split by ``MALE_BIRTH_SHARE``, into ``0-4``;
+- migration: each county's net international and domestic migrants, spread
+  over ages by ``MIGRANT_AGES`` and evenly by sex.
+
+Seeding (``load_regions``):
+
+- Harris County's age structure is ``age_demographics`` (nine bands, spread
+  over 5-year groups), scaled to the latest total in
+  ``harris_population_growth``; ``FEMALE_SHARE`` splits it by sex.
+- Its migration is the international and domestic components of
+  ``migration_components``. Fertility is scaled so the first year's natural
+  increase equals the natural-increase component there. The table's
+  components (102,000 - 31,000 + 49,000) overshoot its own ``Total Change``
+  (106,000), so all three are scaled to add up to it first.
+- The counties of ``suburban_growth`` have Harris's age structure at their own
+  totals, and the net migration that, with their natural increase, keeps their
+  2020-2025 growth rate.
+
+``project`` runs a batch of ``Scenario``\\ s (multipliers on fertility,
+mortality and each migration component) for every county at once: the matrices
+are ``scenarios x counties x 41 x 41``, and each year is one batched
+``np.matmul`` of each scenario's counties by its Leslie block.
+
+The ``cohort`` stage writes ``derived/cohort/projections.csv`` (totals, births,
+deaths, migration, dependency ratio, aging index and median age per scenario,
+county and year) and ``age_structure.csv``; the baseline feeds the
+``PopulationProjection`` load.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .datasets import DERIVED_DIR, Dataset, discover_datasets, read_dataset
+
+COHORT_DIR = DERIVED_DIR / 'cohort'
+BASE_COUNTY = 'Harris County'
+SOURCES = ('age_demographics', 'harris_population_growth', 'migration_components', 'suburban_growth')
+YEARS = 30
+
+AGE_GROUPS = tuple(f'{a}-{a + 4}' for a in range(0, 95, 5)) + ('95+',)
+N = len(AGE_GROUPS)
+LOWER = np.arange(N) * 5  # first age of each group; 95+ is treated as 95-99
+SEXES = ('female', 'male')
+
+# Female share of each age group (US Census 2020 shape)
+FEMALE_SHARE = np.array([0.489, 0.489, 0.489, 0.488, 0.490, 0.495, 0.500, 0.503, 0.505, 0.507,
+                         0.510, 0.515, 0.523, 0.533, 0.545, 0.560, 0.590, 0.630, 0.680, 0.750])
+# Annual probability of dying: fixed for children and young adults, Gompertz from 25
+_MIDPOINT = LOWER + 2.5
+MORTALITY = np.where(_MIDPOINT < 25, [0.0012, 0.0001, 0.00015, 0.0005, 0.001] + [0.0] * (N - 5),
+                     np.minimum(0.00012 * np.exp(0.075 * _MIDPOINT), 0.5))
+MALE_MORTALITY = 1.2  # male death rates relative to MORTALITY; female ones are FEMALE_MORTALITY
+FEMALE_MORTALITY = 0.8
+# Births per woman and year by age group (15-19 to 45-49); rescaled to the natural increase
+FERTILITY = np.zeros(N)
+FERTILITY[3:10] = (0.017, 0.062, 0.095, 0.097, 0.052, 0.011, 0.001)
+MALE_BIRTH_SHARE = 0.512
+# Age profile of net migrants (young adults move most), sums to 1
+MIGRANT_AGES = np.array([0.06, 0.05, 0.04, 0.07, 0.14, 0.15, 0.12, 0.09, 0.07, 0.05,
+                         0.04, 0.03, 0.03, 0.02, 0.01, 0.01, 0.01, 0.005, 0.003, 0.002])
+MIGRANT_AGES = MIGRANT_AGES / MIGRANT_AGES.sum()
+# How the source's open 75+ band splits over 75-79, 80-84, 85-89, 90-94 and 95+
+OLDEST_SPLIT = (0.40, 0.28, 0.19, 0.095, 0.035)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    fertility: float = 1.0
+    mortality: float = 1.0
+    international: float = 1.0
+    domestic: float = 1.0
+
+
+SCENARIOS = (
+    Scenario('baseline'),
+    Scenario('low_immigration', international=0.5),
+    Scenario('high_growth', fertility=1.1, international=1.25, domestic=0.5),
+    Scenario('no_migration', international=0.0, domestic=0.0),
+)
+
+
+@dataclass
+class Regions:
+    names: tuple[str, ...]
+    base_year: int
+    population: np.ndarray  # counties x 2 x N, females then males
+    international: np.ndarray  # net migrants per year, by county
+    domestic: np.ndarray
+    fertility_scale: float  # FERTILITY multiplier matching the natural-increase component
+
+
+# -- seeding ---------------------------------------------------------------
+
+def _band(label: str) -> tuple[int, int]:
+    label = label.strip()
+    if label.endswith('+'):
+        return int(label[:-1]), 100
+    low, high = label.split('-')
+    return int(low), int(high) + 1
+
+
+def five_year_groups(bands: pd.Series) -> np.ndarray:
+    """Counts over source age bands (``'5-17'``, ``'75+'``) spread over ``AGE_GROUPS``:
+    evenly by single year of age, and an open ``75+`` band by ``OLDEST_SPLIT``."""
+    out = np.zeros(N)
+    for label, count in bands.items():
+        low, high = _band(str(label))
+        if high == 100 and low == 75:
+            out[15:] += count * np.asarray(OLDEST_SPLIT)
+            continue
+        years = np.arange(low, high)
+        np.add.at(out, np.minimum(years // 5, N - 1), count / len(years))
+    return out
+
+
+def _by_sex(groups: np.ndarray) -> np.ndarray:
+    return np.stack([groups * FEMALE_SHARE, groups * (1 - FEMALE_SHARE)])
+
+
+def regions_from_frames(ages: pd.DataFrame, growth: pd.DataFrame, components: pd.DataFrame,
+                        suburbs: pd.DataFrame) -> Regions:
+    """Regions from the ``age_demographics``, ``harris_population_growth``,
+    ``migration_components`` and ``suburban_growth`` tables."""
+    structure = five_year_groups(ages.set_index('Age_Group')['Population'])
+    growth = growth.sort_values('Year')
+    base_year, total = int(growth['Year'].iloc[-1]), float(growth['Harris_County'].iloc[-1])
+    harris = _by_sex(structure / structure.sum() * total)
+
+    components = components.set_index('Component')['People']
+    international = float(components.filter(like='International').iloc[0])
+    domestic = float(components.filter(like='Domestic').iloc[0])
+    natural = float(components.filter(like='Natural').iloc[0])
+    stated = components.filter(like='Total')
+    if len(stated):  # make the components agree with the stated total change
+        scale = float(stated.iloc[0]) / (international + domestic + natural)
+        international, domestic, natural = international * scale, domestic * scale, natural * scale
+    fertility_scale = _calibrate_fertility(harris, natural)
+
+    shares = harris / harris.sum()
+    populations = [harris] + [shares * p for p in suburbs['Population_2025'].to_numpy(float)]
+    names = (BASE_COUNTY, *(f'{c} County' for c in suburbs['County']))
+    # suburbs: net migration = trend growth - natural increase, counted as domestic
+    annual = (1 + suburbs['Growth_Rate_2020_2025'].to_numpy(float) / 100) ** (1 / 5) - 1
+    suburban_natural = _natural_increase(np.stack(populations[1:]), fertility_scale)
+    suburban_net = annual * suburbs['Population_2025'].to_numpy(float) - suburban_natural
+    return Regions(names, base_year, np.stack(populations),
+                   np.r_[international, np.zeros(len(suburbs))], np.r_[domestic, suburban_net], fertility_scale)
+
+
+def load_regions(datasets: dict[str, Dataset] | None = None) -> Regions:
+    datasets = datasets if datasets is not None else discover_datasets()
+    return regions_from_frames(*(read_dataset(datasets[name]) for name in SOURCES))
+
+
+def _natural_increase(population: np.ndarray, fertility_scale: float) -> np.ndarray:
+    """Births minus deaths over one year for ``(..., 2, N)`` populations."""
+    births = (population[..., 0, :] * FERTILITY * fertility_scale).sum(-1)
+    deaths = (population[..., 0, :] * MORTALITY * FEMALE_MORTALITY).sum(-1) \
+        + (population[..., 1, :] * MORTALITY * MALE_MORTALITY).sum(-1) + births * MORTALITY[0]
+    return births - deaths
+
+
+def _calibrate_fertility(population: np.ndarray, natural: float) -> float:
+    """Fertility multiplier whose births minus deaths equal ``natural`` (linear in it)."""
+    zero, one = _natural_increase(population, 0.0), _natural_increase(population, 1.0)
+    return float((natural - zero) / (one - zero))
+
+
+# -- projection ------------------------------------------------------------
+
+def _aging(survival: np.ndarray) -> np.ndarray:
+    """``(..., N, N)``: survivors stay in their group or, one in five, move up."""
+    shape = survival.shape[:-1]
+    out = np.zeros((*shape, N, N))
+    index = np.arange(N)
+    out[..., index, index] = survival * 0.8
+    out[..., index[1:], index[:-1]] = survival[..., :-1] * 0.2
+    out[..., N - 1, N - 1] = survival[..., N - 1]
+    return out
+
+
+def matrices(regions: Regions, scenarios=SCENARIOS) -> np.ndarray:
+    """``(scenarios, counties, 2N + 1, 2N + 1)`` one-year projection matrices."""
+    s, c = len(scenarios), len(regions.names)
+    mortality = np.array([sc.mortality for sc in scenarios])[:, None]
+    female = 1 - np.minimum(MORTALITY * FEMALE_MORTALITY * mortality, 1)  # scenarios x N
+    male = 1 - np.minimum(MORTALITY * MALE_MORTALITY * mortality, 1)
+    fertility = FERTILITY * regions.fertility_scale * np.array([sc.fertility for sc in scenarios])[:, None]
+
+    out = np.zeros((s, c, 2 * N + 1, 2 * N + 1))
+    out[:, :, :N, :N] = _aging(female)[:, None]
+    out[:, :, N:2 * N, N:2 * N] = _aging(male)[:, None]
+    out[:, :, 0, :N] += (fertility * (1 - MALE_BIRTH_SHARE) * female[:, :1])[:, None]
+    out[:, :, N, :N] += (fertility * MALE_BIRTH_SHARE * male[:, :1])[:, None]
+    migrants = (np.array([sc.international for sc in scenarios])[:, None] * regions.international
+                + np.array([sc.domestic for sc in scenarios])[:, None] * regions.domestic)  # scenarios x counties
+    out[:, :, :N, -1] = migrants[..., None] * MIGRANT_AGES / 2
+    out[:, :, N:2 * N, -1] = migrants[..., None] * MIGRANT_AGES / 2
+    out[:, :, -1, -1] = 1
+    return out
+
+
+def project(regions: Regions, scenarios=SCENARIOS, years: int = YEARS) -> np.ndarray:
+    """``(scenarios, counties, years + 1, 2, N)`` populations from the base year on."""
+    step = matrices(regions, scenarios)
+    # Applying the homogeneous matrices as such is a 41 x 41 product per county.
+    # Only the migration column differs between counties, so the counties of a
+    # scenario go through its Leslie block as one (counties x 2N) @ (2N x 2N)
+    # product, and their migrants are added after.
+    leslie = np.ascontiguousarray(step[:, 0, :-1, :-1].transpose(0, 2, 1))
+    migration = np.ascontiguousarray(step[:, :, :-1, -1])
+    s, c = len(scenarios), len(regions.names)
+    out = np.empty((years + 1, s, c, 2 * N))
+    out[0] = regions.population.reshape(c, -1)
+    for year in range(1, years + 1):
+        np.matmul(out[year - 1], leslie, out=out[year])
+        out[year] += migration
+    return out.transpose(1, 2, 0, 3).reshape(s, c, years + 1, 2, N)
+
+
+# -- summaries ---------------------------------------------------------------
+
+def population_between(population: np.ndarray, low: float, high: float = 200) -> np.ndarray:
+    """People aged ``low`` to under ``high`` (both sexes), counting the part of a
+    5-year group inside the range; ``population`` is ``(..., 2, N)``."""
+    covered = np.clip(np.minimum(LOWER + 5, high) - np.maximum(LOWER, low), 0, 5) / 5
+    return (population.sum(-2) * covered).sum(-1)
+
+
+def median_age(population: np.ndarray) -> np.ndarray:
+    """Median age, interpolated within the 5-year group holding it."""
+    groups = population.sum(-2)
+    cumulative = np.cumsum(groups, -1)
+    half = cumulative[..., -1:] / 2
+    index = np.argmax(cumulative >= half, axis=-1)[..., None]
+    before = np.take_along_axis(cumulative, index, -1) - np.take_along_axis(groups, index, -1)
+    share = (half - before) / np.take_along_axis(groups, index, -1)
+    return (LOWER[index] + 5 * share)[..., 0]
+
+
+def projection_frame(regions: Regions, scenarios=SCENARIOS, years: int = YEARS,
+                     populations: np.ndarray | None = None) -> pd.DataFrame:
+    """One row per scenario, county and year with totals and indicators."""
+    populations = populations if populations is not None else project(regions, scenarios, years)
+    s, c, t = populations.shape[:3]
+    total = populations.sum((-2, -1))
+    young, working, old = (population_between(populations, *r) for r in ((0, 15), (15, 65), (65,)))
+    migrants = (np.array([sc.international for sc in scenarios])[:, None] * regions.international
+                + np.array([sc.domestic for sc in scenarios])[:, None] * regions.domestic)
+    net_migration = np.broadcast_to(migrants[..., None], (s, c, t)).astype(float).copy()
+    net_migration[..., 0] = np.nan  # changes are into each year, none into the base year
+    natural = np.full((s, c, t), np.nan)
+    natural[..., 1:] = np.diff(total, axis=-1) - migrants[..., None]
+    fertility = FERTILITY * regions.fertility_scale * np.array([sc.fertility for sc in scenarios])[:, None, None, None]
+    births = np.full((s, c, t), np.nan)
+    births[..., 1:] = (populations[:, :, :-1, 0, :] * fertility).sum(-1)
+    growth = np.full((s, c, t), np.nan)
+    growth[..., 1:] = np.diff(total, axis=-1) / total[..., :-1] * 100
+    return pd.DataFrame({
+        'scenario': np.repeat([sc.name for sc in scenarios], c * t),
+        'county': np.tile(np.repeat(regions.names, t), s),
+        'year': np.tile(regions.base_year + np.arange(t), s * c),
+        'population': total.ravel(),
+        'births': births.ravel(),
+        'deaths': (births - natural).ravel(),
+        'natural_increase': natural.ravel(),
+        'net_migration': net_migration.ravel(),
+        'growth_rate': growth.ravel(),
+        'under_15': young.ravel(),
+        'age_15_64': working.ravel(),
+        'age_65_plus': old.ravel(),
+        'dependency_ratio': ((young + old) / working).ravel(),
+        'aging_index': (old / young * 100).ravel(),
+        'median_age': median_age(populations).ravel(),
+    })
+
+
+def age_frame(regions: Regions, populations: np.ndarray, scenarios=SCENARIOS) -> pd.DataFrame:
+    """Long age structure: scenario, county, year, sex, age group, population."""
+    s, c, t = populations.shape[:3]
+    index = pd.MultiIndex.from_product([[sc.name for sc in scenarios], regions.names,
+                                        regions.base_year + np.arange(t), SEXES, AGE_GROUPS],
+                                       names=['scenario', 'county', 'year', 'sex', 'age_group'])
+    return pd.DataFrame({'population': populations.ravel()}, index=index).reset_index()
+
+
+def build_cohort(datasets: dict[str, Dataset] | None = None, scenarios=SCENARIOS, years: int = YEARS,
+                 out_dir=COHORT_DIR) -> dict[str, int]:
+    """Write ``projections.csv`` and ``age_structure.csv``; returns their sizes."""
+    regions = load_regions(datasets)
+    populations = project(regions, scenarios, years)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    projection_frame(regions, scenarios, years, populations).to_csv(
+        out_dir / 'projections.csv', index=False, float_format='%.4f')
+    age_frame(regions, populations, scenarios).to_csv(out_dir / 'age_structure.csv', index=False,
+                                                      float_format='%.1f')
+    return {'scenarios': len(scenarios), 'counties': len(regions.names), 'years': years}
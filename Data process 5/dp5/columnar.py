@@ -0,0 +1,299 @@
+"""Typed Parquet and Arrow IPC copies of every dataset.
+
+Each CSV gets two columnar twins keyed by its dataset name:
+``derived/parquet/<name>.parquet`` (compressed, for storage and other tools)
+and ``derived/arrow/<name>.arrow`` (uncompressed IPC file, memory-mapped on
+read). Their column types come from the declared schema registry in
+``schemas.json`` rather than from per-read inference: numbers are real
+numbers, zip codes are strings and tier/source-like columns are
+dictionary-encoded.
+
+Under the runner, ``install`` makes ``DataFrame.to_csv`` write the twins next
+to each CSV and ``pd.read_csv`` load a fresh twin instead of re-parsing text,
+so the topic scripts themselves need no changes.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from . import DATA_ROOT
+from .datasets import DERIVED_DIR, Dataset, discover_datasets, read_dataset
+
+PARQUET_DIR = DERIVED_DIR / 'parquet'
+ARROW_DIR = DERIVED_DIR / 'arrow'
+SCHEMA_PATH = Path(__file__).with_name('schemas.json')
+
+# Name tokens of text columns with few distinct values, stored dictionary-encoded
+DICTIONARY_HINTS = {
+    'tier', 'source', 'sector', 'category', 'unit', 'period', 'type', 'status',
+    'trend', 'level', 'classification', 'county', 'component',
+}
+# Name tokens of numeric-looking identifiers that must stay text
+STRING_HINTS = {'zip'}
+
+
+class SchemaError(ValueError):
+    """A dataset no longer matches its declared schema."""
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as exc:
+        raise RuntimeError('pyarrow is required for columnar outputs: pip install pyarrow') from exc
+    return pyarrow
+
+
+def available() -> bool:
+    try:
+        _require_pyarrow()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _tokens(column: str) -> set[str]:
+    out = ''.join(ch.lower() if ch.isalnum() else '_' for ch in column)
+    return set(filter(None, out.split('_')))
+
+
+# -- schema registry -------------------------------------------------------
+
+def load_registry(path: Path = SCHEMA_PATH) -> dict[str, list[list[str]]]:
+    """Declared ``[column, type]`` pairs per dataset name."""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def save_registry(registry: dict, path: Path = SCHEMA_PATH) -> None:
+    lines = [f'  {json.dumps(name)}: {json.dumps(columns, ensure_ascii=False)}'
+             for name, columns in sorted(registry.items())]
+    path.write_text('{\n' + ',\n'.join(lines) + '\n}\n', encoding='utf-8')
+
+
+def infer_columns(frame: pd.DataFrame) -> list[list[str]]:
+    """Proposed schema for a frame, used to seed new registry entries."""
+    columns = []
+    for name in frame.columns:
+        dtype = frame[name].dtype
+        tokens = _tokens(str(name))
+        if tokens & STRING_HINTS:
+            kind = 'string'
+        elif pd.api.types.is_bool_dtype(dtype):
+            kind = 'bool'
+        elif pd.api.types.is_integer_dtype(dtype):
+            kind = 'int64'
+        elif pd.api.types.is_float_dtype(dtype):
+            kind = 'float64'
+        elif tokens & DICTIONARY_HINTS:
+            kind = 'dictionary'
+        else:
+            kind = 'string'
+        columns.append([str(name), kind])
+    return columns
+
+
+def check_registry(datasets: dict[str, Dataset] | None = None,
+                   registry: dict | None = None) -> dict[str, str]:
+    """Datasets whose current CSV cannot be stored with the declared schema."""
+    datasets = datasets if datasets is not None else discover_datasets()
+    registry = registry if registry is not None else load_registry()
+    problems = {}
+    for name, dataset in datasets.items():
+        if name not in registry:
+            problems[name] = 'no declared schema'
+            continue
+        try:
+            to_arrow(read_dataset(dataset), registry[name])
+        except SchemaError as exc:
+            problems[name] = str(exc)
+    return problems
+
+
+def update_registry(datasets: dict[str, Dataset] | None = None) -> list[str]:
+    """Declare schemas for new or drifted datasets; existing valid entries are kept."""
+    datasets = datasets if datasets is not None else discover_datasets()
+    registry = load_registry()
+    problems = check_registry(datasets, registry)
+    for name in problems:
+        registry[name] = infer_columns(read_dataset(datasets[name]))
+    for name in set(registry) - set(datasets):
+        del registry[name]
+    save_registry(registry)
+    return sorted(problems)
+
+
+# -- conversion ------------------------------------------------------------
+
+def arrow_type(kind: str):
+    pa = _require_pyarrow()
+    return {
+        'int64': pa.int64(),
+        'float64': pa.float64(),
+        'bool': pa.bool_(),
+        'string': pa.string(),
+        'dictionary': pa.dictionary(pa.int32(), pa.string()),
+    }[kind]
+
+
+def to_arrow(frame: pd.DataFrame, columns: list[list[str]]):
+    """Convert ``frame`` to a ``pyarrow.Table`` with the declared column types."""
+    pa = _require_pyarrow()
+    names = [str(c) for c in frame.columns]
+    declared = [name for name, _ in columns]
+    if names != declared:
+        raise SchemaError(f'columns {names} do not match declared {declared}')
+    arrays = []
+    for name, kind in columns:
+        series = frame[name]
+        try:
+            if kind in ('string', 'dictionary'):
+                array = pa.array(series.astype('string'), type=pa.string(), from_pandas=True)
+                if kind == 'dictionary':
+                    array = array.dictionary_encode()
+            else:
+                array = pa.array(series, type=arrow_type(kind), from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError) as exc:
+            raise SchemaError(f'column {name!r} is not {kind}: {exc}') from exc
+        arrays.append(array)
+    return pa.Table.from_arrays(arrays, names=declared)
+
+
+def twin_paths(name: str) -> tuple[Path, Path]:
+    return PARQUET_DIR / f'{name}.parquet', ARROW_DIR / f'{name}.arrow'
+
+
+def _replace(path: Path, write) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    try:
+        write(str(tmp))
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def write_twins(frame: pd.DataFrame, name: str, columns: list[list[str]]) -> tuple[Path, Path]:
+    """Write the Parquet and Arrow IPC copies of one dataset."""
+    pa = _require_pyarrow()
+    import pyarrow.parquet as pq
+    table = to_arrow(frame, columns)
+    parquet_path, arrow_path = twin_paths(name)
+
+    def write_arrow(target):
+        with pa.OSFile(target, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+    _replace(parquet_path, lambda target: pq.write_table(table, target, compression='zstd'))
+    _replace(arrow_path, write_arrow)
+    return parquet_path, arrow_path
+
+
+def is_fresh(twin: Path, source: Path) -> bool:
+    try:
+        return twin.stat().st_mtime_ns >= source.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def _decode(table):
+    """Dictionary columns back to plain strings, as ``pd.read_csv`` returns them."""
+    import pyarrow as pa
+    fields = [pa.field(f.name, f.type.value_type) if pa.types.is_dictionary(f.type) else f
+              for f in table.schema]
+    return table.cast(pa.schema(fields))
+
+
+def read_table(dataset: Dataset, columns: list[str] | None = None, categories: bool = True) -> pd.DataFrame:
+    """Load a dataset from its Arrow twin, else Parquet twin, else the CSV.
+
+    Dictionary-encoded columns become ``Categorical`` unless ``categories`` is false.
+    """
+    parquet_path, arrow_path = twin_paths(dataset.name)
+    table = None
+    if is_fresh(arrow_path, dataset.path) and available():
+        import pyarrow as pa
+        with pa.memory_map(str(arrow_path)) as source:
+            table = pa.ipc.open_file(source).read_all()
+        if columns is not None:
+            table = table.select(columns)
+    elif is_fresh(parquet_path, dataset.path) and available():
+        import pyarrow.parquet as pq
+        table = pq.read_table(parquet_path, columns=columns)
+    if table is None:
+        return pd.read_csv(dataset.path, usecols=columns)
+    return (table if categories else _decode(table)).to_pandas()
+
+
+def build_columnar(datasets: dict[str, Dataset] | None = None) -> dict[str, Path]:
+    """Write twins for every dataset whose twins are missing or older than its CSV."""
+    datasets = datasets if datasets is not None else discover_datasets()
+    registry = load_registry()
+    missing = sorted(set(datasets) - set(registry))
+    if missing:
+        raise SchemaError(f'no declared schema for {", ".join(missing)}; '
+                          'run `python -m dp5 schemas --update` and review schemas.json')
+    written = {}
+    for name, dataset in datasets.items():
+        if all(is_fresh(twin, dataset.path) for twin in twin_paths(name)):
+            continue
+        try:
+            written[name] = write_twins(read_dataset(dataset), name, registry[name])[1]
+        except SchemaError as exc:
+            raise SchemaError(f'{name}: {exc}') from exc
+    return written
+
+
+# -- script hooks ----------------------------------------------------------
+
+def _dataset_path(target) -> Path | None:
+    """Resolved path when ``target`` names a dataset CSV inside the tree."""
+    if not isinstance(target, (str, os.PathLike)):
+        return None
+    path = Path(target).resolve()
+    if path.suffix.lower() != '.csv' or not path.is_relative_to(DATA_ROOT) or path.is_relative_to(DERIVED_DIR):
+        return None
+    return path
+
+
+def install(log=None):
+    """Patch ``DataFrame.to_csv`` and ``pd.read_csv`` to write and prefer the twins."""
+    _require_pyarrow()
+    log = log or (lambda message: print(message, file=sys.stderr))
+    registry = load_registry()
+    original_to_csv = pd.DataFrame.to_csv
+    original_read_csv = pd.read_csv
+
+    def to_csv(self, path_or_buf=None, *args, **kwargs):
+        result = original_to_csv(self, path_or_buf, *args, **kwargs)
+        path = _dataset_path(path_or_buf)
+        if path is None:
+            return result
+        if path.stem not in registry:
+            log(f'[dp5 columnar] {path.name}: no declared schema, CSV only')
+        else:
+            try:
+                write_twins(self, path.stem, registry[path.stem])
+            except SchemaError as exc:
+                log(f'[dp5 columnar] {path.name}: {exc}; CSV only')
+        return result
+
+    def read_csv(filepath_or_buffer, *args, **kwargs):
+        path = _dataset_path(filepath_or_buffer)
+        if args or kwargs or path is None or path.stem not in registry:
+            return original_read_csv(filepath_or_buffer, *args, **kwargs)
+        return read_table(Dataset(path.stem, path), categories=False)
+
+    pd.DataFrame.to_csv = to_csv
+    pd.read_csv = read_csv
+
+    def restore():
+        pd.DataFrame.to_csv = original_to_csv
+        pd.read_csv = original_read_csv
+    return restore
@@ -0,0 +1,87 @@
+"""Consensus of the short-term rental providers' figures, with bootstrap intervals.
+
+``houston_str_market_data`` has one row per provider (AirROI, Chalet,
+Airbtics, AirDNA, RedAwning) with its listing count, occupancy, ADR and annual
+revenue. ``consensus`` weights each provider's occupancy, ADR and revenue by
+its ``Active_Listings`` (listings themselves are a plain mean) and adds a
+percentile bootstrap interval. The resamples are one integer array of
+``resamples x providers`` indices, so every resample and metric is a single
+weighted sum over a ``resamples x providers x metrics`` array.
+
+The result is in the typed-column layout of the ``typed`` stage: ``value``,
+``value_low``/``value_high`` (here the interval), ``unit``, ``qualifier`` and
+``period``, plus the provider count and the providers' own range.
+``summary_values`` formats it the way ``houston_str_market_summary`` shows
+it, so the summary script recomputes those rows from the provider table
+instead of hard-coding them.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+WEIGHT = 'Active_Listings'
+RESAMPLES = 10_000
+LEVEL = 0.95
+SEED = 2025
+PERIOD = '2025'
+
+
+@dataclass(frozen=True)
+class Metric:
+    column: str
+    label: str  # Metric name in houston_str_market_summary
+    unit: str
+    weighted: bool = True
+
+
+METRICS = (
+    Metric('Active_Listings', 'Total Active Listings (Range)', 'listings', weighted=False),
+    Metric('Occupancy_Rate', 'Average Occupancy Rate', 'percent'),
+    Metric('Average_Daily_Rate', 'Average Daily Rate (Range)', 'USD'),
+    Metric('Annual_Revenue', 'Average Annual Revenue (Range)', 'USD'),
+)
+
+
+def consensus(providers: pd.DataFrame, metrics=METRICS, weight: str = WEIGHT, resamples: int = RESAMPLES,
+              level: float = LEVEL, seed: int = SEED) -> pd.DataFrame:
+    """One row per metric: the (weighted) mean across providers and its
+    ``level`` bootstrap interval over ``resamples`` resamples of the providers."""
+    values = providers[[m.column for m in metrics]].to_numpy(float)  # providers x metrics
+    weights = np.where([m.weighted for m in metrics], providers[weight].to_numpy(float)[:, None], 1.0)
+    estimate = (weights * values).sum(axis=0) / weights.sum(axis=0)
+
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(0, len(providers), size=(resamples, len(providers)))
+    sampled_weights = weights[picks]  # resamples x providers x metrics
+    boot = (sampled_weights * values[picks]).sum(axis=1) / sampled_weights.sum(axis=1)
+    low, high = np.quantile(boot, [(1 - level) / 2, (1 + level) / 2], axis=0)
+
+    return pd.DataFrame({
+        'metric': [m.label for m in metrics],
+        'value': estimate,
+        'value_low': low,
+        'value_high': high,
+        'unit': [m.unit for m in metrics],
+        'qualifier': [f'{"listing-weighted" if m.weighted else "mean"}, {level:.0%} bootstrap interval'
+                      for m in metrics],
+        'period': PERIOD,
+        'sources': len(providers),
+        'source_min': values.min(axis=0),
+        'source_max': values.max(axis=0),
+    })
+
+
+def summary_values(estimates: pd.DataFrame) -> dict[str, str]:
+    """Summary-table display strings by metric label, in its existing formats."""
+    out = {}
+    for row in estimates.itertuples(index=False):
+        if row.unit == 'listings':
+            out[row.metric] = f'{row.source_min:,.0f} - {row.source_max:,.0f} listings'
+        elif row.unit == 'percent':
+            out[row.metric] = f'{row.value:.1f}% ({row.source_min:.0f}-{row.source_max:.0f}% range)'
+        else:
+            out[row.metric] = f'${row.source_min:,.0f} - ${row.source_max:,.0f} (${row.value:,.0f} average)'
+    return out
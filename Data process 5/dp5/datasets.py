@@ -0,0 +1,45 @@
+"""Registry of the CSV datasets produced by the topic scripts.
+
+Every CSV below ``Data process 5/`` is addressed by its file stem
+(``houston_str_market_data``), which is unique across topic folders.
+Derived artifacts written by pipeline stages live under ``derived/``.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from . import DATA_ROOT
+
+DERIVED_DIR = DATA_ROOT / 'derived'
+
+_SKIP = {'dp5', 'tests', 'derived', 'observations', '__pycache__'}
+
+
+@dataclass(frozen=True)
+class Dataset:
+    name: str
+    path: Path
+
+    @property
+    def topic(self) -> str:
+        """Top-level topic folder the dataset belongs to."""
+        return self.path.relative_to(DATA_ROOT).parts[0]
+
+
+def discover_datasets(root: Path = DATA_ROOT) -> dict[str, Dataset]:
+    datasets: dict[str, Dataset] = {}
+    for path in sorted(root.rglob('*.csv')):
+        parts = path.relative_to(root).parts
+        if any(part in _SKIP or part.startswith('.') for part in parts[:-1]):
+            continue
+        if path.stem in datasets:
+            raise ValueError(f'Dataset name {path.stem!r} is used by both '
+                             f'{datasets[path.stem].path} and {path}')
+        datasets[path.stem] = Dataset(path.stem, path)
+    return datasets
+
+
+def read_dataset(dataset: Dataset):
+    import pandas as pd
+    return pd.read_csv(dataset.path)
@@ -0,0 +1,665 @@
+"""Bulk load of the pipeline outputs into the Data Process 5 Prisma models.
+
+``DataProcess5ImportService`` upserts one Prisma record at a time. Here each
+model's rows are built as one DataFrame, copied into a temporary staging table
+(``COPY`` on Postgres, multi-row ``INSERT`` batches on SQLite) and merged into
+the model's table with one ``UPDATE ... FROM`` and one ``INSERT ... SELECT``,
+all inside a single transaction per model.
+
+Only rows that changed are written: ``load_all`` keeps a snapshot of each
+model's rows as last loaded into a database (``dp5.changes``), deletes the rows
+that disappeared and stages just the inserted and updated rows.
+
+Rows are matched on the columns of a model's ``@@unique`` constraint, compared
+null-safely, so re-running the load updates rows in place instead of tripping
+the constraint or adding duplicates for rows whose unique columns are null. A
+model with rows of several kinds has a key per kind: a ``RentalMarket`` zip row
+is matched on ``[zipCode, reportDate]`` whatever its neighborhood label, a
+neighborhood row on ``[neighborhood, reportDate]`` and a submarket row on
+``[submarket, reportDate]`` among the rows with neither. Table and column names are
+the ones in ``prisma/schema.prisma``; ``create_sqlite_schema`` builds the same
+tables in a SQLite file so the load can be tried without Postgres.
+"""
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import json
+import os
+import re
+import secrets
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from . import DATA_ROOT
+from .changes import CHANGES_DIR, diff, read_snapshot, write_snapshot
+from .cohort import load_regions, projection_frame
+from .columnar import read_table
+from .datasets import Dataset, discover_datasets
+from .facts import Facts
+from .rentindex import BEDROOMS, latest_by_bedroom, load_observations, rent_index
+from .valuation import (DEFAULT_GRID, HOLD_YEARS, SCENARIO_DEFAULTS, load_market, representative_portfolio,
+                        scenario_grid, submarket_summary)
+from .values import parse_values
+
+PRISMA_SCHEMA = DATA_ROOT.parent / 'prisma' / 'schema.prisma'
+
+# Report date used by DataProcess5ImportService for the 2025 snapshot tables
+REPORT_DATE = datetime(2025, 1, 1)
+REPORT_YEAR = 2025
+
+DEFAULT_BATCH_ROWS = 500
+
+
+@dataclass
+class ModelLoad:
+    table: str
+    key: tuple[str, ...]  # columns a row is matched on, compared null-safely
+    build: Callable[['Sources'], pd.DataFrame]
+    timestamps: tuple[str, ...] = ('createdAt', 'updatedAt')  # set to the load time
+    kinds: tuple[tuple[str, ...], ...] = ()  # per-kind keys, see row_kinds; default: just key
+
+    def __post_init__(self):
+        self.kinds = self.kinds or (self.key,)
+
+
+@dataclass
+class LoadResult:
+    table: str
+    rows: int
+    inserted: int
+    updated: int
+    seconds: float
+    deleted: int = 0
+    unchanged: int = 0  # rows skipped because they match the last load
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else float('inf')
+
+
+class Sources:
+    """Pipeline outputs the model builders read, loaded on first use."""
+
+    def __init__(self, datasets: dict[str, Dataset] | None = None):
+        self.datasets = datasets if datasets is not None else discover_datasets()
+        self._frames: dict[str, pd.DataFrame] = {}
+        self._facts: Facts | None = None
+        self._rent_index: pd.DataFrame | None = None
+        self._cohort: pd.DataFrame | None = None
+        self._valuation: pd.DataFrame | None = None
+
+    def __getitem__(self, name: str) -> pd.DataFrame:
+        if name not in self._frames:
+            self._frames[name] = read_table(self.datasets[name], categories=False)
+        return self._frames[name]
+
+    @property
+    def facts(self) -> Facts:
+        if self._facts is None:
+            self._facts = Facts.build(self.datasets)
+        return self._facts
+
+    @property
+    def rent_index(self) -> pd.DataFrame:
+        if self._rent_index is None:
+            self._rent_index = rent_index(load_observations(datasets=self.datasets))
+        return self._rent_index
+
+    @property
+    def cohort(self) -> pd.DataFrame:
+        if self._cohort is None:
+            self._cohort = projection_frame(load_regions(self.datasets))
+        return self._cohort
+
+    @property
+    def valuation(self) -> pd.DataFrame:
+        if self._valuation is None:
+            market = load_market(self.datasets)
+            self._valuation = submarket_summary(market, representative_portfolio(market),
+                                                scenario_grid(**DEFAULT_GRID))
+        return self._valuation
+
+
+MODELS: dict[str, ModelLoad] = {}
+
+
+def model(table: str, key: tuple, timestamps: tuple[str, ...] = ('createdAt', 'updatedAt')):
+    """Register a model builder; ``key`` is a tuple of columns, or one such tuple
+    per kind of row (tried in order, see ``row_kinds``)."""
+    kinds = tuple(map(tuple, key)) if key and not isinstance(key[0], str) else (tuple(key),)
+    columns = tuple(dict.fromkeys(column for kind in kinds for column in kind))
+
+    def register(build):
+        MODELS[table] = ModelLoad(table, columns, build, timestamps, kinds)
+        return build
+    return register
+
+
+# -- column mappings -------------------------------------------------------
+
+def _fact_value(facts: Facts, metric: str, **filters) -> float | None:
+    rows = facts.select(metric=metric, **filters) if metric in facts.dims['metric'] else None
+    return None if rows is None or rows.empty else float(rows['value'].iloc[0])
+
+
+@model('RentalMarket', key=(('zipCode', 'reportDate'), ('neighborhood', 'reportDate'), ('submarket', 'reportDate')))
+def rental_market(src: Sources) -> pd.DataFrame:
+    # Zip rows leave neighborhood empty: several zips share one (77007 and 77098
+    # are both Heights), which @@unique([neighborhood, reportDate]) would reject.
+    # Their label goes in submarket, which is not part of their key.
+    zips = src['houston_zip_code_rents_2025']
+    by_zip = pd.DataFrame({
+        'zipCode': zips['Zip_Code'].astype(str),
+        'submarket': zips['Neighborhood'],
+        'occupancyClass': zips['Tier_Classification'],
+    })
+    # Latest median rent by bedroom type from the rent index, for every ZIP it covers.
+    # Without observation files the index has only All (the snapshot's average rent).
+    rents = latest_by_bedroom(src.rent_index)[list(BEDROOMS)]
+    rents.columns = ['avgRentStudio', 'avgRent1BR', 'avgRent2BR', 'avgRent3BR', 'avgRent4BR', 'avgRentAll']
+    rents = rents.dropna(how='all')
+    rents.index = rents.index.astype(str)
+    by_zip = by_zip.merge(rents, left_on='zipCode', right_index=True, how='outer')
+    hoods = src['houston_neighborhood_comparison']
+    by_hood = pd.DataFrame({
+        'neighborhood': hoods['Neighborhood'],
+        'occupancyRate': hoods['Occupancy_Rate'],
+        'yearOverYearGrowth': hoods['YoY_Growth'],
+    })
+    subs = src['houston_submarkets_performance_2025']
+    by_submarket = pd.DataFrame({
+        'submarket': subs['Submarket'],
+        'yearOverYearGrowth': pd.to_numeric(subs['YoY_Rent_Growth_Pct'], errors='coerce'),  # 'N/A', 'Negative'
+    })
+    facts = src.facts
+    metro = {'submarket': 'Houston Metro'}
+    for column, unit_type in (('avgRentStudio', 'Studio'), ('avgRent1BR', '1-Bedroom'),
+                              ('avgRent2BR', '2-Bedroom'), ('avgRent3BR', '3-Bedroom')):
+        low = _fact_value(facts, f'{unit_type} Apartments - Range Low')
+        high = _fact_value(facts, f'{unit_type} Apartments - Range High')
+        metro[column] = (low + high) / 2 if low is not None and high is not None else None
+    metro.update(
+        occupancyRate=_fact_value(facts, 'Occupancy Rate - Overall Market'),
+        yearOverYearGrowth=_fact_value(facts, 'Rent Growth - Annual Forecast'),
+        deliveredUnits=_fact_value(facts, 'Construction Activity - Deliveries'),
+        underConstruction=_fact_value(facts, 'Construction Activity - Current Under Construction'),
+    )
+    out = pd.concat([by_zip, by_hood, by_submarket, pd.DataFrame([metro])], ignore_index=True)
+    for column in ('deliveredUnits', 'underConstruction'):
+        out[column] = out[column].astype('Int64')
+    out['reportDate'] = REPORT_DATE
+    out['reportPeriod'] = 'annual'
+    return out
+
+
+@model('STRMarket', key=('neighborhood', 'reportDate'))
+def str_market(src: Sources) -> pd.DataFrame:
+    hoods = src['houston_neighborhoods_performance']
+    return pd.DataFrame({
+        'neighborhood': hoods['Neighborhood'],
+        'performanceTier': hoods['Market_Tier'],
+        'activeListings': 0,  # not reported per neighborhood
+        'avgDailyRate': hoods['Average_Daily_Rate'].astype(float),
+        'occupancyRate': hoods['Occupancy_Rate'].astype(float),
+        'revPAR': hoods['Average_Daily_Rate'] * hoods['Occupancy_Rate'] / 100,
+        'annualRevenue': hoods['Average_Annual_Revenue'].astype(float),
+        'permitRequired': True,  # Houston STR ordinance, effective 2026
+        'reportDate': REPORT_DATE,
+    })
+
+
+@model('EmployerDP5', key=('companyName',))
+def employers(src: Sources) -> pd.DataFrame:
+    employers = src['houston_major_employers_2025']
+    size = parse_values(employers['Employment_Size'].astype('string'))['value']
+    return pd.DataFrame({
+        'companyName': employers['Company'],
+        'sector': employers['Sector'],
+        'industry': employers['Sector'],
+        'employeeCount': size.fillna(0).round().astype('int64').to_numpy(),
+    })
+
+
+@model('IncomeData', key=('zipCode', 'reportYear'))
+def income(src: Sources) -> pd.DataFrame:
+    # Area names repeat across zips (three Heights zips), so they are not loaded
+    # into neighborhood, which is unique per report year.
+    zips = src['top_income_zip_codes']
+    return pd.DataFrame({
+        'zipCode': zips['Zip Code'].astype(str),
+        'medianHouseholdIncome': zips['Median Household Income'].astype(float),
+        'reportYear': REPORT_YEAR,
+    })
+
+
+@model('PopulationProjection', key=(('zipCode', 'projectionYear'), ('county', 'projectionYear'),
+                                     ('city', 'projectionYear')))
+def population(src: Sources) -> pd.DataFrame:
+    # Counties: the baseline cohort-component projection; the city has no age
+    # data, so it keeps the published projection
+    counties = src.cohort[src.cohort['scenario'] == 'baseline']
+    population = counties['population'].round()
+    projected = pd.DataFrame({
+        'county': counties['county'],
+        'projectionYear': counties['year'],
+        'projectedPopulation': population.astype('Int64'),
+        'growthRate': counties['growth_rate'],
+        'growthAbsolute': population.groupby(counties['county']).diff().astype('Int64'),
+        'naturalIncrease': counties['natural_increase'].round().astype('Int64'),
+        'netMigration': counties['net_migration'].round().astype('Int64'),
+        'agingIndex': counties['aging_index'],
+        'dependencyRatio': counties['dependency_ratio'],
+    })
+    city = src['population_projections_2030'].sort_values('Year')
+    return pd.concat([projected, pd.DataFrame({
+        'city': 'Houston',
+        'projectionYear': city['Year'],
+        'projectedPopulation': city['City_of_Houston'],
+        'growthRate': city['City_of_Houston'].pct_change() * 100,
+        'growthAbsolute': city['City_of_Houston'].diff().astype('Int64'),
+    })], ignore_index=True)
+
+
+@model('MigrationData', key=('zipCode', 'county', 'migrationYear'))
+def migration(src: Sources) -> pd.DataFrame:
+    # Only net components are published: inflow/outflow are the positive and
+    # negative net components, not gross flows.
+    def row(components: pd.Series, year: int) -> dict:
+        international = int(components.filter(like='International').iloc[0])
+        domestic = int(components.filter(like='Domestic').iloc[0])
+        flows = np.array([international, domestic])
+        return {
+            'county': 'Harris County',
+            'inMigration': int(flows[flows > 0].sum()),
+            'outMigration': int(-flows[flows < 0].sum()),
+            'netMigration': international + domestic,
+            'internationalMigration': international,
+            'migrationYear': year,
+        }
+
+    current = src['migration_components'].set_index('Component')['People']
+    projected = src['migration_projections_2030'].set_index('Component')['2030_Projected']
+    return pd.DataFrame([row(current, REPORT_YEAR), row(projected, 2030)])
+
+
+@model('EducationMetrics', key=('zipCode', 'schoolDistrict', 'academicYear'))
+def education(src: Sources) -> pd.DataFrame:
+    attainment = src['harris_county_educational_attainment_2025']
+    share = attainment.set_index('Education Level')['Harris County (%)']
+    higher = attainment['Higher Education'].eq("Bachelor's+").to_numpy()
+    graduate = share.index.isin(['Master\'s Degree', 'Professional Degree', 'Doctorate Degree'])
+    return pd.DataFrame([{
+        'collegeGradPercent': float(share[higher].sum()),
+        'graduateSchoolPercent': float(share[graduate].sum()),
+        'academicYear': str(REPORT_YEAR),
+    }])
+
+
+# EconomicIndicatorDP5 column -> fact metrics that feed it, first match wins
+INDICATOR_METRICS = {
+    'totalEmployment': ('Total Nonfarm Employment', 'Total Employment'),
+    'unemploymentRate': ('Unemployment Rate',),
+    'oilGasEmployment': ('Upstream Oil & Gas Employment',),
+    'portTonnage': ('Total Tonnage (through May)',),
+}
+
+
+@model('EconomicIndicatorDP5', key=('area', 'reportDate'))
+def economic_indicators(src: Sources) -> pd.DataFrame:
+    facts = src.facts
+    known = set(facts.dims['metric'])
+    wanted = [m for metrics in INDICATOR_METRICS.values() for m in metrics if m in known]
+    selected = facts.select(metric=wanted)
+    selected = selected.assign(metric=selected['metric'].astype(str), geography=selected['geography'].astype(str))
+    out = pd.DataFrame(index=pd.Index(sorted(selected['geography'].unique()), name='area'))
+    for column, metrics in INDICATOR_METRICS.items():
+        values = pd.Series(np.nan, index=out.index)
+        for metric in reversed(metrics):
+            found = selected[selected['metric'] == metric].groupby('geography')['value'].first()
+            values = found.reindex(out.index).fillna(values)
+        out[column] = values
+    # Report date: the period of the area's unemployment figure (e.g. May 2025)
+    rates = selected[selected['metric'] == 'Unemployment Rate'].groupby('geography')['period'].first()
+    period = pd.to_datetime(rates.reindex(out.index).astype(str), format='%B %Y', errors='coerce')
+    out['reportDate'] = period.fillna(pd.Timestamp(REPORT_DATE)).to_numpy()
+    out['reportPeriod'] = 'monthly'
+    for column in ('totalEmployment', 'oilGasEmployment'):
+        out[column] = out[column].round().astype('Int64')
+    return out.reset_index()
+
+
+@model('CalculatorResult', key=('calculatorType', 'sessionId'), timestamps=('createdAt',))
+def multifamily_valuation(src: Sources) -> pd.DataFrame:
+    # One result per submarket for its representative property; sessionId
+    # names the submarket so reloads update the same rows
+    summary = src.valuation
+    terms = SCENARIO_DEFAULTS
+    equity = summary['price'] * (1 - terms['ltv'])
+
+    def risks(row) -> str:
+        leverage = row.cap_rate < terms['interest_rate']
+        returns = ('high' if row.levered_irr_p10 < 0 else
+                   'medium' if row.irr_p50 < terms['discount_rate'] else 'low')
+        return json.dumps([
+            {'category': 'market', 'level': returns,
+             'description': f'Levered IRR {row.levered_irr_p10:.1%} to {row.levered_irr_p90:.1%} '
+                            f'(10th to 90th percentile of {row.scenarios} rent, occupancy and exit cap scenarios)'},
+            {'category': 'financing', 'level': 'high' if leverage else 'low',
+             'description': f'Going-in cap rate {row.cap_rate:.2%} against {terms["interest_rate"]:.2%} debt'
+                            + (': negative leverage' if leverage else '')},
+        ])
+
+    inputs = [json.dumps({
+        'submarket': row.submarket, 'units': row.units, 'capRate': row.cap_rate, 'rent': row.rent,
+        'rentGrowth': row.rent_growth, 'occupancy': row.occupancy,
+        'marketDefaults': row.defaults.split(',') if row.defaults else [], 'holdYears': HOLD_YEARS,
+        'scenarios': row.scenarios, 'discountRate': terms['discount_rate'], 'ltv': terms['ltv'],
+        'interestRate': terms['interest_rate'], 'dcfValue': row.dcf_value_p50,
+    }) for row in summary.itertuples(index=False)]
+    return pd.DataFrame({
+        'calculatorType': 'multifamily_valuation',
+        'sessionId': 'dp5:' + summary['submarket'],
+        'inputs': inputs,
+        'roi': summary['levered_irr_p50'],
+        'totalCost': summary['price'],
+        'projectedProfit': (summary['equity_multiple_p50'] - 1) * equity,
+        'timeline': f'{HOLD_YEARS}-year hold',
+        'risks': [risks(row) for row in summary.itertuples(index=False)],
+        'completed': True,
+    })
+
+
+# -- database access -------------------------------------------------------
+
+class Database:
+    """Thin wrapper over a sqlite3 or psycopg connection with the SQL that differs."""
+
+    def __init__(self, url: str):
+        self.url = url
+        if url.startswith('sqlite:'):
+            self.conn = sqlite3.connect(sqlite_path(url))
+            self.conn.execute('PRAGMA analysis_limit = 1000')  # keeps the per-model ANALYZE cheap
+            self.kind = 'sqlite'
+        elif url.startswith(('postgres://', 'postgresql://')):
+            try:
+                import psycopg
+            except ImportError:
+                psycopg = None
+            if psycopg is not None:
+                self.conn = psycopg.connect(url)
+                self.kind = 'psycopg'
+            else:
+                try:
+                    import psycopg2
+                except ImportError as exc:
+                    raise RuntimeError('loading into Postgres needs psycopg: pip install "psycopg[binary]"') from exc
+                self.conn = psycopg2.connect(url)
+                self.kind = 'psycopg2'
+        else:
+            raise ValueError(f'unsupported database URL {url!r}; expected sqlite:///path or postgresql://...')
+
+    @property
+    def postgres(self) -> bool:
+        return self.kind != 'sqlite'
+
+    @property
+    def null_safe_equal(self) -> str:
+        return 'IS NOT DISTINCT FROM' if self.postgres else 'IS'
+
+    def stage(self, table: str, staging: str, columns: list[str], rows: list[tuple], batch_rows: int):
+        """Create a temporary copy of ``table``'s columns and fill it with ``rows``."""
+        cur = self.conn.cursor()
+        names = ', '.join(map(quote, columns))
+        if self.postgres:
+            cur.execute(f'CREATE TEMP TABLE {quote(staging)} ON COMMIT DROP AS '
+                        f'SELECT {names} FROM {quote(table)} WITH NO DATA')
+            copy_sql = f'COPY {quote(staging)} ({names}) FROM STDIN'
+            if self.kind == 'psycopg':
+                with cur.copy(copy_sql) as copy:
+                    for row in rows:
+                        copy.write_row(row)
+            else:
+                buffer = io.StringIO()
+                csv.writer(buffer).writerows(rows)
+                buffer.seek(0)
+                cur.copy_expert(copy_sql + " WITH (FORMAT csv, NULL '')", buffer)
+            return
+        cur.execute(f'DROP TABLE IF EXISTS temp.{quote(staging)}')
+        cur.execute(f'CREATE TEMP TABLE {quote(staging)} AS SELECT {names} FROM {quote(table)} WHERE 0')
+        batch_rows = max(1, min(batch_rows, 32000 // max(1, len(columns))))
+        for start in range(0, len(rows), batch_rows):
+            batch = rows[start:start + batch_rows]
+            placeholders = ', '.join(['(' + ', '.join('?' * len(columns)) + ')'] * len(batch))
+            cur.execute(f'INSERT INTO {quote(staging)} ({names}) VALUES {placeholders}',
+                        [value for row in batch for value in row])
+
+    def execute(self, sql: str) -> int:
+        cur = self.conn.cursor()
+        cur.execute(sql)
+        return cur.rowcount
+
+    def close(self):
+        self.conn.close()
+
+
+def sqlite_path(url: str) -> str:
+    """File path of a ``sqlite:///relative`` or ``sqlite:////absolute`` URL."""
+    return re.sub(r'^sqlite:(///)?', '', url)
+
+
+def quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _cuid() -> str:
+    """Collision-resistant id in the shape Prisma's ``cuid()`` default produces."""
+    return 'c' + format(int(time.time() * 1000), 'x') + secrets.token_hex(8)
+
+
+def _sql_value(value):
+    return (value.isoformat(sep=' ') if isinstance(value, datetime) else
+            int(value) if isinstance(value, bool) else value)
+
+
+def _rows(frame: pd.DataFrame, sqlite: bool) -> list[tuple]:
+    out = frame.astype(object).where(frame.notna(), None)
+    if sqlite:
+        for column in out.columns:
+            out[column] = [_sql_value(v) for v in out[column]]
+    return list(out.itertuples(index=False, name=None))
+
+
+def row_kinds(keys: pd.DataFrame, spec: ModelLoad) -> np.ndarray:
+    """Index into ``spec.kinds`` of every row: the first kind whose columns are all set."""
+    kinds = np.zeros(len(keys), dtype=int)
+    if len(spec.kinds) == 1:
+        return kinds  # one key: its columns may be null, compared null-safely
+    kinds[:] = -1
+    for i, columns in reversed(list(enumerate(spec.kinds))):
+        kinds[keys[list(columns)].notna().all(axis=1).to_numpy()] = i
+    if (kinds < 0).any():
+        raise ValueError(f'{spec.table}: {int((kinds < 0).sum())} row(s) have none of the keys {spec.kinds}')
+    return kinds
+
+
+def match_keys(frame: pd.DataFrame, spec: ModelLoad) -> pd.DataFrame:
+    """The key columns of ``frame``, with the ones outside each row's kind cleared."""
+    keys = frame[list(spec.key)].copy()
+    kinds = row_kinds(keys, spec)
+    for i, columns in enumerate(spec.kinds):
+        other = [c for c in spec.key if c not in columns]
+        if other:
+            keys.loc[kinds == i, other] = None
+    return keys
+
+
+def keyed(frame: pd.DataFrame, spec: ModelLoad) -> pd.DataFrame:
+    """``frame`` with every key column present and one row per key (the last)."""
+    frame = frame.assign(**{column: None for column in spec.key if column not in frame})
+    return frame[~match_keys(frame, spec).duplicated(keep='last').to_numpy()].reset_index(drop=True)
+
+
+def _match(db: Database, spec: ModelLoad, kind: int) -> str:
+    """Condition matching a staged row ``s`` of ``spec.kinds[kind]`` to a row ``t``:
+    equal key columns, and null the columns of the kinds tried before it."""
+    columns = spec.kinds[kind]
+    earlier = dict.fromkeys(c for k in spec.kinds[:kind] for c in k if c not in columns)
+    return ' AND '.join([*(f't.{quote(c)} {db.null_safe_equal} s.{quote(c)}' for c in columns),
+                         *(f't.{quote(c)} IS NULL' for c in earlier)])
+
+
+def load_model(db: Database, spec: ModelLoad, frame: pd.DataFrame,
+               batch_rows: int = DEFAULT_BATCH_ROWS, deleted: pd.DataFrame | None = None) -> LoadResult:
+    """Delete the rows matching ``deleted`` (key columns), then stage ``frame`` and
+    merge it into ``spec.table``, in one transaction."""
+    start = time.perf_counter()
+    frame = keyed(frame, spec)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    frame.insert(0, 'id', [_cuid() for _ in range(len(frame))])
+    for column in spec.timestamps:
+        frame[column] = now
+    columns = list(frame.columns)
+    table = quote(spec.table)
+    names = ', '.join(map(quote, columns))
+    inserted = updated = removed = 0
+    try:
+        if len(frame) and not db.postgres:
+            # Statistics let SQLite probe the selective unique index: without them
+            # it may pick [neighborhood, ...] for rows whose neighborhood is null.
+            db.execute(f'ANALYZE {table}')
+        # Deletes first: a row that moved to another key must be gone before its
+        # replacement is inserted, or the insert would trip the unique constraint
+        if deleted is not None and len(deleted):
+            kinds = row_kinds(deleted, spec)
+            for kind, key in enumerate(spec.kinds):
+                rows = deleted.loc[kinds == kind, list(key)]
+                if not len(rows):
+                    continue
+                gone = f'_dp5_delete_{spec.table}_{kind}'
+                db.stage(spec.table, gone, list(key), _rows(rows, not db.postgres), batch_rows)
+                removed += db.execute(f'DELETE FROM {table} AS t WHERE EXISTS '
+                                      f'(SELECT 1 FROM {quote(gone)} AS s WHERE {_match(db, spec, kind)})')
+                if not db.postgres:
+                    db.execute(f'DROP TABLE temp.{quote(gone)}')
+        kinds = row_kinds(frame, spec)
+        for kind, key in enumerate(spec.kinds):
+            rows = frame[kinds == kind]
+            if not len(rows):
+                continue
+            staging = f'_dp5_stage_{spec.table}_{kind}'
+            match = _match(db, spec, kind)
+            updates = [c for c in columns if c not in ('id', 'createdAt') and c not in key]
+            db.stage(spec.table, staging, columns, _rows(rows, not db.postgres), batch_rows)
+            updated += db.execute(
+                f'UPDATE {table} AS t SET {", ".join(f"{quote(c)} = s.{quote(c)}" for c in updates)} '
+                f'FROM {quote(staging)} AS s WHERE {match}')
+            inserted += db.execute(
+                f'INSERT INTO {table} ({names}) SELECT {", ".join(f"s.{quote(c)}" for c in columns)} '
+                f'FROM {quote(staging)} AS s WHERE NOT EXISTS (SELECT 1 FROM {table} AS t WHERE {match})')
+            if not db.postgres:
+                db.execute(f'DROP TABLE temp.{quote(staging)}')
+        db.conn.commit()
+    except BaseException:
+        db.conn.rollback()
+        raise
+    return LoadResult(spec.table, len(frame), inserted, updated, time.perf_counter() - start, removed)
+
+
+def _state_dir(url: str) -> Path:
+    """Snapshots of what was last loaded into the database at ``url``."""
+    return CHANGES_DIR / 'loaded' / hashlib.sha256(url.encode()).hexdigest()[:16]
+
+
+def load_all(url: str, tables: list[str] | None = None, batch_rows: int = DEFAULT_BATCH_ROWS,
+             on_result=None, full: bool = False, datasets: dict[str, Dataset] | None = None) -> list[LoadResult]:
+    """Build every model (or ``tables``) and load the rows that changed since the
+    last load into this database, one transaction each; ``full`` loads every row."""
+    sources = Sources(datasets)
+    db = Database(url)
+    state_dir = _state_dir(url)
+    results = []
+    try:
+        for name in tables or MODELS:
+            spec = MODELS[name]
+            frame = keyed(spec.build(sources), spec)
+            start = time.perf_counter()
+            previous = None if full else read_snapshot(state_dir / f'{name}.csv')
+            changeset, current = diff(previous, frame, list(spec.key), keys=match_keys(frame, spec))
+            result = load_model(db, spec, changeset.upserts, batch_rows, deleted=changeset.deleted)
+            result.seconds = time.perf_counter() - start
+            result.rows, result.unchanged = len(frame), changeset.unchanged
+            for column in spec.key:
+                current[column] = [_sql_value(v) for v in current[column].astype(object)]
+            write_snapshot(current, state_dir / f'{name}.csv')
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+    finally:
+        db.close()
+    return results
+
+
+# -- SQLite stand-in -------------------------------------------------------
+
+_SQLITE_TYPES = {'String': 'TEXT', 'Int': 'INTEGER', 'Float': 'REAL', 'Boolean': 'INTEGER',
+                 'DateTime': 'TEXT', 'Json': 'TEXT', 'BigInt': 'INTEGER', 'Decimal': 'REAL'}
+
+
+def prisma_tables(schema: Path = PRISMA_SCHEMA, models=None) -> dict[str, str]:
+    """``CREATE TABLE`` statements for Prisma models' scalar fields and unique constraints."""
+    text = schema.read_text(encoding='utf-8')
+    statements = {}
+    for name, body in re.findall(r'^model\s+(\w+)\s*\{(.*?)^\}', text, flags=re.M | re.S):
+        if models is not None and name not in models:
+            continue
+        columns, constraints = [], []
+        for line in body.splitlines():
+            line = line.split('//')[0].strip()
+            unique = re.match(r'@@unique\(\[([^\]]+)\]', line)
+            if unique:
+                fields = [f.strip() for f in unique.group(1).split(',')]
+                constraints.append(f'UNIQUE ({", ".join(map(quote, fields))})')
+                continue
+            field = re.match(r'(\w+)\s+(\w+)(\??)(\[\])?\s*(.*)$', line)
+            if not field or field.group(2) not in _SQLITE_TYPES or field.group(4):
+                continue
+            column, kind, optional, _, attrs = field.groups()
+            sql = f'{quote(column)} {_SQLITE_TYPES[kind]}'
+            if '@id' in attrs:
+                sql += ' PRIMARY KEY'
+            elif not optional:
+                sql += ' NOT NULL'
+            if re.search(r'@unique\b', attrs):
+                sql += ' UNIQUE'
+            default = re.search(r'@default\(([^()]*(?:\(\))?)\)', attrs)
+            if default and '@id' not in attrs:
+                value = default.group(1)
+                sql += ' DEFAULT ' + ('CURRENT_TIMESTAMP' if value == 'now()' else
+                                      {'true': '1', 'false': '0'}.get(value, value))
+            columns.append(sql)
+        statements[name] = f'CREATE TABLE IF NOT EXISTS {quote(name)} ({", ".join(columns + constraints)})'
+    return statements
+
+
+def create_sqlite_schema(path, models=None, schema: Path = PRISMA_SCHEMA) -> None:
+    """Create the loaded models' tables in a SQLite file, as Prisma would on Postgres."""
+    conn = sqlite3.connect(path)
+    try:
+        with conn:
+            for statement in prisma_tables(schema, models or list(MODELS)).values():
+                conn.execute(statement)
+    finally:
+        conn.close()
+
+
+def default_url() -> str | None:
+    return os.environ.get('DATABASE_URL')
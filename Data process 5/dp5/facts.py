@@ -0,0 +1,229 @@
+"""One long-format fact table for every Metric/Value-shaped dataset.
+
+Tables such as ``harris_county_energy_sector_2025`` (Metric, Value, Unit,
+Source), ``harris_county_employment_2025`` (Sector, Value, Unit, Period) or
+``harris_county_income_stats`` (Metric, Value as display strings, Source) all
+describe one number per row. ``build_facts`` stacks them into a single table
+with one row per number and integer codes for its dimensions:
+
+- ``metric``: the label with its geography and period taken out
+  (``'Median Household Income (Harris County)'`` -> ``'Median Household Income'``);
+- ``geography``: named in the label, else implied by the dataset name;
+- ``period``: from the label, the Period column or the Source Year column;
+- ``source``, ``unit`` and ``dataset``.
+
+Each dimension is a dictionary (``derived/facts/<dimension>.csv``, ``id,name``)
+and ``facts.csv`` holds the codes, so filtering and pivoting work on integer
+arrays. ``Facts`` is the in-memory side.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from .datasets import DERIVED_DIR, Dataset, discover_datasets, read_dataset
+from .values import _FLAGS, _PERIOD, _mask, _snake, parse_values
+
+FACTS_DIR = DERIVED_DIR / 'facts'
+
+DIMENSIONS = ('metric', 'geography', 'period', 'source', 'unit', 'dataset')
+MEASURES = ('value', 'value_low', 'value_high', 'qualifier')
+
+# Columns that name the metric, in order of preference; the first one present
+# is the metric and a second one, if any, is kept as its detail.
+LABEL_COLUMNS = ('category', 'metric', 'sector')
+SOURCE_COLUMNS = ('source',)
+UNIT_COLUMNS = ('unit',)
+PERIOD_COLUMNS = ('period', 'source_year')
+
+# Geography named in a label -> canonical name (checked in this order)
+GEOGRAPHIES = (
+    (r'harris county', 'Harris County'),
+    (r'houston metro|metro houston|greater houston', 'Houston Metro'),
+    (r'houston city|city of houston', 'City of Houston'),
+    (r'\btexas(?:\s+state)?\b', 'Texas'),
+    (r'\bnational\b|\bu\.?s\.?\b|united states', 'United States'),
+    (r'\bglobal\b', 'Global'),
+)
+# Geography of a row whose label names none, by dataset name prefix
+DEFAULT_GEOGRAPHY = (('harris_county_', 'Harris County'), ('', 'Houston Metro'))
+
+
+def _value_column(columns: list[str]) -> str | None:
+    for column in columns:
+        if column == 'value' or column.startswith('value_'):
+            return column
+    return None
+
+
+def fact_columns(frame: pd.DataFrame) -> dict[str, str] | None:
+    """Role -> source column for a Metric/Value-shaped frame, else ``None``."""
+    by_snake = {_snake(str(c)): c for c in frame.columns}
+    value = _value_column(list(by_snake))
+    labels = [by_snake[c] for c in LABEL_COLUMNS if c in by_snake]
+    if value is None or not labels:
+        return None
+    roles = {'value': by_snake[value], 'label': labels[0]}
+    if len(labels) > 1:
+        roles['detail'] = labels[1]
+    for role, names in (('source', SOURCE_COLUMNS), ('unit', UNIT_COLUMNS), ('period', PERIOD_COLUMNS)):
+        found = [by_snake[c] for c in names if c in by_snake]
+        if found:
+            roles[role] = found[0]
+    return roles
+
+
+def _geography(text: pd.Series, dataset: pd.Series) -> pd.Series:
+    conditions = [_mask(text.str.contains(pattern, flags=_FLAGS, regex=True)) for pattern, _ in GEOGRAPHIES]
+    default = pd.Series(None, index=text.index, dtype='string')
+    for prefix, name in reversed(DEFAULT_GEOGRAPHY):
+        default = default.mask(_mask(dataset.str.startswith(prefix)), name)
+    return pd.Series(np.select(conditions, [name for _, name in GEOGRAPHIES], default=default.to_numpy(object)),
+                     index=text.index, dtype='string')
+
+
+def metric_names(labels: pd.Series, bare_periods: bool = False) -> pd.Series:
+    """Labels without the parentheticals that name a period or geography, or
+    geography words; with ``bare_periods`` also without unbracketed periods."""
+    geography = '(?:' + '|'.join(pattern for pattern, _ in GEOGRAPHIES) + ')'
+    out = labels.astype('string')
+    out = out.str.replace(r'\([^()]*(?:' + _PERIOD + '|' + geography + r')[^()]*\)', '', flags=_FLAGS, regex=True)
+    out = out.str.replace(geography, '', flags=_FLAGS, regex=True)
+    if bare_periods:
+        out = out.str.replace(_PERIOD, '', flags=_FLAGS, regex=True)
+    return out.str.replace(r'\s+', ' ', regex=True).str.strip(' -')
+
+
+def _normalize_unit(units: pd.Series) -> pd.Series:
+    return units.str.strip().str.lower().str.replace(r'\busd\b', 'USD', regex=True)
+
+
+def _stack(datasets: dict[str, Dataset]) -> pd.DataFrame:
+    """One row per number from every Metric/Value-shaped dataset, dimensions as text."""
+    pieces = []
+    for name, dataset in datasets.items():
+        frame = read_dataset(dataset)
+        roles = fact_columns(frame)
+        if roles is None:
+            continue
+        piece = pd.DataFrame({'dataset': name, 'row': np.arange(len(frame))}, index=frame.index)
+        for role in ('label', 'detail', 'value', 'source', 'unit', 'period'):
+            column = frame[roles[role]] if role in roles else pd.Series(None, index=frame.index)
+            piece[role] = column.astype('string')
+        pieces.append(piece)
+    if not pieces:
+        return pd.DataFrame(columns=['dataset', 'row', 'label', 'detail', 'value', 'source', 'unit', 'period'])
+    return pd.concat(pieces, ignore_index=True)
+
+
+def normalize(stacked: pd.DataFrame) -> pd.DataFrame:
+    """Text dimensions and parsed measures for stacked rows (still uncoded)."""
+    text = stacked['label'].str.cat(stacked['detail'], sep=' ', na_rep='')
+    parsed = parse_values(stacked['value'])
+    label_period = text.str.extract(_PERIOD, flags=_FLAGS)['period'].str.strip()
+    return pd.DataFrame({
+        'metric': metric_names(stacked['label']).str.cat(
+            metric_names(stacked['detail'], bare_periods=True), sep=' - ', na_rep='').str.strip(' -'),
+        'geography': _geography(text, stacked['dataset']),
+        'period': label_period.fillna(stacked['period'].str.strip()),
+        'source': stacked['source'].str.strip(),
+        'unit': _normalize_unit(stacked['unit'].fillna(parsed['unit'])),
+        'dataset': stacked['dataset'],
+        'value': parsed['value'],
+        'value_low': parsed['value_low'],
+        'value_high': parsed['value_high'],
+        'qualifier': parsed['qualifier'],
+        'label': stacked['label'],
+    })
+
+
+def encode(rows: pd.DataFrame) -> tuple[pd.DataFrame, dict[str, pd.Index]]:
+    """Replace each dimension by an ``int32`` code (-1 when missing) into a sorted dictionary."""
+    codes, dims = {}, {}
+    for dim in DIMENSIONS:
+        code, names = pd.factorize(rows[dim], sort=True, use_na_sentinel=True)
+        codes[f'{dim}_id'] = code.astype(np.int32)
+        dims[dim] = pd.Index(names.astype(str), name=dim)
+    facts = pd.DataFrame(codes, index=rows.index)
+    for column in (*MEASURES, 'label'):
+        facts[column] = rows[column].to_numpy()
+    facts = facts[facts['value'].notna()]
+    return facts.sort_values(['metric_id', 'geography_id', 'period_id'], kind='stable').reset_index(drop=True), dims
+
+
+def build_facts(datasets: dict[str, Dataset] | None = None, out_dir=FACTS_DIR) -> dict[str, int]:
+    """Write ``facts.csv`` and one dictionary per dimension; returns their row counts."""
+    datasets = datasets if datasets is not None else discover_datasets()
+    facts, dims = encode(normalize(_stack(datasets)))
+    out_dir.mkdir(parents=True, exist_ok=True)
+    facts.to_csv(out_dir / 'facts.csv', index=False)
+    written = {'facts': len(facts)}
+    for dim, names in dims.items():
+        pd.DataFrame({'id': np.arange(len(names)), 'name': names}).to_csv(out_dir / f'{dim}.csv', index=False)
+        written[dim] = len(names)
+    return written
+
+
+class Facts:
+    """The fact table with its dimension dictionaries, sorted by metric for lookups.
+
+    ``frame`` holds the integer codes; ``table`` is the same rows with each
+    dimension as a ``Categorical`` over its dictionary (no copy of the codes).
+    """
+
+    def __init__(self, facts: pd.DataFrame, dims: dict[str, pd.Index]):
+        self.frame = facts.sort_values('metric_id', kind='stable').reset_index(drop=True)
+        self.dims = dims
+        self.table = self.decode(self.frame)
+        metric = self.frame['metric_id'].to_numpy()
+        self._starts = np.searchsorted(metric, np.arange(len(dims['metric']) + 1))
+
+    @classmethod
+    def load(cls, directory=FACTS_DIR) -> 'Facts':
+        if not (directory / 'facts.csv').exists():
+            raise FileNotFoundError(f'{directory} has no facts.csv; run `python -m dp5 stage facts`')
+        dims = {dim: pd.Index(pd.read_csv(directory / f'{dim}.csv', keep_default_na=False)['name'].astype(str),
+                              name=dim)
+                for dim in DIMENSIONS}
+        return cls(pd.read_csv(directory / 'facts.csv'), dims)
+
+    @classmethod
+    def build(cls, datasets: dict[str, Dataset] | None = None) -> 'Facts':
+        datasets = datasets if datasets is not None else discover_datasets()
+        return cls(*encode(normalize(_stack(datasets))))
+
+    def codes(self, dim: str, names) -> np.ndarray:
+        """Codes of one name or a list of names; unknown names are an error."""
+        names = [names] if isinstance(names, str) else list(names)
+        codes = self.dims[dim].get_indexer(names)
+        if (codes < 0).any():
+            unknown = [n for n, c in zip(names, codes) if c < 0]
+            raise KeyError(f'unknown {dim}: {", ".join(map(repr, unknown))}')
+        return codes
+
+    def decode(self, facts: pd.DataFrame) -> pd.DataFrame:
+        """Swap code columns for categoricals over the dimension dictionaries."""
+        out = facts.drop(columns=[f'{dim}_id' for dim in DIMENSIONS])
+        for position, dim in enumerate(DIMENSIONS):
+            out.insert(position, dim, pd.Categorical.from_codes(facts[f'{dim}_id'].to_numpy(), self.dims[dim]))
+        return out
+
+    def metric(self, name: str) -> pd.DataFrame:
+        """All facts of one metric: a dictionary lookup plus a slice of the sorted table."""
+        code = self.codes('metric', name)[0]
+        return self.table.iloc[self._starts[code]:self._starts[code + 1]]
+
+    def select(self, **filters) -> pd.DataFrame:
+        """Facts matching every ``dimension=name`` (or list of names) filter."""
+        mask = np.ones(len(self.frame), dtype=bool)
+        for dim, names in filters.items():
+            if dim not in DIMENSIONS:
+                raise ValueError(f'unknown dimension {dim!r}; expected one of {", ".join(DIMENSIONS)}')
+            mask &= np.isin(self.frame[f'{dim}_id'].to_numpy(), self.codes(dim, names))
+        return self.table[mask]
+
+    def pivot(self, index: str = 'metric', columns: str = 'geography', values: str = 'value',
+              **filters) -> pd.DataFrame:
+        """Wide table of ``values`` by two dimensions; duplicates keep the first fact."""
+        return self.select(**filters).pivot_table(index=index, columns=columns, values=values,
+                                                  aggfunc='first', observed=True)
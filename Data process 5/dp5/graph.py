@@ -0,0 +1,170 @@
+"""Script discovery and producer/consumer graph inference.
+
+Every topic script reads and writes files by literal name relative to its own
+folder (``pd.read_csv('x.csv')``, ``df.to_csv('x.csv')``,
+``fig.write_image('x.png')``). We parse each script with ``ast`` to collect
+those names, then connect a consumer to whichever script produces the file.
+Modules of this package a script imports (``from dp5.charts import go``) count
+as inputs too, so editing one re-runs the scripts that use it.
+"""
+from __future__ import annotations
+
+import ast
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from . import DATA_ROOT
+
+READ_CALLS = {'read_csv', 'read_excel', 'read_json', 'read_parquet'}
+WRITE_CALLS = {'to_csv', 'to_excel', 'to_json', 'to_parquet', 'write_image', 'write_html', 'savefig'}
+
+# Folders under DATA_ROOT that never contain topic scripts
+SKIP_DIRS = {'dp5', 'tests', '__pycache__'}
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+_SUFFIX = re.compile(r'_(\d+)$')
+
+
+@dataclass(eq=False)
+class Script:
+    path: Path
+    inputs: set[Path] = field(default_factory=set)
+    outputs: set[Path] = field(default_factory=set)
+
+    @property
+    def folder(self) -> Path:
+        return self.path.parent
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def kind(self) -> str:
+        return 'chart' if self.path.stem.startswith('chart_script') else 'data'
+
+    @property
+    def order(self) -> int:
+        match = _SUFFIX.search(self.path.stem)
+        return int(match.group(1)) if match else 0
+
+    @property
+    def key(self) -> str:
+        return self.path.relative_to(DATA_ROOT).as_posix()
+
+
+def _literal_arg(call: ast.Call) -> str | None:
+    if call.args and isinstance(call.args[0], ast.Constant) and isinstance(call.args[0].value, str):
+        return call.args[0].value
+    for kw in call.keywords:
+        if kw.arg in ('path_or_buf', 'filepath_or_buffer', 'file', 'fname', 'path'):
+            if isinstance(kw.value, ast.Constant) and isinstance(kw.value.value, str):
+                return kw.value.value
+    return None
+
+
+def _package_modules(node: ast.AST) -> list[Path]:
+    """Source files of the ``dp5`` modules an import statement loads."""
+    if isinstance(node, ast.Import):
+        names = [alias.name for alias in node.names]
+    elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+        names = [node.module] + [f'{node.module}.{alias.name}' for alias in node.names]
+    else:
+        return []
+    paths = [PACKAGE_DIR / f'{name.split(".")[1]}.py' for name in names
+             if name.startswith('dp5.') and name.count('.') == 1]
+    return [p for p in paths if p.exists()]
+
+
+def scan_io(path: Path) -> tuple[set[Path], set[Path]]:
+    """Return the (inputs, outputs) file sets referenced by a script."""
+    tree = ast.parse(path.read_text(encoding='utf-8'), filename=str(path))
+    inputs: set[Path] = set()
+    outputs: set[Path] = set()
+    for node in ast.walk(tree):
+        inputs.update(_package_modules(node))
+        if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Attribute):
+            continue
+        target = _literal_arg(node)
+        if target is None:
+            continue
+        resolved = (path.parent / target).resolve()
+        if node.func.attr in READ_CALLS:
+            inputs.add(resolved)
+        elif node.func.attr in WRITE_CALLS:
+            outputs.add(resolved)
+    return inputs - outputs, outputs
+
+
+def discover(root: Path = DATA_ROOT) -> list[Script]:
+    """Find every topic script below ``root`` and scan its file I/O."""
+    scripts = []
+    for path in sorted(root.rglob('*.py')):
+        rel = path.relative_to(root).parts
+        if any(part in SKIP_DIRS or part.startswith('.') for part in rel[:-1]):
+            continue
+        inputs, outputs = scan_io(path)
+        scripts.append(Script(path=path.resolve(), inputs=inputs, outputs=outputs))
+    return scripts
+
+
+def build_graph(scripts: list[Script]) -> dict[Script, set[Script]]:
+    """Map each script to the scripts that must finish before it starts.
+
+    Edges come from two sources:
+    - a consumer depends on the producer of every file it reads;
+    - the data builders of one folder (``script.py``, ``script_1.py``, ...)
+      run in order, since they were written as consecutive notebook cells.
+    """
+    producers: dict[Path, Script] = {}
+    for script in scripts:
+        for out in script.outputs:
+            producers[out] = script
+
+    deps: dict[Script, set[Script]] = {script: set() for script in scripts}
+    for script in scripts:
+        for needed in script.inputs:
+            producer = producers.get(needed)
+            if producer is not None and producer is not script:
+                deps[script].add(producer)
+
+    chains: dict[Path, list[Script]] = {}
+    for script in scripts:
+        if script.kind == 'data':
+            chains.setdefault(script.folder, []).append(script)
+    for chain in chains.values():
+        chain.sort(key=lambda s: s.order)
+        for prev, cur in zip(chain, chain[1:]):
+            deps[cur].add(prev)
+
+    return deps
+
+
+def topo_order(deps: dict[Script, set[Script]]) -> list[Script]:
+    """Kahn's algorithm; raises ``ValueError`` on a cycle."""
+    remaining = {script: set(d) for script, d in deps.items()}
+    ordered: list[Script] = []
+    ready = sorted((s for s, d in remaining.items() if not d), key=lambda s: s.key)
+    while ready:
+        script = ready.pop(0)
+        ordered.append(script)
+        for other, pending in remaining.items():
+            if script in pending:
+                pending.discard(script)
+                if not pending:
+                    ready.append(other)
+        ready.sort(key=lambda s: s.key)
+    if len(ordered) != len(deps):
+        stuck = sorted(s.key for s in deps if s not in ordered)
+        raise ValueError(f'Dependency cycle between: {", ".join(stuck)}')
+    return ordered
+
+
+def critical_path(deps: dict[Script, set[Script]], cost: dict[Script, float]) -> tuple[float, list[Script]]:
+    """Longest weighted chain through the graph: the floor on wall-clock time."""
+    best: dict[Script, tuple[float, list[Script]]] = {}
+    for script in topo_order(deps):
+        base = max((best[d] for d in deps[script]), key=lambda b: b[0], default=(0.0, []))
+        best[script] = (base[0] + cost.get(script, 0.0), base[1] + [script])
+    return max(best.values(), key=lambda b: b[0], default=(0.0, []))
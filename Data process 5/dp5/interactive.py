@@ -0,0 +1,127 @@
+"""Interactive chart export: compact figure JSON for the site to hydrate.
+
+``export_interactive`` writes into ``EXPORT_DIR`` (``derived/interactive/``),
+or the directory the site serves them from:
+
+- ``plotly-<version>.min.js``: plotly.js from the installed plotly package,
+  named after its version so pages can cache it indefinitely;
+- ``template-<hash>.json``: the ``dp5`` template, shared by every chart instead
+  of embedded in each (it is most of a figure's JSON);
+- ``<folder>/<name>.json`` per chart: its ``data`` and ``layout``, minified, with
+  floats trimmed to ``PRECISION`` significant digits;
+- ``manifest.json``: the two asset names and each chart's file and bytes,
+  keyed like ``derived/charts/manifest.json``.
+
+A page with any number of charts loads plotly.js and the template once, plus a
+few kilobytes per chart. Nothing is rendered, and files whose content did not
+change are left untouched, so their mtimes (and any CDN copy) stay valid.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import re
+from pathlib import Path
+
+from .datasets import DERIVED_DIR
+
+EXPORT_DIR = DERIVED_DIR / 'interactive'
+MANIFEST_FILE = 'manifest.json'
+PRECISION = 6  # significant digits kept in exported floats
+
+_PLOTLY_VERSION = re.compile(rb'plotly\.js v(\d+\.\d+\.\d+)')
+_ASSET = re.compile(r'plotly-[\w.-]+\.min\.js|template-[0-9a-f]{12}\.json')
+
+
+def plotly_js() -> tuple[str, bytes]:
+    """Version and minified source of the plotly.js bundled with plotly."""
+    import pkgutil
+    source = pkgutil.get_data('plotly', 'package_data/plotly.min.js')
+    match = _PLOTLY_VERSION.search(source, 0, 512)
+    if match is None:
+        raise RuntimeError('cannot tell the version of the bundled plotly.min.js')
+    return match.group(1).decode('ascii'), source
+
+
+def trim(value, digits: int = PRECISION):
+    """``value`` with every float rounded to ``digits`` significant digits;
+    whole floats become ints and NaN becomes ``None``."""
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            return None
+        value = float(f'{value:.{digits}g}')
+        return int(value) if value.is_integer() and abs(value) < 2 ** 53 else value
+    if isinstance(value, list):
+        return [trim(v, digits) for v in value]
+    if isinstance(value, dict):
+        return {k: trim(v, digits) for k, v in value.items()}
+    return value
+
+
+def _dumps(value) -> bytes:
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False, allow_nan=False).encode('utf-8')
+
+
+def _write(path: Path, data: bytes) -> bool:
+    """Write ``data`` unless the file already holds it; returns whether it wrote."""
+    if path.exists() and path.stat().st_size == len(data) and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_bytes(data)
+    tmp.replace(path)
+    return True
+
+
+def export_interactive(charts=None, out_dir: Path = EXPORT_DIR, digits: int = PRECISION,
+                       merge: bool = False) -> list[Path]:
+    """Export ``charts`` (every chart spec by default); returns the chart files.
+
+    Without ``merge`` the manifest lists only these charts, and chart files and
+    assets left over from earlier exports are removed.
+    """
+    from .charts import template_spec
+    from .chartspec import build_all, load_specs
+    if charts is None:
+        charts = build_all(load_specs())
+    version, source = plotly_js()
+    script = f'plotly-{version}.min.js'
+    if not (out_dir / script).exists():
+        _write(out_dir / script, source)
+    shared = template_spec()
+    template_data = _dumps(shared)
+    template = f'template-{hashlib.sha256(template_data).hexdigest()[:12]}.json'
+    _write(out_dir / template, template_data)
+
+    manifest_path = out_dir / MANIFEST_FILE
+    entries = {}
+    if merge and manifest_path.exists():
+        entries = json.loads(manifest_path.read_text(encoding='utf-8')).get('charts', {})
+    written = []
+    for chart in charts:
+        layout = chart.figure.get('layout', {})
+        if layout.get('template') == shared:
+            layout = {k: v for k, v in layout.items() if k != 'template'}
+        data = _dumps({'data': trim(chart.figure.get('data', []), digits), 'layout': trim(layout, digits)})
+        relative = Path(chart.key).with_suffix('.json')
+        _write(out_dir / relative, data)
+        entries[chart.key] = {'path': relative.as_posix(), 'bytes': len(data)}
+        written.append(out_dir / relative)
+
+    manifest = {'plotly': script, 'plotly_version': version, 'template': template, 'precision': digits,
+                'charts': dict(sorted(entries.items()))}
+    _write(manifest_path, (json.dumps(manifest, indent=2) + '\n').encode('utf-8'))
+    if not merge:
+        keep = {out_dir / e['path'] for e in entries.values()} | {out_dir / script, out_dir / template}
+        for path in out_dir.rglob('*'):
+            if path.is_file() and path not in keep and _exported(path.relative_to(out_dir)):
+                path.unlink()
+    return written
+
+
+def _exported(relative: Path) -> bool:
+    """Whether a file under the export directory is one this module writes."""
+    if len(relative.parts) > 1:
+        return relative.suffix == '.json'
+    return bool(_ASSET.fullmatch(relative.name))
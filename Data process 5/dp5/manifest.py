@@ -0,0 +1,110 @@
+"""Build manifest for incremental rebuilds.
+
+For every script we record a fingerprint of what it ran with (its source, the
+content of every file it reads, and the source of the scripts it is chained
+after) plus the hashes of the files it wrote. A script whose fingerprint is
+unchanged and whose outputs are still on disk untouched is skipped.
+
+File hashes are cached against ``(size, mtime_ns)`` so an unchanged tree is
+checked with ``stat`` calls only.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+
+from . import BUILD_DIR, DATA_ROOT
+from .graph import Script
+
+MANIFEST_PATH = BUILD_DIR / 'manifest.json'
+VERSION = 1
+
+
+def _rel(path: Path) -> str:
+    try:
+        return path.relative_to(DATA_ROOT).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+class Manifest:
+    def __init__(self, path: Path = MANIFEST_PATH):
+        self.path = path
+        self.scripts: dict[str, dict] = {}
+        self.files: dict[str, list] = {}
+        self._lock = threading.Lock()
+        if path.exists():
+            data = json.loads(path.read_text(encoding='utf-8'))
+            if data.get('version') == VERSION:
+                self.scripts = data.get('scripts', {})
+                self.files = data.get('files', {})
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = {'version': VERSION, 'scripts': self.scripts, 'files': self.files}
+        tmp = self.path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(data, indent=1, sort_keys=True), encoding='utf-8')
+        tmp.replace(self.path)
+
+    def file_hash(self, path: Path) -> str | None:
+        """Content hash of ``path``, or ``None`` when it does not exist."""
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        key = _rel(path)
+        with self._lock:
+            cached = self.files.get(key)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            return cached[2]
+        digest = hashlib.sha256()
+        with open(path, 'rb') as fh:
+            for chunk in iter(lambda: fh.read(1 << 20), b''):
+                digest.update(chunk)
+        value = digest.hexdigest()
+        with self._lock:
+            self.files[key] = [st.st_size, st.st_mtime_ns, value]
+        return value
+
+    def fingerprint(self, script: Script, after: set[Script]) -> str:
+        """Hash of everything that determines what ``script`` writes.
+
+        ``after`` are the order-only predecessors (chained notebook cells)
+        whose source is folded in since no file connects them.
+        """
+        digest = hashlib.sha256()
+        digest.update(self.file_hash(script.path).encode())
+        for path in sorted(script.inputs):
+            digest.update(_rel(path).encode())
+            digest.update((self.file_hash(path) or 'missing').encode())
+        for prev in sorted(after, key=lambda s: s.key):
+            digest.update(prev.key.encode())
+            digest.update(self.file_hash(prev.path).encode())
+        return digest.hexdigest()
+
+    def is_fresh(self, script: Script, fingerprint: str) -> bool:
+        with self._lock:
+            entry = self.scripts.get(script.key)
+        if not entry or entry.get('fingerprint') != fingerprint:
+            return False
+        outputs = entry.get('outputs', {})
+        if set(outputs) != {_rel(p) for p in script.outputs}:
+            return False
+        return all(self.file_hash(DATA_ROOT / rel) == digest for rel, digest in outputs.items())
+
+    def record(self, script: Script, fingerprint: str):
+        outputs = {_rel(p): self.file_hash(p) for p in script.outputs}
+        with self._lock:
+            self.scripts[script.key] = {'fingerprint': fingerprint, 'outputs': outputs}
+
+    def forget(self, script: Script):
+        with self._lock:
+            self.scripts.pop(script.key, None)
+
+
+def order_only_deps(script: Script, needed: set[Script]) -> set[Script]:
+    """Predecessors of ``script`` that do not produce any file it reads."""
+    return {dep for dep in needed if not (dep.outputs & script.inputs)}
@@ -0,0 +1,227 @@
+"""Opt-in per-script profiling: where a script's time and memory go.
+
+With ``python -m dp5 run --profile`` every script runs under ``cProfile`` and
+``tracemalloc``, and leaves three files in ``.dp5/profile/`` named after it:
+
+- ``<script>.prof``: the raw ``pstats`` dump (``snakeviz``, ``python -m pstats``);
+- ``<script>.collapsed``: collapsed stacks, one ``frame;frame;frame microseconds``
+  line each, ready for ``flamegraph.pl`` or speedscope;
+- ``<script>.json``: wall time split into import, compute, render and I/O, and
+  peak traced memory with its top allocation sites.
+
+cProfile only records caller/callee pairs, and rebuilding stacks from them
+over-counts recursive code such as the import machinery. The collapsed stacks
+therefore come from a sampler thread that records the script thread's Python
+stack every millisecond, each sample weighted by the time since the previous
+one. A sample goes to the first category one of its frames matches, import
+before render before I/O; everything else is compute. Time inside C code is
+charged to the Python frame that called it.
+"""
+from __future__ import annotations
+
+import cProfile
+import csv
+import json
+import sys
+import sysconfig
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+from . import BUILD_DIR, DATA_ROOT
+
+PROFILE_DIR = BUILD_DIR / 'profile'
+
+CATEGORIES = ('import', 'compute', 'render', 'io')
+# Category -> substrings of ``file:line(function)`` frame labels, checked in CATEGORY_ORDER
+CATEGORY_FRAMES = {
+    'import': ('<frozen importlib._bootstrap',),
+    'render': ('(write_image)', '(to_image)', 'kaleido/', 'dp5/render.py', 'dp5/render_cache.py'),
+    'io': ('pandas/io/', '(to_csv)', '(read_csv)', 'pyarrow/parquet', 'pyarrow/ipc', 'dp5/columnar.py'),
+}
+CATEGORY_ORDER = ('import', 'render', 'io')
+
+SAMPLE_INTERVAL = 0.001  # seconds
+MIN_MICROSECONDS = 50  # stacks below this are dropped from the collapsed output
+TOP_ALLOCATIONS = 5
+
+# Shortened away in frame labels; site-packages first, it lives inside the stdlib directory
+_PREFIXES = [Path(sysconfig.get_paths()[name]) for name in ('purelib', 'platlib', 'stdlib')] + [DATA_ROOT]
+
+
+def _short(filename: str) -> str:
+    """Path of a code object's file relative to site-packages, the data tree or the stdlib."""
+    if filename.startswith('<'):
+        return filename
+    path = Path(filename)
+    for prefix in _PREFIXES:
+        if path.is_relative_to(prefix):
+            return path.relative_to(prefix).as_posix()
+    return path.as_posix()
+
+
+class StackSampler:
+    """Collapsed stacks of one thread, sampled from another."""
+
+    def __init__(self, thread_id: int, skip: int = 0, interval: float = SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.skip = skip  # outermost frames to leave out (the profiler's callers)
+        self.interval = interval
+        self.stacks: dict[str, float] = {}
+        self._labels: dict[object, str] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='dp5-profile-sampler', daemon=True)
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = f'{_short(code.co_filename)}:{code.co_firstlineno}({code.co_name})'.replace(';', ',')
+            self._labels[code] = label
+        return label
+
+    def _run(self):
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            now = time.perf_counter()
+            codes = []
+            while frame is not None:
+                codes.append(frame.f_code)
+                frame = frame.f_back
+            codes = codes[::-1][self.skip:]
+            if codes:
+                key = ';'.join(map(self._label, codes))
+                self.stacks[key] = self.stacks.get(key, 0.0) + (now - last)
+            last = now
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def categorize(stacks: dict[str, float]) -> dict[str, float]:
+    """Seconds per category; each stack counts once, for the first category it matches."""
+    totals = dict.fromkeys(CATEGORIES, 0.0)
+    for stack, seconds in stacks.items():
+        for category in CATEGORY_ORDER:
+            if any(pattern in stack for pattern in CATEGORY_FRAMES[category]):
+                totals[category] += seconds
+                break
+        else:
+            totals['compute'] += seconds
+    return totals
+
+
+def write_collapsed(stacks: dict[str, float], path: Path) -> None:
+    lines = [f'{stack} {round(seconds * 1e6)}' for stack, seconds in sorted(stacks.items())
+             if seconds * 1e6 >= MIN_MICROSECONDS]
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+
+def _depth() -> int:
+    frame, depth = sys._getframe(1), 0
+    while frame is not None:
+        depth, frame = depth + 1, frame.f_back
+    return depth
+
+
+def profile_call(func, key: str, out_dir: Path = PROFILE_DIR):
+    """Run ``func()`` under cProfile, tracemalloc and the stack sampler and write
+    its profile files.
+
+    ``key`` names the script (``<topic>/<script>.py``); exceptions from ``func``
+    propagate after the profile is written.
+    """
+    profiler = cProfile.Profile()
+    sampler = StackSampler(threading.get_ident(), skip=_depth())
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(SAMPLE_INTERVAL / 2)  # let the sampler in while the script holds the GIL
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        with sampler:
+            profiler.enable()
+            try:
+                return func()
+            finally:
+                profiler.disable()
+    finally:
+        wall = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        sys.setswitchinterval(switch_interval)
+        write_profile(profiler, sampler.stacks, key, wall, peak, snapshot, out_dir)
+
+
+def _base(key: str, out_dir: Path) -> Path:
+    return out_dir / key.replace('/', '__').removesuffix('.py')
+
+
+def write_profile(profiler: cProfile.Profile, stacks: dict[str, float], key: str, wall: float, peak: int,
+                  snapshot, out_dir: Path) -> dict:
+    base = _base(key, out_dir)
+    base.parent.mkdir(parents=True, exist_ok=True)
+    profiler.dump_stats(str(base) + '.prof')
+    write_collapsed(stacks, Path(str(base) + '.collapsed'))
+    seconds = categorize(stacks)
+    top = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__),
+                                  tracemalloc.Filter(False, __file__)]).statistics('lineno')
+    summary = {
+        'script': key,
+        'topic': key.split('/')[0],
+        'wall': round(wall, 4),
+        **{category: round(value, 4) for category, value in seconds.items()},
+        'peak_mb': round(peak / 1e6, 2),
+        'top_allocations': [{'site': f'{_short(s.traceback[0].filename)}:{s.traceback[0].lineno}',
+                             'mb': round(s.size / 1e6, 3)} for s in top[:TOP_ALLOCATIONS]],
+    }
+    Path(str(base) + '.json').write_text(json.dumps(summary, indent=2) + '\n', encoding='utf-8')
+    return summary
+
+
+# -- reports ---------------------------------------------------------------
+
+def load_summaries(out_dir: Path = PROFILE_DIR) -> list[dict]:
+    return [json.loads(p.read_text(encoding='utf-8')) for p in sorted(out_dir.glob('*.json'))]
+
+
+def by_topic(summaries: list[dict]) -> list[dict]:
+    """Per topic folder: summed seconds and the largest peak of its scripts."""
+    topics: dict[str, dict] = {}
+    for s in summaries:
+        row = topics.setdefault(s['topic'], {'topic': s['topic'], 'scripts': 0, 'wall': 0.0,
+                                             **dict.fromkeys(CATEGORIES, 0.0), 'peak_mb': 0.0})
+        row['scripts'] += 1
+        for field in ('wall', *CATEGORIES):
+            row[field] += s[field]
+        row['peak_mb'] = max(row['peak_mb'], s['peak_mb'])
+    return sorted(topics.values(), key=lambda r: -r['wall'])
+
+
+def write_summary(out_dir: Path = PROFILE_DIR) -> Path:
+    """``summary.csv`` with one row per script, slowest first."""
+    summaries = sorted(load_summaries(out_dir), key=lambda s: -s['wall'])
+    path = out_dir / 'summary.csv'
+    with open(path, 'w', newline='', encoding='utf-8') as fh:
+        writer = csv.DictWriter(fh, ['script', 'topic', 'wall', *CATEGORIES, 'peak_mb'], extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(summaries)
+    return path
+
+
+def format_table(rows: list[dict], name: str) -> str:
+    width = max((len(r[name]) for r in rows), default=len(name))
+    width = min(width, 70)
+    header = f'{name:<{width}}  {"wall":>7}  ' + '  '.join(f'{c:>7}' for c in CATEGORIES) + '  peak MB'
+    lines = [header]
+    for r in rows:
+        label = r[name] if len(r[name]) <= width else '...' + r[name][-(width - 3):]
+        lines.append(f'{label:<{width}}  {r["wall"]:6.2f}s  '
+                     + '  '.join(f'{r[c]:6.2f}s' for c in CATEGORIES) + f'  {r["peak_mb"]:7.1f}')
+    return '\n'.join(lines)
@@ -0,0 +1,397 @@
+"""Long-lived chart render service.
+
+``fig.write_image`` normally starts Kaleido (and with it a headless Chromium)
+in every chart script. ``RenderService`` keeps a small pool of worker
+processes whose browser is started once and then reused for every figure
+submitted to the queue.
+
+The ``charts`` stage (``dp5.chartspec``) submits its whole batch of figures
+directly, each with every image variant it needs: ``submit_set`` lays a figure
+out once, to SVG, and rasterizes each PNG/WebP/JPEG from that SVG. Kaleido
+itself rasterizes plotly.js's SVG, so the pixels match rendering each format
+from the figure (``tests/test_render.py`` checks PNG at 1x and 2x), without
+paying the layout once per format. Scripts
+launched by the runner that write images reach the service over a local
+socket: ``dp5.bootstrap`` patches ``BaseFigure.write_image``/``to_image`` to
+forward the figure, so the scripts themselves need no changes.
+"""
+from __future__ import annotations
+
+import base64
+import json
+import os
+import re
+import secrets
+import shutil
+import statistics
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import get_context
+from multiprocessing.managers import BaseManager
+from pathlib import Path
+
+from .render_cache import RenderCache, cache_key
+
+ADDRESS_ENV = 'DP5_RENDER_ADDRESS'
+AUTHKEY_ENV = 'DP5_RENDER_AUTHKEY'
+
+_BLANK = {'data': [], 'layout': {}}
+RASTER_FORMATS = ('png', 'jpeg', 'webp')  # produced by rasterizing the SVG
+_SVG_SIZE = re.compile(rb'<svg\b[^>]*?\swidth="([\d.]+)"[^>]*?\sheight="([\d.]+)"')
+
+
+@dataclass
+class RenderResult:
+    data: bytes | None  # image bytes when no path was given
+    path: str | None
+    format: str
+    seconds: float  # time spent rasterizing in the worker
+    warmup: float | None = None  # browser start-up cost, on a worker's first render
+    queued: float = 0.0  # wall time from submit to completion
+    cached: bool = False  # served from the render cache without rasterizing
+
+
+# -- worker side -----------------------------------------------------------
+
+_worker = {'warmup': None, 'renders': 0}
+
+
+def _start_worker():
+    import plotly.io as pio
+    try:
+        import kaleido
+    except ImportError as exc:
+        raise RuntimeError('kaleido is required to render charts: pip install kaleido') from exc
+    start = time.perf_counter()
+    # kaleido >= 1.0 launches Chromium per call unless a sync server is running;
+    # 0.2.x keeps its own subprocess alive once the first image is produced.
+    start_sync_server = getattr(kaleido, 'start_sync_server', None)
+    if start_sync_server is not None:
+        start_sync_server(silence_warnings=True)
+    pio.to_image(_BLANK, format='png', validate=False)
+    _worker['warmup'] = time.perf_counter() - start
+
+
+def _render(fig_json: str, path: str | None, fmt: str, width, height, scale):
+    import plotly.io as pio
+    start = time.perf_counter()
+    data = pio.to_image(json.loads(fig_json), format=fmt, width=width, height=height,
+                        scale=scale, validate=False)
+    if path is not None:
+        Path(path).write_bytes(data)
+        data = None
+    elapsed = time.perf_counter() - start
+    _worker['renders'] += 1
+    warmup = _worker['warmup'] if _worker['renders'] == 1 else None
+    return data, elapsed, warmup
+
+
+def svg_size(svg: bytes) -> tuple[float, float]:
+    """CSS pixel width and height of a plotly.js SVG, from its root element."""
+    match = _SVG_SIZE.search(svg, 0, 2048)
+    if match is None:
+        raise ValueError('not a plotly SVG: no width and height on the root element')
+    return float(match.group(1)), float(match.group(2))
+
+
+def svg_figure(svg: bytes) -> dict:
+    """A figure that only draws ``svg``, edge to edge at its own size."""
+    width, height = svg_size(svg)
+    source = 'data:image/svg+xml;base64,' + base64.b64encode(svg).decode('ascii')
+    return {'data': [], 'layout': {
+        'width': width, 'height': height, 'margin': {'l': 0, 'r': 0, 't': 0, 'b': 0, 'pad': 0},
+        'xaxis': {'visible': False}, 'yaxis': {'visible': False},
+        'images': [{'source': source, 'xref': 'paper', 'yref': 'paper', 'x': 0, 'y': 1, 'sizex': 1, 'sizey': 1,
+                    'xanchor': 'left', 'yanchor': 'top'}],
+    }}
+
+
+def _render_set(fig_json: str, targets: list[tuple[str, str, float | None]], width, height):
+    """Every ``(path, format, scale)`` target of one figure from a single layout pass."""
+    import plotly.io as pio
+    start = time.perf_counter()
+    figure = json.loads(fig_json)
+    svg = pio.to_image(figure, format='svg', width=width, height=height, validate=False)
+    image, written = None, {}
+    for path, fmt, scale in targets:
+        done = written.get((fmt, scale))
+        if done is not None:
+            shutil.copyfile(done, path)
+            continue
+        if fmt == 'svg':
+            data = svg
+        elif fmt in RASTER_FORMATS:
+            image = image or svg_figure(svg)
+            data = pio.to_image(image, format=fmt, scale=scale, validate=False)
+        else:  # pdf, eps: vector output from the figure itself
+            data = pio.to_image(figure, format=fmt, width=width, height=height, scale=scale, validate=False)
+        Path(path).write_bytes(data)
+        written[fmt, scale] = path
+    elapsed = time.perf_counter() - start
+    _worker['renders'] += 1
+    warmup = _worker['warmup'] if _worker['renders'] == 1 else None
+    return None, elapsed, warmup
+
+
+# -- service ---------------------------------------------------------------
+
+def figure_json(fig) -> str:
+    """Serialize a plotly figure (or figure dict) for transport to a worker."""
+    if isinstance(fig, str):
+        return fig
+    if hasattr(fig, 'to_json'):
+        return fig.to_json()
+    import plotly.io as pio
+    return pio.to_json(fig, validate=False)
+
+
+def infer_format(path, fmt: str | None) -> str:
+    if fmt:
+        return fmt.lower().lstrip('.')
+    if path is not None:
+        suffix = Path(path).suffix.lower().lstrip('.')
+        if suffix:
+            return 'jpeg' if suffix == 'jpg' else suffix
+    return 'png'
+
+
+class RenderService:
+    """Bounded pool of warm Kaleido workers behind a submit/result queue.
+
+    ``workers`` processes render in parallel; at most ``max_pending`` figures
+    may be queued before ``submit`` blocks the caller. With a ``cache``,
+    figures already rendered with the same options are copied from it.
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int | None = None, cache: RenderCache | None = None):
+        self.workers = workers
+        self.cache = cache
+        self._slots = threading.BoundedSemaphore(max_pending or workers * 4)
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._latencies: list[float] = []
+        self._warmups: list[float] = []
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=get_context('spawn'),
+                    initializer=_start_worker,
+                )
+            return self._pool
+
+    def submit(self, fig, path=None, format=None, width=None, height=None, scale=None) -> Future:
+        """Queue a figure; the future resolves to a ``RenderResult``."""
+        fmt = infer_format(path, format)
+        target = str(Path(path).resolve()) if path is not None else None
+        payload = figure_json(fig)
+        submitted = time.perf_counter()
+        key = cache_key(payload, fmt, width, height, scale) if self.cache is not None else None
+        if key is not None:
+            hit = self.cache.get(key, fmt)
+            if hit is not None:
+                return self._from_cache(hit, target, fmt, submitted)
+
+        def finish(data, seconds, warmup):
+            if key is not None:
+                self._put(key, fmt, data, target)
+            return RenderResult(data, target, fmt, seconds, warmup, time.perf_counter() - submitted)
+
+        return self._dispatch(finish, _render, payload, target, fmt, width, height, scale)
+
+    def submit_set(self, fig, targets, width=None, height=None) -> Future:
+        """Queue one figure for several ``(path, format, scale)`` targets; the
+        future resolves to a list with a ``RenderResult`` per target.
+
+        The worker lays the figure out once and rasterizes every target from
+        the resulting SVG. With a cache, the set is copied from it when every
+        target is cached, and rendered whole otherwise: then each target counts
+        as a miss, not as hits for the ones that happened to be cached.
+        """
+        targets = [(str(Path(path).resolve()), infer_format(path, fmt), scale) for path, fmt, scale in targets]
+        payload = figure_json(fig)
+        submitted = time.perf_counter()
+        keys = None
+        if self.cache is not None:
+            keys = [cache_key(payload, fmt, width, height, scale) for _, fmt, scale in targets]
+            if not all((key, fmt) in self.cache for key, (_, fmt, _) in zip(keys, targets)):
+                self.cache.miss(len(targets))
+            else:
+                hits = [self.cache.get(key, fmt) for key, (_, fmt, _) in zip(keys, targets)]
+                if all(hits):  # else an entry was evicted since the check
+                    future: Future = Future()
+                    future.set_result([self._from_cache(hit, path, fmt, submitted).result()
+                                       for hit, (path, fmt, _) in zip(hits, targets)])
+                    return future
+
+        def finish(data, seconds, warmup):
+            if keys is not None:
+                for key, (path, fmt, _) in zip(keys, targets):
+                    self._put(key, fmt, None, path)
+            queued = time.perf_counter() - submitted
+            return [RenderResult(None, path, fmt, seconds, warmup if i == 0 else None, queued)
+                    for i, (path, fmt, _) in enumerate(targets)]
+
+        return self._dispatch(finish, _render_set, payload, targets, width, height)
+
+    def _dispatch(self, finish, task, *args) -> Future:
+        """Run ``task(*args)`` in a worker; the future resolves to ``finish``
+        applied to its ``(data, seconds, warmup)``."""
+        self._slots.acquire()
+        try:
+            inner = self._ensure_pool().submit(task, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        outer: Future = Future()
+
+        def done(f: Future):
+            self._slots.release()
+            try:
+                data, seconds, warmup = f.result()
+                result = finish(data, seconds, warmup)
+            except BaseException as exc:
+                outer.set_exception(exc)
+                return
+            with self._lock:
+                self._latencies.append(seconds)
+                if warmup is not None:
+                    self._warmups.append(warmup)
+            outer.set_result(result)
+
+        inner.add_done_callback(done)
+        return outer
+
+    def _put(self, key: str, fmt: str, data: bytes | None, path: str | None):
+        try:
+            self.cache.put(key, fmt, data=data, source=path)
+        except OSError:
+            pass  # a cache write failure must not fail the render
+
+    @staticmethod
+    def _from_cache(hit: Path, target: str | None, fmt: str, submitted: float) -> Future:
+        data = None
+        if target is not None:
+            shutil.copyfile(hit, target)
+        else:
+            data = hit.read_bytes()
+        future: Future = Future()
+        future.set_result(RenderResult(data, target, fmt, 0.0, None, time.perf_counter() - submitted, cached=True))
+        return future
+
+    def render(self, fig, path=None, format=None, width=None, height=None, scale=None) -> RenderResult:
+        return self.submit(fig, path, format, width, height, scale).result()
+
+    def render_json(self, fig_json: str, path, format, width, height, scale) -> dict:
+        """Remote-call entry point; returns a plain dict for pickling."""
+        return self.render(fig_json, path, format, width, height, scale).__dict__
+
+    def stats(self) -> dict:
+        with self._lock:
+            latencies = list(self._latencies)
+            warmups = list(self._warmups)
+        cache = self.cache.stats() if self.cache is not None else None
+        if not latencies:
+            return {'renders': 0, 'cache': cache}
+        ordered = sorted(latencies)
+        return {
+            'cache': cache,
+            'renders': len(latencies),
+            'workers_started': len(warmups),
+            'cold_start_mean': statistics.fmean(warmups) if warmups else None,
+            'render_mean': statistics.fmean(latencies),
+            'render_p50': ordered[len(ordered) // 2],
+            'render_p95': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+            'render_max': ordered[-1],
+        }
+
+    def close(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# -- cross-process access --------------------------------------------------
+
+class _ServerManager(BaseManager):
+    pass
+
+
+class _ClientManager(BaseManager):
+    pass
+
+
+_ClientManager.register('service')
+
+
+def serve(service: RenderService) -> dict[str, str]:
+    """Expose ``service`` on a loopback socket from a background thread.
+
+    Returns the environment variables a child process needs to connect.
+    """
+    authkey = secrets.token_bytes(16)
+    _ServerManager.register('service', callable=lambda: service, exposed=('render_json', 'stats'))
+    manager = _ServerManager(address=('127.0.0.1', 0), authkey=authkey)
+    server = manager.get_server()
+    threading.Thread(target=server.serve_forever, name='dp5-render-server', daemon=True).start()
+    host, port = server.address
+    return {ADDRESS_ENV: f'{host}:{port}', AUTHKEY_ENV: authkey.hex()}
+
+
+class RemoteRenderer:
+    """Client for a service started with ``serve``; same call shape as ``RenderService.render``."""
+
+    def __init__(self, address: str, authkey: str):
+        host, port = address.rsplit(':', 1)
+        manager = _ClientManager(address=(host, int(port)), authkey=bytes.fromhex(authkey))
+        manager.connect()
+        self._service = manager.service()
+
+    @classmethod
+    def from_env(cls, environ=os.environ) -> 'RemoteRenderer | None':
+        if ADDRESS_ENV not in environ:
+            return None
+        return cls(environ[ADDRESS_ENV], environ[AUTHKEY_ENV])
+
+    def render(self, fig, path=None, format=None, width=None, height=None, scale=None) -> RenderResult:
+        fmt = infer_format(path, format)
+        target = str(Path(path).resolve()) if path is not None else None
+        return RenderResult(**self._service.render_json(figure_json(fig), target, fmt, width, height, scale))
+
+
+def install(renderer, log=print):
+    """Route ``BaseFigure.write_image``/``to_image`` through ``renderer``."""
+    from plotly.basedatatypes import BaseFigure
+
+    def describe(result: RenderResult, label):
+        if result.cached:
+            log(f'[dp5 render] {label}: cache hit, {result.queued:.3f}s total')
+            return
+        note = f' (worker start-up {result.warmup:.2f}s)' if result.warmup is not None else ''
+        log(f'[dp5 render] {label}: {result.seconds:.3f}s render, {result.queued:.3f}s total{note}')
+
+    def write_image(self, file, format=None, scale=None, width=None, height=None, **kwargs):
+        if hasattr(file, 'write'):
+            file.write(to_image(self, format=format, scale=scale, width=width, height=height))
+            return
+        result = renderer.render(self, path=file, format=format, width=width, height=height, scale=scale)
+        describe(result, os.fspath(file))
+
+    def to_image(self, format=None, scale=None, width=None, height=None, **kwargs):
+        result = renderer.render(self, format=format, width=width, height=height, scale=scale)
+        describe(result, 'to_image')
+        return result.data
+
+    BaseFigure.write_image = write_image
+    BaseFigure.to_image = to_image
@@ -0,0 +1,123 @@
+"""On-disk cache of rendered chart images.
+
+Entries are keyed by a hash of the canonical figure JSON (keys sorted, no
+whitespace) together with the output format, size and scale, so a figure
+whose data and layout are unchanged is never re-rasterized. The store is
+capped in bytes and evicts the least recently used images first; a hit
+refreshes the entry's mtime, which is what recency is tracked by.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+from . import BUILD_DIR
+
+CACHE_DIR = BUILD_DIR / 'render-cache'
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def cache_key(fig_json: str, fmt: str, width=None, height=None, scale=None) -> str:
+    canonical = json.dumps(json.loads(fig_json), sort_keys=True, separators=(',', ':'))
+    digest = hashlib.sha256(canonical.encode('utf-8'))
+    digest.update(f'|{fmt}|{width}|{height}|{scale}'.encode())
+    return digest.hexdigest()
+
+
+class RenderCache:
+    def __init__(self, root: Path = CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[int, float]] = {}  # file name -> (size, last used)
+        self.root.mkdir(parents=True, exist_ok=True)
+        for path in self.root.iterdir():
+            if path.is_file() and not path.name.endswith('.tmp'):
+                st = path.stat()
+                self._entries[path.name] = (st.st_size, st.st_mtime)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(size for size, _ in self._entries.values())
+
+    def _path(self, key: str, fmt: str) -> Path:
+        return self.root / f'{key}.{fmt}'
+
+    def __contains__(self, entry: tuple[str, str]) -> bool:
+        """Whether ``(key, fmt)`` is cached, without counting a hit or a miss."""
+        path = self._path(*entry)
+        with self._lock:
+            return path.name in self._entries and path.exists()
+
+    def miss(self, count: int = 1) -> None:
+        """Count images looked up elsewhere and not served from the cache."""
+        with self._lock:
+            self.misses += count
+
+    def get(self, key: str, fmt: str) -> Path | None:
+        """Path of the cached image, or ``None``; counts a hit or a miss."""
+        path = self._path(key, fmt)
+        with self._lock:
+            entry = self._entries.get(path.name)
+            if entry is None or not path.exists():
+                self._entries.pop(path.name, None)
+                self.misses += 1
+                return None
+            self.hits += 1
+            os.utime(path)
+            self._entries[path.name] = (entry[0], path.stat().st_mtime)
+        return path
+
+    def put(self, key: str, fmt: str, data: bytes | None = None, source: Path | str | None = None):
+        """Store image bytes, or a copy of the file at ``source``."""
+        path = self._path(key, fmt)
+        # A temp name of its own: workers may put the same image at the same time
+        fh = tempfile.NamedTemporaryFile(dir=self.root, prefix=path.name + '.', suffix='.tmp', delete=False)
+        tmp = Path(fh.name)
+        try:
+            with fh:
+                if data is not None:
+                    fh.write(data)
+            if data is None:
+                shutil.copyfile(source, tmp)
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        st = path.stat()
+        with self._lock:
+            self._entries[path.name] = (st.st_size, st.st_mtime)
+            self._evict()
+
+    def _evict(self):
+        total = self.total_bytes
+        if total <= self.max_bytes:
+            return
+        for name, (size, _) in sorted(self._entries.items(), key=lambda item: item[1][1]):
+            if total <= self.max_bytes:
+                break
+            (self.root / name).unlink(missing_ok=True)
+            del self._entries[name]
+            total -= size
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else None,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+            }
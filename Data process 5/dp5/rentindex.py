@@ -0,0 +1,185 @@
+"""ZIP x bedroom x month rent index from listing- or unit-level observations.
+
+Observations are CSV (optionally gzipped) or Parquet files under
+``Data process 5/observations/rents/``, which dataset discovery skips. Each
+row is one rent, with columns found by name (``OBSERVATION_COLUMNS``): a ZIP
+code, a bedroom type (``0``/``studio``, ``1``, ``'2 bd'``, ``'3-Bedroom'``;
+4 and up count as ``4BR``, anything unreadable only counts toward ``All``), a
+date or month, and the monthly rent. Rents outside ``RENT_RANGE`` are dropped.
+
+``rent_index`` computes, for every ZIP, bedroom type (plus ``All``) and month
+with observations, its count, median, ``TRIM`` trimmed mean and quartiles.
+All cells are computed together: the rents are sorted once by cell and value,
+so a median or quartile is an index into each cell's run, and the trimmed mean
+is one ``bincount`` over the ranks that survive the cut. ``tier`` places each
+ZIP's median among all ZIPs with the same bedroom type and month:
+``TIER_QUANTILES`` splits them into ``TIERS`` from cheapest to dearest.
+
+The ``rentindex`` stage writes ``derived/rentindex/rent_index.csv``, sorted and
+unique by ``zip, bedrooms, month``. Without observation files it indexes
+``houston_zip_code_rents_2025`` (one average per ZIP, ``All`` only) as of
+``SNAPSHOT_MONTH``, so the table and its consumers keep working.
+``latest_by_bedroom`` gives each ZIP's latest medians by bedroom type, which
+``dp5.dbload`` loads into ``RentalMarket.avgRentStudio`` to ``avgRent4BR`` and
+``avgRentAll``.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from . import DATA_ROOT
+from .datasets import DERIVED_DIR, Dataset, discover_datasets, read_dataset
+from .values import _snake
+
+OBSERVATIONS_DIR = DATA_ROOT / 'observations' / 'rents'
+RENTINDEX_DIR = DERIVED_DIR / 'rentindex'
+
+BEDROOMS = ('Studio', '1BR', '2BR', '3BR', '4BR', 'All')
+# Observation column role -> accepted column names (snake_case)
+OBSERVATION_COLUMNS = {
+    'zip': ('zip', 'zip_code', 'zipcode', 'postal_code'),
+    'bedrooms': ('bedrooms', 'beds', 'bedroom_type', 'unit_type'),
+    'month': ('month', 'date', 'observed', 'listed_date', 'list_date'),
+    'rent': ('rent', 'monthly_rent', 'asking_rent', 'price'),
+}
+RENT_RANGE = (200.0, 25000.0)  # plausible monthly rents; the rest are typos or sale prices
+TRIM = 0.1  # share cut from each end for the trimmed mean
+TIER_QUANTILES = (0.25, 0.5, 0.75)
+TIERS = ('C', 'B', 'A', 'A-1')
+SNAPSHOT_MONTH = '2025-01'
+SNAPSHOT_DATASET = 'houston_zip_code_rents_2025'
+
+
+# -- observations ----------------------------------------------------------
+
+def _bedroom_codes(values: pd.Series) -> np.ndarray:
+    """Index into ``BEDROOMS`` per value, -1 when unreadable; each distinct value is parsed once."""
+    labels, uniques = pd.factorize(values.astype('string').str.strip().str.lower())
+    text = pd.Series(uniques, dtype='string')
+    count = pd.to_numeric(text.str.extract(r'^(\d+)', expand=False), errors='coerce')
+    count = count.mask(text.str.contains(r'studio|efficiency', regex=True), 0)
+    codes = np.where(count.notna(), np.minimum(count.fillna(0), 4), -1).astype(np.int8)
+    return np.where(labels >= 0, codes[labels] if len(codes) else -1, -1)
+
+
+def normalize_observations(frame: pd.DataFrame) -> pd.DataFrame:
+    """``zip``, ``bedrooms`` (code into ``BEDROOMS``, -1 unknown), ``month``
+    (monthly ``Period``) and ``rent`` from a frame of raw observations."""
+    by_snake = {_snake(str(c)): c for c in frame.columns}
+    roles = {}
+    for role, names in OBSERVATION_COLUMNS.items():
+        found = [by_snake[n] for n in names if n in by_snake]
+        if not found and role != 'bedrooms':
+            raise ValueError(f'rent observations need a {role} column (one of {", ".join(names)})')
+        roles[role] = found[0] if found else None
+    # ZIPs and months repeat: parse each distinct value once
+    labels, names = pd.factorize(frame[roles['month']].astype(str))
+    months = pd.PeriodIndex(pd.to_datetime(names, format='mixed'), freq='M')
+    zip_labels, zip_names = pd.factorize(frame[roles['zip']].astype(str))
+    zips = pd.Series(zip_names, dtype='string').str.extract(r'(\d{5})', expand=False).to_numpy(object)
+    out = pd.DataFrame({
+        'zip': pd.array(np.where(zip_labels >= 0, zips[zip_labels] if len(zips) else None, None), dtype='string'),
+        'bedrooms': (_bedroom_codes(frame[roles['bedrooms']]) if roles['bedrooms'] is not None
+                     else np.full(len(frame), -1, np.int8)),
+        'month': months[labels] if len(frame) else months,
+        'rent': pd.to_numeric(frame[roles['rent']], errors='coerce'),
+    })
+    keep = out['zip'].notna() & out['rent'].between(*RENT_RANGE)
+    return out[keep].reset_index(drop=True)
+
+
+def _observation_files(directory: Path) -> list[Path]:
+    if not directory.is_dir():
+        return []
+    return sorted(p for p in directory.rglob('*') if p.is_file() and p.name.endswith(('.csv', '.csv.gz', '.parquet')))
+
+
+def _snapshot(datasets: dict[str, Dataset]) -> pd.DataFrame:
+    frame = read_dataset(datasets[SNAPSHOT_DATASET])
+    return pd.DataFrame({'zip': frame['Zip_Code'], 'month': SNAPSHOT_MONTH, 'rent': frame['Average_Rent']})
+
+
+def load_observations(directory: Path = OBSERVATIONS_DIR,
+                      datasets: dict[str, Dataset] | None = None) -> pd.DataFrame:
+    """Every observation file, normalized; the ZIP snapshot when there are none."""
+    files = _observation_files(directory)
+    if not files:
+        datasets = datasets if datasets is not None else discover_datasets()
+        return normalize_observations(_snapshot(datasets))
+    frames = [pd.read_parquet(p) if p.suffix == '.parquet' else pd.read_csv(p) for p in files]
+    return pd.concat([normalize_observations(f) for f in frames], ignore_index=True)
+
+
+# -- index -----------------------------------------------------------------
+
+def _quantile(values: np.ndarray, starts: np.ndarray, counts: np.ndarray, q: float) -> np.ndarray:
+    """Linear-interpolated quantile of each sorted run ``values[start:start + count]``."""
+    position = (counts - 1) * q
+    low = np.floor(position).astype(np.int64)
+    high = np.minimum(low + 1, counts - 1)
+    fraction = position - low
+    return values[starts + low] * (1 - fraction) + values[starts + high] * fraction
+
+
+def rent_index(observations: pd.DataFrame, trim: float = TRIM) -> pd.DataFrame:
+    """One row per ZIP, bedroom type and month with its rent statistics and tier."""
+    every = BEDROOMS.index('All')
+    known = observations['bedrooms'].to_numpy() >= 0
+    # Each observation counts for its bedroom type and for All
+    zip_codes, zips = pd.factorize(observations['zip'], sort=True)
+    month_codes, months = pd.factorize(observations['month'], sort=True)
+    zip_codes = np.r_[zip_codes[known], zip_codes]
+    month_codes = np.r_[month_codes[known], month_codes]
+    bedrooms = np.r_[observations['bedrooms'].to_numpy()[known], np.full(len(observations), every)]
+    rents = np.r_[observations['rent'].to_numpy(float)[known], observations['rent'].to_numpy(float)]
+
+    cells = (zip_codes.astype(np.int64) * len(BEDROOMS) + bedrooms) * max(len(months), 1) + month_codes
+    # rents first, then a stable sort by cell: faster than ``lexsort`` on both keys
+    order = np.argsort(rents)
+    order = order[np.argsort(cells[order], kind='stable')]
+    cells, rents = cells[order], rents[order]
+    starts = np.flatnonzero(np.r_[True, cells[1:] != cells[:-1]]) if len(cells) else np.zeros(0, np.int64)
+    counts = np.diff(np.r_[starts, len(cells)])
+
+    run = np.repeat(np.arange(len(starts)), counts)
+    rank = np.arange(len(cells)) - starts[run]
+    cut = np.floor(counts * trim).astype(np.int64)
+    kept = (rank >= cut[run]) & (rank < (counts - cut)[run])
+    trimmed = np.bincount(run[kept], rents[kept], len(starts)) / (counts - 2 * cut)
+
+    cell = cells[starts]
+    month = cell % max(len(months), 1)
+    bedroom = cell // max(len(months), 1) % len(BEDROOMS)
+    out = pd.DataFrame({
+        'zip': zips[cell // max(len(months), 1) // len(BEDROOMS)],
+        'bedrooms': pd.Categorical.from_codes(bedroom, BEDROOMS),
+        'month': months[month].astype(str) if len(months) else pd.Series([], dtype=str),
+        'observations': counts,
+        'median': _quantile(rents, starts, counts, 0.5),
+        'trimmed_mean': trimmed,
+        'p25': _quantile(rents, starts, counts, 0.25),
+        'p75': _quantile(rents, starts, counts, 0.75),
+    })
+    percentile = out.groupby(['bedrooms', 'month'], observed=True)['median'].rank(pct=True)
+    out['tier'] = pd.Categorical.from_codes(np.searchsorted(TIER_QUANTILES, percentile.to_numpy(), side='left'), TIERS)
+    return out
+
+
+def latest_by_bedroom(index: pd.DataFrame, value: str = 'median') -> pd.DataFrame:
+    """Each ZIP's ``value`` for its latest month, one column per bedroom type."""
+    latest = index[index['month'] == index.groupby('zip')['month'].transform('max')]
+    return latest.pivot(index='zip', columns='bedrooms', values=value).reindex(columns=list(BEDROOMS))
+
+
+def build_rent_index(datasets: dict[str, Dataset] | None = None, directory: Path = OBSERVATIONS_DIR,
+                     out_dir: Path = RENTINDEX_DIR) -> dict[str, int]:
+    """Write ``rent_index.csv``; returns the observation, ZIP, month and row counts."""
+    observations = load_observations(directory, datasets)
+    index = rent_index(observations)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    index.to_csv(out_dir / 'rent_index.csv', index=False, float_format='%.2f')
+    return {'observations': len(observations), 'zips': index['zip'].nunique(),
+            'months': index['month'].nunique(), 'rows': len(index)}
@@ -0,0 +1,143 @@
+"""Parallel execution of the script graph.
+
+Each script runs in its own interpreter with the script's folder as working
+directory, exactly as it would when launched by hand. Up to ``jobs`` scripts
+run at once; a script is started as soon as everything it depends on has
+succeeded, so wall-clock time approaches the longest dependency chain.
+"""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+
+from . import BUILD_DIR, DATA_ROOT
+from .graph import Script
+from .manifest import Manifest, order_only_deps
+
+LOG_DIR = BUILD_DIR / 'logs'
+COLUMNAR_ENV = 'DP5_COLUMNAR'  # set to have scripts write and read the columnar twins
+PROFILE_ENV = 'DP5_PROFILE'  # directory scripts write their profiles to (see dp5.profiling)
+IMAGE_SUFFIXES = {'.png', '.jpg', '.jpeg', '.webp', '.svg', '.pdf'}
+
+
+@dataclass
+class ScriptResult:
+    script: Script
+    status: str  # ok, cached, failed, skipped
+    seconds: float = 0.0
+    returncode: int | None = None
+    log: str | None = None
+
+
+def _log_path(script: Script):
+    return LOG_DIR / (script.key.replace('/', '__') + '.log')
+
+
+def renders_images(script: Script) -> bool:
+    return any(path.suffix.lower() in IMAGE_SUFFIXES for path in script.outputs)
+
+
+def run_script(script: Script, render_env: dict[str, str] | None = None, columnar: bool = False,
+               profile_dir=None) -> ScriptResult:
+    """Run one script in a fresh interpreter and capture its output to a log.
+
+    ``render_env`` points scripts that write images at a running render service;
+    ``columnar`` turns on the Parquet/Arrow twins of the CSVs it touches;
+    ``profile_dir`` profiles it into that directory.
+    """
+    log_path = _log_path(script)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE='1', PYTHONIOENCODING='utf-8')
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(DATA_ROOT), env.get('PYTHONPATH')]))
+    if render_env and renders_images(script):
+        env.update(render_env)
+    if columnar:
+        env[COLUMNAR_ENV] = '1'
+    if profile_dir is not None:
+        env[PROFILE_ENV] = str(profile_dir)
+    start = time.perf_counter()
+    with open(log_path, 'w', encoding='utf-8') as log:
+        proc = subprocess.run(
+            [sys.executable, '-m', 'dp5.bootstrap', script.name],
+            cwd=script.folder,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            env=env,
+        )
+    elapsed = time.perf_counter() - start
+    status = 'ok' if proc.returncode == 0 else 'failed'
+    return ScriptResult(script, status, elapsed, proc.returncode, str(log_path))
+
+
+def incremental(manifest: Manifest, deps: dict[Script, set[Script]], execute=run_script, force=False):
+    """Wrap ``execute`` so scripts whose fingerprint is unchanged are not re-run.
+
+    With ``force`` every script runs, but the manifest is still refreshed.
+    """
+    def run(script: Script) -> ScriptResult:
+        start = time.perf_counter()
+        fingerprint = manifest.fingerprint(script, order_only_deps(script, deps[script]))
+        if not force and manifest.is_fresh(script, fingerprint):
+            return ScriptResult(script, 'cached', time.perf_counter() - start)
+        result = execute(script)
+        if result.status == 'ok':
+            manifest.record(script, fingerprint)
+        else:
+            manifest.forget(script)
+        return result
+    return run
+
+
+def run_graph(deps: dict[Script, set[Script]], jobs: int | None = None, execute=run_script,
+              on_result=None) -> list[ScriptResult]:
+    """Run every script in ``deps`` respecting its dependencies.
+
+    ``execute`` is called once per script and must return a ``ScriptResult``.
+    Scripts downstream of a failure are reported as skipped.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    pending = {script: set(needed) for script, needed in deps.items()}
+    results: list[ScriptResult] = []
+    failed: set[Script] = set()
+    running: dict[Future, Script] = {}
+
+    def finish(result: ScriptResult):
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            changed = True
+            while changed:
+                changed = False
+                for script in sorted(pending, key=lambda s: s.key):
+                    needed = pending[script]
+                    if needed & failed:
+                        del pending[script]
+                        failed.add(script)
+                        finish(ScriptResult(script, 'skipped'))
+                        changed = True
+                    elif not needed:
+                        del pending[script]
+                        running[pool.submit(execute, script)] = script
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                script = running.pop(future)
+                try:
+                    result = future.result()
+                except Exception as exc:  # a runner bug should not hang the graph
+                    result = ScriptResult(script, 'failed', log=repr(exc))
+                if result.status == 'failed':
+                    failed.add(script)  # stays in its dependents' sets, which skips them
+                else:
+                    for other in pending.values():
+                        other.discard(script)
+                finish(result)
+    return results
@@ -0,0 +1,46 @@
+"""Post-build stages that derive artifacts from the script outputs.
+
+Stages run in the listed order after the script graph, in the runner's own
+process. They are referenced as ``module:function`` and imported lazily so
+that commands which do not need pandas never import it.
+"""
+from __future__ import annotations
+
+import importlib
+import time
+
+STAGES = {
+    'charts': 'dp5.chartspec:render_charts',
+    'interactive': 'dp5.interactive:export_interactive',
+    'typed': 'dp5.values:build_typed',
+    'columnar': 'dp5.columnar:build_columnar',
+    'facts': 'dp5.facts:build_facts',
+    'warehouse': 'dp5.warehouse:build_warehouse',
+    'timeseries': 'dp5.timeseries:build_timeseries',
+    'rentindex': 'dp5.rentindex:build_rent_index',
+    'strsim': 'dp5.strsim:build_str_simulation',
+    'strcalendar': 'dp5.strcalendar:build_str_calendar',
+    'cohort': 'dp5.cohort:build_cohort',
+    'valuation': 'dp5.valuation:build_valuation',
+    'changes': 'dp5.changes:build_changes',
+}
+
+
+def load_stage(name: str):
+    module, func = STAGES[name].split(':')
+    return getattr(importlib.import_module(module), func)
+
+
+def run_stages(names=None, on_result=None, options=None) -> list[tuple[str, float, object]]:
+    """Run the named stages (all by default), each with its keyword arguments in
+    ``options`` (by stage name); returns ``(name, seconds, result)``."""
+    options = options or {}
+    results = []
+    for name in names or STAGES:
+        start = time.perf_counter()
+        result = load_stage(name)(**options.get(name, {}))
+        entry = (name, time.perf_counter() - start, result)
+        results.append(entry)
+        if on_result is not None:
+            on_result(entry)
+    return results
@@ -0,0 +1,188 @@
+"""Night-by-night short-term rental calendars, bit-packed.
+
+``simulate_calendar`` books a year of nights for every listing in the market
+(by default as many as the largest provider count in
+``houston_str_market_data``, 20,161) and keeps the result as one bit per
+listing-night: ``np.packbits`` over the days, 46 bytes a listing, under 1 MB
+for the whole market where a boolean DataFrame would take hundreds.
+
+Listings are split evenly across the neighborhoods of
+``houston_neighborhoods_performance``. Each gets its own occupancy (Beta around
+the neighborhood's, spread as in ``dp5.strsim``) and ADR (lognormal likewise).
+A night is booked with probability occupancy x the day's demand factor:
+``SEASONALITY`` by month (the STR report: peaks in March and May, January the
+weakest) and ``WEEKEND_LIFT`` on Friday and Saturday nights, scaled so the year
+averages the listing's occupancy. For busy listings the peak nights would pass
+1; ``booking_chance`` caps them there and scales the other nights up so the
+year still averages the occupancy. Nightly rates move with demand by
+``ADR_SEASONAL_SHARE`` of the seasonal swing, and weekend nights earn
+``WEEKEND_PREMIUM``.
+
+Because the rate of a night only depends on the listing, the month and
+whether it is a weekend, revenue needs no per-night arithmetic: masks of the
+weekday and weekend nights of each month are ANDed with the packed calendars
+and the set bits counted (``np.bitwise_count``, or a byte lookup table), giving
+booked nights per listing, month and day type. ``monthly_summary`` sums those
+by neighborhood tier into occupancy, ADR, revenue and RevPAR per month; the
+``strcalendar`` stage writes it to ``derived/strcalendar/monthly_by_tier.csv``.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from .datasets import DERIVED_DIR, Dataset, discover_datasets, read_dataset
+from .strsim import Market, _beta_parameters, load_market
+
+STRCALENDAR_DIR = DERIVED_DIR / 'strcalendar'
+YEAR = 2026  # first year under the registration ordinance
+SEED = 2026
+CHUNK = 4096  # listings drawn at a time; bounds the unpacked working set
+
+# Relative demand by month; rescaled to average 1 over the year
+SEASONALITY = (0.80, 0.95, 1.15, 1.05, 1.12, 1.02, 1.00, 0.93, 0.92, 1.00, 0.98, 0.88)
+WEEKEND_LIFT = 1.15  # demand on Friday and Saturday nights relative to other nights
+WEEKEND_PREMIUM = 1.15  # weekend nightly rate relative to weekday
+ADR_SEASONAL_SHARE = 0.5  # share of the seasonal demand swing passed into nightly rates
+
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def _bit_count(packed: np.ndarray) -> np.ndarray:
+    if hasattr(np, 'bitwise_count'):  # numpy >= 2.0
+        return np.bitwise_count(packed)
+    return _POPCOUNT[packed]
+
+
+@dataclass
+class Calendar:
+    booked: np.ndarray  # listings x ceil(days / 8) uint8, bit d set when night d is booked
+    days: int
+    neighborhood: np.ndarray  # listing -> index into neighborhoods
+    adr: np.ndarray  # listing's base nightly rate
+    neighborhoods: tuple[str, ...]
+    tiers: tuple[str, ...]  # per neighborhood
+
+    @property
+    def nbytes(self) -> int:
+        return self.booked.nbytes + self.neighborhood.nbytes + self.adr.nbytes
+
+    def nights(self) -> np.ndarray:
+        """Booked nights per listing, ``(listings, 12, 2)``: by month, weekday then weekend."""
+        masks = np.packbits(_day_masks(self.days), axis=-1)  # 12 x 2 x bytes
+        out = np.empty((len(self.booked), 12, 2), dtype=np.uint16)
+        for start in range(0, len(self.booked), CHUNK):
+            chunk = self.booked[start:start + CHUNK, None, None, :] & masks
+            out[start:start + CHUNK] = _bit_count(chunk).sum(axis=-1, dtype=np.uint16)
+        return out
+
+
+def _calendar_days(year: int = YEAR):
+    import pandas as pd
+    days = pd.date_range(f'{year}-01-01', f'{year}-12-31', freq='D')
+    return days.month.to_numpy() - 1, np.isin(days.dayofweek, [4, 5])  # Friday and Saturday nights
+
+
+def _day_masks(days: int, year: int = YEAR) -> np.ndarray:
+    """``(12, 2, days)`` booleans: the weekday and weekend nights of each month."""
+    month, weekend = _calendar_days(year)
+    by_month = month[None, :] == np.arange(12)[:, None]
+    return np.stack([by_month & ~weekend, by_month & weekend], axis=1)[..., :days]
+
+
+def demand_factors(year: int = YEAR) -> tuple[np.ndarray, np.ndarray]:
+    """Per-night booking and rate multipliers for ``year``, booking averaging 1."""
+    month, weekend = _calendar_days(year)
+    season = np.asarray(SEASONALITY)[month]
+    demand = season * np.where(weekend, WEEKEND_LIFT, 1.0)
+    rate = (1 + ADR_SEASONAL_SHARE * (season / season.mean() - 1)) * np.where(weekend, WEEKEND_PREMIUM, 1.0)
+    return demand / demand.mean(), rate / rate.mean()
+
+
+def booking_chance(occupancy: np.ndarray, demand: np.ndarray) -> np.ndarray:
+    """``(listings, nights)`` booking probabilities ``min(scale x demand, 1)``,
+    with each listing's scale chosen so its probabilities average its occupancy."""
+    # With the j highest-demand nights capped at 1 the rest must sum to
+    # occupancy x nights - j; the scale is that over their demand, for the
+    # fewest j that leave the highest remaining night at or under 1.
+    ranked = np.sort(demand)[::-1]
+    rest = np.cumsum(ranked[::-1])[::-1]
+    capped = np.arange(len(demand))
+    scale = (occupancy[:, None] * len(demand) - capped) / rest
+    first = (scale * ranked <= 1).argmax(axis=1)
+    scale = scale[np.arange(len(occupancy)), first]
+    return np.minimum(scale[:, None] * demand[None, :], 1)
+
+
+def simulate_calendar(market: Market | None = None, listings: int | None = None, seed: int = SEED,
+                      year: int = YEAR, datasets: dict[str, Dataset] | None = None) -> Calendar:
+    """Book a year of nights for ``listings`` listings (the largest provider count by default)."""
+    datasets = datasets if datasets is not None else discover_datasets()
+    market = market if market is not None else load_market(datasets)
+    if listings is None:
+        listings = int(read_dataset(datasets['houston_str_market_data'])['Active_Listings'].max())
+    hoods = read_dataset(datasets['houston_neighborhoods_performance'])
+    tiers = tuple(hoods.set_index('Neighborhood')['Market_Tier'].reindex(market.neighborhoods).fillna(''))
+
+    rng = np.random.default_rng(seed)
+    neighborhood = (np.arange(listings) * len(market.neighborhoods) // listings).astype(np.int16)
+    a, b = _beta_parameters(market.occupancy, market.occupancy_cv)
+    occupancy = rng.beta(a[neighborhood], b[neighborhood]).astype(np.float32)
+    sigma = math.sqrt(math.log1p(market.adr_cv ** 2))
+    adr = rng.lognormal(np.log(market.adr[neighborhood]) - sigma ** 2 / 2, sigma).astype(np.float32)
+
+    demand, _ = demand_factors(year)
+    demand = demand.astype(np.float32)
+    booked = np.empty((listings, math.ceil(len(demand) / 8)), dtype=np.uint8)
+    for start in range(0, listings, CHUNK):
+        stop = min(start + CHUNK, listings)
+        chance = booking_chance(occupancy[start:stop], demand)
+        booked[start:stop] = np.packbits(rng.random(chance.shape, dtype=np.float32) < chance, axis=1)
+    return Calendar(booked, len(demand), neighborhood, adr, market.neighborhoods, tiers)
+
+
+def monthly_summary(calendar: Calendar, by: str = 'tier', year: int = YEAR):
+    """Listings, nights, occupancy, ADR, revenue and RevPAR per ``by``
+    (``'tier'`` or ``'neighborhood'``) and month."""
+    import pandas as pd
+    nights = calendar.nights().astype(np.float64)  # listings x 12 x (weekday, weekend)
+    month, weekend = _calendar_days(year)
+    _, rate = demand_factors(year)
+    # nightly rate of a listing in (month, day type) = adr x mean rate factor of those nights
+    factor = np.zeros((12, 2))
+    np.add.at(factor, (month, weekend.astype(int)), rate)
+    factor /= np.maximum(np.bincount(month * 2 + weekend, minlength=24).reshape(12, 2), 1)
+    revenue = (nights * factor[None] * calendar.adr[:, None, None]).sum(axis=-1)  # listings x 12
+    booked = nights.sum(axis=-1)
+
+    labels = np.asarray(calendar.tiers if by == 'tier' else calendar.neighborhoods)[calendar.neighborhood]
+    codes, groups = pd.factorize(labels, sort=True)
+    available = np.bincount(month, minlength=12)[None, :] * np.bincount(codes, minlength=len(groups))[:, None]
+    sums = {name: np.stack([np.bincount(codes, values[:, m], len(groups)) for m in range(12)], axis=1)
+            for name, values in (('booked', booked), ('revenue', revenue))}
+    out = pd.DataFrame({
+        by: np.repeat(groups, 12),
+        'month': np.tile([f'{year}-{m:02d}' for m in range(1, 13)], len(groups)),
+        'listings': np.repeat(np.bincount(codes, minlength=len(groups)), 12),
+        'available_nights': available.ravel(),
+        'booked_nights': sums['booked'].ravel().astype(np.int64),
+        'revenue': sums['revenue'].ravel(),
+    })
+    out['occupancy'] = out['booked_nights'] / out['available_nights']
+    out['adr'] = out['revenue'] / out['booked_nights'].where(out['booked_nights'] > 0)
+    out['revpar'] = out['revenue'] / out['available_nights']
+    return out
+
+
+def build_str_calendar(datasets: dict[str, Dataset] | None = None, listings: int | None = None,
+                       out_dir=STRCALENDAR_DIR) -> dict[str, int]:
+    """Write ``monthly_by_tier.csv`` and ``monthly_by_neighborhood.csv``; returns
+    the listing count and the packed calendar's size in bytes."""
+    datasets = datasets if datasets is not None else discover_datasets()
+    calendar = simulate_calendar(listings=listings, datasets=datasets)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for by in ('tier', 'neighborhood'):
+        monthly_summary(calendar, by).to_csv(out_dir / f'monthly_by_{by}.csv', index=False, float_format='%.4f')
+    return {'listings': len(calendar.booked), 'bytes': calendar.nbytes}
@@ -0,0 +1,151 @@
+"""Monte Carlo annual revenue of a short-term rental, by neighborhood.
+
+The providers in ``houston_str_market_data`` disagree: occupancy from 43% to
+59% and ADR from $127 to $279. The simulator treats that spread as the
+uncertainty around each neighborhood's figures in
+``houston_neighborhoods_performance``. Per draw:
+
+- occupancy ~ Beta with the neighborhood's mean and the providers'
+  coefficient of variation;
+- ADR ~ lognormal with the neighborhood's mean and the providers' CV;
+- revenue = occupancy x ``NIGHTS`` x ADR - the city registration fee
+  (``Registration Fee`` in ``houston_str_market_summary``, $275 a year from
+  2026), so a net figure.
+
+Occupancy and ADR are drawn independently. Draws are generated as arrays of
+neighborhoods by draws, in shards of ``SHARD`` draws per neighborhood, each
+shard seeded from ``SeedSequence(seed).spawn``. The shards are the same
+whatever ``workers`` is, so sharding them across processes changes how fast
+the result comes, not what it is.
+
+The ``strsim`` stage writes ``derived/strsim/revenue_percentiles.csv``: per
+neighborhood and for all of them pooled, the mean and ``PERCENTILES`` of net
+revenue for ``DEFAULT_DRAWS`` draws in total, next to the reported average.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from .datasets import DERIVED_DIR, Dataset, discover_datasets, read_dataset
+
+STRSIM_DIR = DERIVED_DIR / 'strsim'
+NIGHTS = 365
+PERCENTILES = (5, 10, 25, 50, 75, 90, 95)
+DEFAULT_DRAWS = 1_000_000  # in total, split evenly across neighborhoods
+SHARD = 1 << 16  # draws per neighborhood in one shard
+SEED = 2026
+DEFAULT_FEE = 275.0  # used when the market summary does not state the fee
+
+
+@dataclass(frozen=True)
+class Market:
+    neighborhoods: tuple[str, ...]
+    occupancy: np.ndarray  # mean share of nights booked, 0-1
+    adr: np.ndarray  # mean average daily rate, USD
+    reported_revenue: np.ndarray
+    occupancy_cv: float  # spread of the providers' figures, std / mean
+    adr_cv: float
+    fee: float  # annual registration fee, USD
+
+
+def _cv(values) -> float:
+    values = np.asarray(values, dtype=float)
+    return float(values.std(ddof=1) / values.mean())
+
+
+def registration_fee(datasets: dict[str, Dataset]) -> float:
+    import pandas as pd
+    from .values import parse_values
+    if 'houston_str_market_summary' not in datasets:
+        return DEFAULT_FEE
+    summary = read_dataset(datasets['houston_str_market_summary'])
+    row = summary[summary['Metric'].str.strip().str.lower() == 'registration fee']
+    value = parse_values(row['Value'].astype('string'))['value'] if len(row) else pd.Series([], dtype=float)
+    return float(value.iloc[0]) if len(value) and pd.notna(value.iloc[0]) else DEFAULT_FEE
+
+
+def load_market(datasets: dict[str, Dataset] | None = None) -> Market:
+    datasets = datasets if datasets is not None else discover_datasets()
+    hoods = read_dataset(datasets['houston_neighborhoods_performance'])
+    providers = read_dataset(datasets['houston_str_market_data'])
+    return Market(
+        neighborhoods=tuple(hoods['Neighborhood']),
+        occupancy=hoods['Occupancy_Rate'].to_numpy(float) / 100,
+        adr=hoods['Average_Daily_Rate'].to_numpy(float),
+        reported_revenue=hoods['Average_Annual_Revenue'].to_numpy(float),
+        occupancy_cv=_cv(providers['Occupancy_Rate']),
+        adr_cv=_cv(providers['Average_Daily_Rate']),
+        fee=registration_fee(datasets),
+    )
+
+
+def _beta_parameters(mean: np.ndarray, cv: float) -> tuple[np.ndarray, np.ndarray]:
+    """Beta ``a, b`` with the given means and coefficient of variation (method
+    of moments); the variance is capped below the largest a Beta can have."""
+    variance = np.minimum((cv * mean) ** 2, 0.99 * mean * (1 - mean))
+    concentration = mean * (1 - mean) / variance - 1
+    return mean * concentration, (1 - mean) * concentration
+
+
+def simulate_shard(market: Market, seed: np.random.SeedSequence, draws: int) -> np.ndarray:
+    """Net revenue, neighborhoods by ``draws``, from one shard's generator."""
+    rng = np.random.default_rng(seed)
+    shape = (len(market.neighborhoods), draws)
+    a, b = _beta_parameters(market.occupancy, market.occupancy_cv)
+    occupancy = rng.beta(a[:, None], b[:, None], size=shape)
+    sigma = math.sqrt(math.log1p(market.adr_cv ** 2))
+    adr = rng.lognormal((np.log(market.adr) - sigma ** 2 / 2)[:, None], sigma, size=shape)
+    revenue = occupancy * adr
+    revenue *= NIGHTS
+    revenue -= market.fee
+    return revenue
+
+
+def _shards(draws: int, seed: int) -> list[tuple[np.random.SeedSequence, int]]:
+    count = max(math.ceil(draws / SHARD), 1)
+    sizes = [SHARD] * (count - 1) + [draws - SHARD * (count - 1)]
+    return list(zip(np.random.SeedSequence(seed).spawn(count), sizes))
+
+
+def simulate(market: Market, draws: int = DEFAULT_DRAWS, seed: int = SEED, workers: int = 1) -> np.ndarray:
+    """Net revenue, neighborhoods by draws, ``draws`` in total. ``workers`` > 1
+    runs the shards in that many processes; the result is the same."""
+    per_neighborhood = max(math.ceil(draws / len(market.neighborhoods)), 1)
+    shards = _shards(per_neighborhood, seed)
+    if workers <= 1 or len(shards) == 1:
+        parts = [simulate_shard(market, shard_seed, size) for shard_seed, size in shards]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import get_context
+        with ProcessPoolExecutor(min(workers, len(shards)), mp_context=get_context('spawn')) as pool:
+            parts = list(pool.map(simulate_shard, *zip(*((market, s, n) for s, n in shards))))
+    return np.concatenate(parts, axis=1)
+
+
+def revenue_percentiles(market: Market, revenue: np.ndarray, percentiles=PERCENTILES):
+    """Mean and percentiles of net revenue per neighborhood, then pooled."""
+    import pandas as pd
+    stats = np.percentile(revenue, percentiles, axis=1).T
+    pooled = np.percentile(revenue, percentiles)
+    out = pd.DataFrame(np.vstack([stats, pooled]), columns=[f'p{p}' for p in percentiles])
+    out.insert(0, 'neighborhood', [*market.neighborhoods, 'All neighborhoods'])
+    out.insert(1, 'draws', revenue.shape[1])
+    out.loc[len(market.neighborhoods), 'draws'] = revenue.size
+    out.insert(2, 'mean', np.r_[revenue.mean(axis=1), revenue.mean()])
+    out['reported'] = np.r_[market.reported_revenue, market.reported_revenue.mean()]
+    out['fee'] = market.fee
+    return out
+
+
+def build_str_simulation(datasets: dict[str, Dataset] | None = None, draws: int = DEFAULT_DRAWS,
+                         seed: int = SEED, workers: int = 1, out_dir=STRSIM_DIR) -> dict[str, int]:
+    """Write ``revenue_percentiles.csv``; returns the neighborhood and draw counts."""
+    market = load_market(datasets)
+    revenue = simulate(market, draws, seed, workers)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    revenue_percentiles(market, revenue).to_csv(out_dir / 'revenue_percentiles.csv', index=False,
+                                                float_format='%.0f')
+    return {'neighborhoods': len(market.neighborhoods), 'draws': revenue.size}
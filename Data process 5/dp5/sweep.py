@@ -0,0 +1,156 @@
+"""Parameter sweeps of the cohort projection across a process pool.
+
+The notes in ``migration_projections_2030`` ("May decline due to policy
+changes", "Continuing outflow to suburbs") are ranges, not numbers. ``grid``
+turns value ranges of the ``dp5.cohort.Scenario`` multipliers into every
+combination of them, for example international migration from -50% to -0%
+(``international`` 0.5 to 1) by domestic outflow from half to one and a half
+times today's. ``run_sweep`` projects them in chunks of ``CHUNK`` scenarios, in
+``workers`` processes:
+
+- with ``out``, each chunk's rows (scenario, its multipliers, county, year and
+  ``MEASURES``) are appended to one Parquet file as a row group as soon as the
+  chunk finishes, so the sweep's rows are never all in memory; at most twice
+  ``workers`` chunks are pending at a time;
+- with ``summary``, only the ``FAN_MEASURES`` are kept, as a
+  ``scenarios x counties x years`` array, and the result is their
+  ``FAN_PERCENTILES`` per county and year: the data of a fan chart.
+
+Rows arrive in the order chunks finish; ``scenario`` is the row number in the
+grid, so the file sorts back into grid order.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .cohort import YEARS, Regions, Scenario, load_regions, projection_frame
+from .datasets import DERIVED_DIR
+
+SWEEP_DIR = DERIVED_DIR / 'sweep'
+CHUNK = 256  # scenarios per task
+PARAMETERS = ('fertility', 'mortality', 'international', 'domestic')  # Scenario multipliers
+MEASURES = ('population', 'births', 'deaths', 'net_migration', 'growth_rate', 'dependency_ratio',
+            'aging_index', 'median_age')
+FAN_MEASURES = ('population', 'median_age')
+FAN_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def parse_axis(text: str) -> np.ndarray:
+    """``'start:stop:count'`` (evenly spaced, both ends included) or ``'a,b,c'``."""
+    if ':' in text:
+        start, stop, count = text.split(':')
+        return np.linspace(float(start), float(stop), int(count))
+    return np.array([float(v) for v in text.split(',')])
+
+
+def grid(**axes) -> pd.DataFrame:
+    """Every combination of the given multiplier values, one row per scenario;
+    parameters not given stay at 1."""
+    unknown = set(axes) - set(PARAMETERS)
+    if unknown:
+        raise ValueError(f'unknown sweep parameter(s): {", ".join(sorted(unknown))}')
+    values = [np.atleast_1d(np.asarray(axes.get(name, 1.0), dtype=float)) for name in PARAMETERS]
+    mesh = np.meshgrid(*values, indexing='ij')
+    return pd.DataFrame({name: m.ravel() for name, m in zip(PARAMETERS, mesh)})
+
+
+def project_chunk(regions: Regions, parameters: np.ndarray, first: int, years: int = YEARS,
+                  measures=MEASURES) -> pd.DataFrame:
+    """Rows of ``parameters`` (scenarios x ``PARAMETERS``) projected, numbered from ``first``."""
+    scenarios = [Scenario(str(first + i), *row) for i, row in enumerate(parameters)]
+    frame = projection_frame(regions, scenarios, years)
+    rows = len(regions.names) * (years + 1)
+    out = pd.DataFrame({'scenario': np.repeat(np.arange(first, first + len(parameters), dtype=np.int32), rows)})
+    for i, name in enumerate(PARAMETERS):
+        out[name] = np.repeat(parameters[:, i], rows)
+    out['county'] = pd.Categorical(frame['county'], categories=regions.names)
+    out['year'] = frame['year'].to_numpy(np.int16)
+    for name in measures:
+        out[name] = frame[name].to_numpy()
+    return out
+
+
+def _chunks(parameters: pd.DataFrame, size: int):
+    values = parameters[list(PARAMETERS)].to_numpy(float)
+    for first in range(0, len(values), size):
+        yield values[first:first + size], first
+
+
+def _results(regions: Regions, parameters: pd.DataFrame, years: int, measures, workers: int, chunk: int):
+    """Chunk frames in the order they finish."""
+    tasks = _chunks(parameters, chunk)
+    if workers <= 1:
+        for values, first in tasks:
+            yield project_chunk(regions, values, first, years, measures)
+        return
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+    from multiprocessing import get_context
+    with ProcessPoolExecutor(workers, mp_context=get_context('spawn')) as pool:
+        pending = set()
+        for values, first in tasks:
+            pending.add(pool.submit(project_chunk, regions, values, first, years, measures))
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (f.result() for f in done)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from (f.result() for f in done)
+
+
+def _arrow_schema(regions: Regions, measures):
+    import pyarrow as pa
+    return pa.schema([('scenario', pa.int32()), *((name, pa.float64()) for name in PARAMETERS),
+                      ('county', pa.dictionary(pa.int8(), pa.string())), ('year', pa.int16()),
+                      *((name, pa.float64()) for name in measures)])
+
+
+def fan_chart(values: np.ndarray, regions: Regions, measure: str, percentiles=FAN_PERCENTILES) -> pd.DataFrame:
+    """Percentiles across scenarios of ``values`` (scenarios x counties x years)."""
+    stats = np.nanpercentile(values, percentiles, axis=0)  # percentiles x counties x years
+    c, t = values.shape[1:]
+    out = pd.DataFrame({
+        'county': np.repeat(regions.names, t),
+        'year': np.tile(regions.base_year + np.arange(t), c),
+        'measure': measure,
+        'scenarios': len(values),
+    })
+    for p, stat in zip(percentiles, stats):
+        out[f'p{p}'] = stat.ravel()
+    return out
+
+
+def run_sweep(parameters: pd.DataFrame, regions: Regions | None = None, years: int = YEARS, workers: int = 1,
+              out: Path | None = None, summary: bool = True, chunk: int = CHUNK, measures=MEASURES,
+              fan_measures=FAN_MEASURES, percentiles=FAN_PERCENTILES) -> pd.DataFrame | None:
+    """Project every scenario of ``parameters`` (columns ``PARAMETERS``), write
+    them to ``out`` if given and return the fan chart if ``summary``."""
+    regions = regions if regions is not None else load_regions()
+    measures = tuple(dict.fromkeys([*measures, *(fan_measures if summary else ())]))
+    writer = None
+    if out is not None:
+        from .columnar import _require_pyarrow
+        _require_pyarrow()
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        schema = _arrow_schema(regions, measures)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        writer = pq.ParquetWriter(out, schema, compression='zstd')
+    fans = ({name: np.full((len(parameters), len(regions.names), years + 1), np.nan, dtype=np.float32)
+             for name in fan_measures} if summary else {})
+    try:
+        for frame in _results(regions, parameters, years, measures, workers, chunk):
+            if writer is not None:
+                writer.write_table(pa.Table.from_pandas(frame, schema=schema, preserve_index=False))
+            rows = frame['scenario'].to_numpy()[::len(regions.names) * (years + 1)]
+            for name, values in fans.items():
+                values[rows] = frame[name].to_numpy().reshape(len(rows), len(regions.names), years + 1)
+    finally:
+        if writer is not None:
+            writer.close()
+    if not summary:
+        return None
+    return pd.concat([fan_chart(values, regions, name, percentiles) for name, values in fans.items()],
+                     ignore_index=True)
@@ -0,0 +1,267 @@
+"""Monthly time series for many series at once, on a period axis.
+
+A ``Panel`` holds one or more measures (``rent``, ``occupancy``) for many
+series as 2-D float arrays, series by period, over a contiguous
+``PeriodIndex``. Series are keyed by ``(level, name)``: ``('citywide',
+'Houston')``, ``('submarket', 'Heights')``, ``('zip', '77007')``. A month a
+series has no value for is NaN.
+
+Everything is computed on whole arrays, every series in one numpy operation:
+
+- ``growth(measure, lag)``: change over ``lag`` periods (``yoy``/``mom``);
+- ``rolling_mean(measure, window)``: trailing mean over sliding windows, NaN
+  unless all ``window`` periods are present;
+- ``resample('Q')``: calendar quarters (or years) by ``reduceat`` over the
+  period boundaries; a period the panel only partly covers is NaN.
+
+Derived values at period ``t`` only read the ``LOOKBACK`` periods before it,
+so ``derive(start)`` computes just the periods from ``start`` on; after
+``append`` adds months, only those are computed.
+
+The ``timeseries`` stage builds a panel from the monthly datasets in
+``SOURCES`` and keeps ``derived/timeseries/monthly.csv``, one row per series
+and month with the measures and ``DERIVED`` columns. When the sources only
+gained months, their rows are appended to the file and the history is neither
+recomputed nor rewritten; any other change rebuilds it. ``quarterly.csv``
+holds the quarterly means.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .datasets import DERIVED_DIR, Dataset, discover_datasets, read_dataset
+
+TIMESERIES_DIR = DERIVED_DIR / 'timeseries'
+KEYS = ('level', 'name')
+PERIODS_PER_YEAR = {'M': 12, 'Q': 4, 'Y': 1}
+
+# Derived column suffix -> (kind, periods), computed for every measure of a monthly panel
+DERIVED = {
+    'mom': ('growth', 1),
+    'yoy': ('growth', 12),
+    'avg_3m': ('mean', 3),
+    'avg_12m': ('mean', 12),
+}
+LOOKBACK = max(periods for _, periods in DERIVED.values())
+
+
+@dataclass(frozen=True)
+class Source:
+    """A monthly dataset: its month column, measure columns (``(column,
+    measure)`` pairs) and the series it holds, named by a column or, for a
+    dataset with a single series, by ``name`` itself."""
+    dataset: str
+    level: str
+    month: str
+    measures: tuple[tuple[str, str], ...]
+    name: str
+    name_column: bool = False
+
+
+SOURCES = (
+    Source('houston_rental_trends', 'citywide', 'Month',
+           (('Average_Rent', 'rent'), ('Occupancy_Rate', 'occupancy')), 'Houston'),
+)
+
+
+def _kind(periods: pd.PeriodIndex) -> str:
+    return periods.freqstr[0]
+
+
+@dataclass
+class Panel:
+    series: pd.MultiIndex  # (level, name)
+    periods: pd.PeriodIndex  # contiguous
+    values: dict[str, np.ndarray]  # measure -> float64 array, series by period
+
+    @classmethod
+    def from_long(cls, frame: pd.DataFrame, measures, period: str = 'month', freq: str = 'M') -> 'Panel':
+        """Panel from one row per series and period (``level``, ``name``,
+        ``period`` and the ``measures`` columns); the periods span the first to
+        the last present, and duplicate rows keep the last."""
+        # Parse each distinct period label once, and number series by their key codes
+        labels, names = pd.factorize(frame[period].astype(str))
+        ordinals = pd.PeriodIndex(pd.to_datetime(names, format='mixed'), freq=freq).asi8[labels]
+        key_codes, key_names = zip(*(pd.factorize(frame[key].astype(str)) for key in KEYS))
+        codes, pairs = pd.factorize(key_codes[0].astype(np.int64) * len(key_names[1]) + key_codes[1])
+        series = pd.MultiIndex.from_arrays([key_names[0][pairs // len(key_names[1])],
+                                            key_names[1][pairs % len(key_names[1])]], names=list(KEYS))
+        first = ordinals.min() if len(ordinals) else 0
+        count = ordinals.max() - first + 1 if len(ordinals) else 0
+        span = pd.PeriodIndex.from_ordinals(np.arange(first, first + count), freq=freq)
+        columns = ordinals - first
+        values = {}
+        for measure in measures:
+            array = np.full((len(series), len(span)), np.nan)
+            array[codes, columns] = pd.to_numeric(frame[measure], errors='coerce').to_numpy(float, na_value=np.nan)
+            values[measure] = array
+        return cls(series, span, values)
+
+    @property
+    def measures(self) -> list[str]:
+        return list(self.values)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.series), len(self.periods)
+
+    def append(self, other: 'Panel') -> 'Panel':
+        """This panel followed by ``other``'s periods, which must start right
+        after the last one here. Series missing on one side are NaN there."""
+        if len(self.periods) and len(other.periods) and other.periods[0] != self.periods[-1] + 1:
+            raise ValueError(f'cannot append periods starting {other.periods[0]} after {self.periods[-1]}')
+        if set(other.measures) != set(self.measures):
+            raise ValueError(f'measures differ: {self.measures} and {other.measures}')
+        series = self.series.append(other.series[~other.series.isin(self.series)])
+        mine, theirs = series.get_indexer(self.series), series.get_indexer(other.series)
+        values = {}
+        for measure, array in self.values.items():
+            out = np.full((len(series), len(self.periods) + len(other.periods)), np.nan)
+            out[mine, :len(self.periods)] = array
+            out[theirs, len(self.periods):] = other.values[measure]
+            values[measure] = out
+        return Panel(series, self.periods.append(other.periods), values)
+
+    def tail(self, start: int) -> 'Panel':
+        return Panel(self.series, self.periods[start:], {m: a[:, start:] for m, a in self.values.items()})
+
+    # -- derived measures ---------------------------------------------------
+
+    def growth(self, measure: str, lag: int, start: int = 0) -> np.ndarray:
+        """``value[t] / value[t - lag] - 1`` for periods ``start`` on."""
+        array = self.values[measure]
+        out = np.full((len(self.series), len(self.periods) - start), np.nan)
+        first = max(start, lag)
+        if first < array.shape[1]:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                out[:, first - start:] = array[:, first:] / array[:, first - lag:array.shape[1] - lag] - 1
+        out[~np.isfinite(out)] = np.nan
+        return out
+
+    def yoy(self, measure: str, start: int = 0) -> np.ndarray:
+        return self.growth(measure, PERIODS_PER_YEAR[_kind(self.periods)], start)
+
+    def rolling_mean(self, measure: str, window: int, start: int = 0) -> np.ndarray:
+        """Mean of the ``window`` periods ending at each period from ``start`` on."""
+        low = max(start - window + 1, 0)
+        part = self.values[measure][:, low:]
+        out = np.full((len(self.series), len(self.periods) - start), np.nan)
+        if part.shape[1] >= window:
+            # a missing period makes its windows NaN; periods low + window - 1 on
+            means = np.lib.stride_tricks.sliding_window_view(part, window, axis=1).mean(axis=-1)
+            out[:, low + window - 1 - start:] = means
+        return out
+
+    def derive(self, start: int = 0, derived: dict = DERIVED) -> dict[str, np.ndarray]:
+        """``<measure>_<suffix>`` -> derived values for periods ``start`` on."""
+        out = {}
+        for measure in self.values:
+            for suffix, (kind, periods) in derived.items():
+                compute = self.growth if kind == 'growth' else self.rolling_mean
+                out[f'{measure}_{suffix}'] = compute(measure, periods, start)
+        return out
+
+    def resample(self, freq: str = 'Q', how: str = 'mean') -> 'Panel':
+        """Panel of ``freq`` periods (``'Q'`` or ``'Y'``) by ``mean``, ``sum`` or
+        ``last``; a period without all its months in the panel is NaN."""
+        if how not in ('mean', 'sum', 'last'):
+            raise ValueError(f'unknown aggregation {how!r}; expected mean, sum or last')
+        target = self.periods.asfreq(freq)
+        if not len(target):
+            return Panel(self.series, target, {m: a[:, :0] for m, a in self.values.items()})
+        starts = np.flatnonzero(np.r_[True, target[1:] != target[:-1]])
+        periods = target[starts]
+        lengths = np.diff(np.r_[starts, len(target)])
+        source = _kind(self.periods)
+        full = lengths == periods.asfreq(source, 'E').asi8 - periods.asfreq(source, 'S').asi8 + 1
+        values = {}
+        for measure, array in self.values.items():
+            if how == 'last':
+                out = array[:, starts + lengths - 1].copy()
+            else:
+                present = ~np.isnan(array)
+                counts = np.add.reduceat(present, starts, axis=1)
+                out = np.add.reduceat(np.where(present, array, 0.0), starts, axis=1)
+                if how == 'mean':
+                    out /= lengths
+                out[counts < lengths] = np.nan
+            out[:, ~full] = np.nan
+            values[measure] = out
+        return Panel(self.series, periods, values)
+
+    # -- long format --------------------------------------------------------
+
+    def frame(self, start: int = 0, derived: dict | None = DERIVED) -> pd.DataFrame:
+        """One row per series and period from ``start`` on, with the measures
+        and (``derived`` not ``None``) the derived columns."""
+        periods = self.periods[start:]
+        n_series, n_periods = len(self.series), len(periods)
+        rows = np.repeat(np.arange(n_series), n_periods)
+        out = pd.DataFrame({key: pd.Categorical.from_codes(self.series.codes[level][rows], self.series.levels[level])
+                            for level, key in enumerate(KEYS)})
+        out['month' if _kind(self.periods) == 'M' else 'period'] = pd.Categorical.from_codes(
+            np.tile(np.arange(n_periods), n_series), periods.astype(str))
+        for measure, array in self.values.items():
+            out[measure] = array[:, start:].ravel()
+        if derived is not None:
+            for column, array in self.derive(start, derived).items():
+                out[column] = array.ravel()
+        return out
+
+
+# -- stage -----------------------------------------------------------------
+
+def _source_rows(source: Source, dataset: Dataset) -> pd.DataFrame:
+    frame = read_dataset(dataset)
+    rows = pd.DataFrame({
+        'level': source.level,
+        'name': frame[source.name].astype(str) if source.name_column else source.name,
+        'month': frame[source.month],
+    })
+    for column, measure in source.measures:
+        rows[measure] = frame[column]
+    return rows
+
+
+def load_panel(datasets: dict[str, Dataset] | None = None, sources=SOURCES) -> Panel:
+    """The monthly panel of every source dataset that exists."""
+    datasets = datasets if datasets is not None else discover_datasets()
+    pieces = [_source_rows(source, datasets[source.dataset]) for source in sources if source.dataset in datasets]
+    rows = pd.concat(pieces, ignore_index=True) if pieces else pd.DataFrame(columns=[*KEYS, 'month'])
+    measures = list(dict.fromkeys(measure for source in sources for _, measure in source.measures))
+    return Panel.from_long(rows, measures)
+
+
+def _stored(path, measures) -> Panel | None:
+    if not path.exists():
+        return None
+    frame = pd.read_csv(path, usecols=[*KEYS, 'month', *measures], dtype={'name': str})
+    return Panel.from_long(frame, measures)
+
+
+def _history_matches(stored: Panel, panel: Panel) -> bool:
+    n = len(stored.periods)
+    return (stored.series.equals(panel.series) and n <= len(panel.periods)
+            and stored.periods.equals(panel.periods[:n])
+            and all(np.array_equal(stored.values[m], panel.values[m][:, :n], equal_nan=True) for m in panel.values))
+
+
+def build_timeseries(datasets: dict[str, Dataset] | None = None, out_dir=TIMESERIES_DIR) -> dict[str, int]:
+    """Write (or extend) ``monthly.csv`` and ``quarterly.csv``; returns the
+    series and month counts and how many months were appended."""
+    panel = load_panel(datasets)
+    monthly = out_dir / 'monthly.csv'
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stored = _stored(monthly, panel.measures)
+    if stored is not None and _history_matches(stored, panel):
+        start = len(stored.periods)
+        if start < len(panel.periods):
+            panel.frame(start).to_csv(monthly, mode='a', header=False, index=False)
+    else:
+        start = 0
+        panel.frame().to_csv(monthly, index=False)
+    panel.resample('Q').frame(derived=None).to_csv(out_dir / 'quarterly.csv', index=False)
+    return {'series': len(panel.series), 'months': len(panel.periods), 'appended': len(panel.periods) - start}
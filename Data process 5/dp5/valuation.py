@@ -0,0 +1,343 @@
+"""Multifamily valuation: NOI, DCF value, IRR and equity multiple, vectorized.
+
+Market inputs (``load_market``) are per submarket:
+
+- going-in cap rate: the cap-rate chart of the multifamily investment folder
+  (``houston_cap_rates``), whose truncated labels are spelled out by
+  ``CAP_RATE_SUBMARKETS``; the other inputs are looked up under that name in
+  ``houston_submarkets_performance_2025``;
+- rent: the latest quarterly average of the multifamily trends chart, times
+  ``TIER_RENT`` for the submarket's market tier;
+- year-one rent growth: the submarket's ``YoY_Rent_Growth_Pct``
+  (``NEGATIVE_GROWTH`` where it only says "Negative"), else the market's
+  growth over the last four quarters;
+- occupancy: the latest quarterly occupancy plus ``OCCUPANCY_SPREAD`` for the
+  submarket's occupancy performance.
+
+Three of the chart's submarkets (Northwest Houston, Sugar Land/Stafford and
+Heights/Washington Avenue) are not in the performance table, and several have
+no growth figure; their inputs fall back to the market's, and ``Market.defaults``
+(the ``defaults`` column of the summary) lists which ones did.
+
+Rent growth and occupancy then revert to the market's long-run values
+(``houston_rental_market_2025``: the annual rent growth forecast and the
+10-year average occupancy), the gap shrinking by ``REVERSION`` a year. These
+are the submarket paths every property in the submarket follows.
+
+A portfolio is arrays of properties (submarket, units, rent relative to the
+submarket, purchase price); scenarios are a frame of shifts and deal terms
+(``SCENARIO_DEFAULTS``). ``value`` evaluates every property under every
+scenario as ``properties x scenarios x years`` arrays: effective gross income,
+NOI after ``EXPENSE_RATIO`` and ``RESERVES``, the exit at the going-in cap
+plus the scenario's spread, the DCF value at its discount rate, and the
+unlevered and levered (interest-only debt) IRRs and equity multiple. IRRs are
+solved by Newton's method on all pairs at once. 100,000 pairs take well under
+a second.
+
+The ``valuation`` stage values one representative property per submarket
+under ``DEFAULT_GRID`` and writes ``derived/valuation/submarkets.csv`` (the
+median and spread across scenarios); ``dp5.dbload`` loads it as
+``CalculatorResult`` rows for the investment pages.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .datasets import DERIVED_DIR, Dataset, discover_datasets, read_dataset
+
+VALUATION_DIR = DERIVED_DIR / 'valuation'
+FOLDER = 'Harris County Texas Multifamily Investment Market'
+CAP_RATE_CHART = 'houston_cap_rates'
+TRENDS_CHART = 'houston_multifamily_trends'
+
+HOLD_YEARS = 10
+REVERSION = 0.5  # share of a submarket's gap to the market's long-run growth and occupancy closed each year
+EXPENSE_RATIO = 0.45  # operating expenses including property taxes, share of effective gross income
+OTHER_INCOME = 0.05  # fees, parking and utilities billed back, share of collected rent
+RESERVES = 300.0  # replacement reserves, USD per unit and year
+SALE_COST = 0.02  # share of the exit price
+NEGATIVE_GROWTH = -0.01  # year-one rent growth of a submarket reported only as "Negative"
+MAX_OCCUPANCY = 0.97
+# Submarket rent relative to the market average, by market tier
+TIER_RENT = {'Luxury': 1.25, 'Mid-Tier': 1.0, 'Affordable': 0.8}
+# Occupancy relative to the market, in points, by reported occupancy performance
+OCCUPANCY_SPREAD = {'Outperforming': 1.5, 'Strong': 1.0, 'Strong Absorption': 0.5, 'Good': 0.0,
+                    'Stable': 0.0, 'Declining': -1.5}
+
+# Scenario columns and their values when not given
+SCENARIO_DEFAULTS = {
+    'rent_growth': 0.0,  # added to every year's rent growth
+    'occupancy': 0.0,  # added to every year's occupancy
+    'exit_cap_spread': 0.0025,  # exit cap rate minus going-in cap rate
+    'discount_rate': 0.08,
+    'ltv': 0.55,  # loan to purchase price
+    'interest_rate': 0.06,  # interest-only debt
+}
+DEFAULT_GRID = {
+    'rent_growth': (-0.02, -0.01, 0.0, 0.01),
+    'occupancy': (-0.03, 0.0, 0.02),
+    'exit_cap_spread': (0.0, 0.0025, 0.005, 0.0075, 0.01),
+}
+DEFAULT_UNITS = 250
+
+# Cap-rate chart labels (truncated in the chart) -> full submarket names
+CAP_RATE_SUBMARKETS = {
+    'Downtown/Montr': 'Downtown/Montrose/River Oaks',
+    'Galleria/Up': 'Galleria/Uptown',
+    'Memorial/West': 'Memorial/West University',
+    'Northwest HOU': 'Northwest Houston',
+    'Sugar Land/St': 'Sugar Land/Stafford',
+    'The Woodlands': 'The Woodlands',
+    'Katy/Cinco': 'Katy/Cinco Ranch/Waterside',
+    'Heights/Wash': 'Heights/Washington Avenue',
+}
+
+
+@dataclass(frozen=True)
+class Market:
+    submarkets: tuple[str, ...]
+    cap_rate: np.ndarray  # going-in, as a fraction
+    rent: np.ndarray  # USD per unit and month, today
+    rent_growth: np.ndarray  # year one
+    occupancy: np.ndarray  # today
+    long_run_growth: float
+    long_run_occupancy: float
+    defaults: tuple[str, ...] = ()  # per submarket, the inputs taken from the market ('' if none)
+
+
+@dataclass
+class Portfolio:
+    submarket: np.ndarray  # property -> index into Market.submarkets
+    units: np.ndarray
+    rent: np.ndarray  # relative to the submarket's rent
+    price: np.ndarray  # purchase price; NaN buys at the submarket's going-in cap rate
+
+
+# -- market ----------------------------------------------------------------
+
+def _chart_frame(name: str) -> pd.DataFrame:
+    from .chartspec import load_frame, load_specs
+    specs = load_specs(match=f'{FOLDER}/{name}')
+    if not specs:
+        raise FileNotFoundError(f'no {name} chart spec in {FOLDER}/charts.json')
+    return load_frame(specs[0])
+
+
+def _full_names(labels) -> list[str]:
+    """The submarket name of each cap-rate chart label."""
+    unknown = [label for label in labels if label not in CAP_RATE_SUBMARKETS]
+    if unknown:
+        raise ValueError(f'cap-rate chart label(s) missing from CAP_RATE_SUBMARKETS: {", ".join(unknown)}')
+    return [CAP_RATE_SUBMARKETS[label] for label in labels]
+
+
+def _market_metric(frame: pd.DataFrame, category: str, metric: str) -> float:
+    row = frame[(frame['Category'] == category) & (frame['Metric'] == metric)]
+    return float(row['Value'].iloc[0])
+
+
+def load_market(datasets: dict[str, Dataset] | None = None) -> Market:
+    datasets = datasets if datasets is not None else discover_datasets()
+    caps = _chart_frame(CAP_RATE_CHART)
+    trends = _chart_frame(TRENDS_CHART)
+    subs = read_dataset(datasets['houston_submarkets_performance_2025'])
+    rental = read_dataset(datasets['houston_rental_market_2025'])
+
+    names = _full_names(caps['Submarket'])
+    info = subs.set_index('Submarket').reindex(names)
+    latest = trends.iloc[-1]
+    trailing = float(latest['avg_rent'] / trends['avg_rent'].iloc[-5] - 1) if len(trends) > 4 else 0.0
+    growth_text = info['YoY_Rent_Growth_Pct'].astype('string').str.strip()
+    growth = pd.to_numeric(growth_text, errors='coerce') / 100
+    negative = (growth_text.str.lower() == 'negative').fillna(False).to_numpy(bool)
+    growth = growth.mask(negative, NEGATIVE_GROWTH)
+    spread = info['Occupancy_Performance'].map(OCCUPANCY_SPREAD)
+    tier = info['Market_Tier'].map(TIER_RENT)
+    fallback = pd.DataFrame({'rent': tier.isna(), 'rent_growth': growth.isna(), 'occupancy': spread.isna()})
+    growth, spread = growth.fillna(trailing), spread.fillna(0.0)
+    return Market(
+        submarkets=tuple(names),
+        cap_rate=caps['Cap_Rate'].to_numpy(float) / 100,
+        rent=float(latest['avg_rent']) * tier.fillna(1.0).to_numpy(float),
+        rent_growth=growth.to_numpy(float),
+        occupancy=np.minimum((float(latest['occupancy']) + spread.to_numpy(float)) / 100, MAX_OCCUPANCY),
+        long_run_growth=_market_metric(rental, 'Rent Growth', '2025 Annual Forecast') / 100,
+        long_run_occupancy=_market_metric(rental, 'Occupancy Rate', '10-Year Historical Avg') / 100,
+        defaults=tuple(','.join(fallback.columns[row]) for row in fallback.to_numpy(bool)),
+    )
+
+
+# -- inputs ----------------------------------------------------------------
+
+def scenario_grid(**axes) -> pd.DataFrame:
+    """Every combination of the given scenario values; other columns at ``SCENARIO_DEFAULTS``."""
+    unknown = set(axes) - set(SCENARIO_DEFAULTS)
+    if unknown:
+        raise ValueError(f'unknown scenario column(s): {", ".join(sorted(unknown))}')
+    values = [np.atleast_1d(np.asarray(axes.get(name, default), dtype=float))
+              for name, default in SCENARIO_DEFAULTS.items()]
+    mesh = np.meshgrid(*values, indexing='ij')
+    return pd.DataFrame({name: m.ravel() for name, m in zip(SCENARIO_DEFAULTS, mesh)})
+
+
+def representative_portfolio(market: Market, units: int = DEFAULT_UNITS) -> Portfolio:
+    """One property per submarket at its rent and going-in cap rate."""
+    n = len(market.submarkets)
+    return Portfolio(np.arange(n), np.full(n, float(units)), np.ones(n), np.full(n, np.nan))
+
+
+def sample_portfolio(market: Market, properties: int, seed: int = 2025) -> Portfolio:
+    """``properties`` random properties: 50 to 400 units, rents spread 10% around the submarket's."""
+    rng = np.random.default_rng(seed)
+    return Portfolio(rng.integers(0, len(market.submarkets), properties),
+                     rng.integers(50, 401, properties).astype(float),
+                     rng.lognormal(-0.005, 0.1, properties), np.full(properties, np.nan))
+
+
+# -- engine ----------------------------------------------------------------
+
+def _paths(market: Market, portfolio: Portfolio, years: int) -> tuple[np.ndarray, np.ndarray]:
+    """Rent growth and occupancy, properties x years 1..``years``, before scenario shifts."""
+    fade = (1 - REVERSION) ** np.arange(years)
+    sub = portfolio.submarket
+    growth = market.long_run_growth + (market.rent_growth[sub, None] - market.long_run_growth) * fade
+    occupancy = market.long_run_occupancy + (market.occupancy[sub, None] - market.long_run_occupancy) * fade
+    return growth, occupancy
+
+
+def net_operating_income(market: Market, portfolio: Portfolio, scenarios: pd.DataFrame,
+                         years: int = HOLD_YEARS) -> np.ndarray:
+    """NOI, properties x scenarios x years 1..``years``."""
+    growth, occupancy = _paths(market, portfolio, years)
+    growth = growth[:, None, :] + scenarios['rent_growth'].to_numpy(float)[None, :, None]
+    occupancy = np.clip(occupancy[:, None, :] + scenarios['occupancy'].to_numpy(float)[None, :, None], 0, 1)
+    rent = (market.rent[portfolio.submarket] * portfolio.rent)[:, None, None] * np.cumprod(1 + growth, axis=-1)
+    income = portfolio.units[:, None, None] * 12 * rent * occupancy * (1 + OTHER_INCOME)
+    return income * (1 - EXPENSE_RATIO) - (portfolio.units * RESERVES)[:, None, None]
+
+
+def purchase_price(market: Market, portfolio: Portfolio) -> np.ndarray:
+    """Given prices, else year-one NOI on the submarket path over the going-in cap rate."""
+    base = net_operating_income(market, portfolio, scenario_grid(), years=1)[:, 0, 0]
+    return np.where(np.isnan(portfolio.price), base / market.cap_rate[portfolio.submarket], portfolio.price)
+
+
+def _npv(flows: np.ndarray, rate: np.ndarray) -> np.ndarray:
+    return (flows * (1 + rate[..., None]) ** -np.arange(flows.shape[-1])).sum(axis=-1)
+
+
+def _bisect(flows: np.ndarray, low: float = -0.99, high: float = 10.0, iterations: int = 100) -> np.ndarray:
+    """Rate in ``[low, high]`` where each row's NPV changes sign; NaN without a sign change."""
+    low, high = np.full(flows.shape[:-1], low), np.full(flows.shape[:-1], high)
+    sign = np.sign(_npv(flows, low))
+    bracketed = sign * np.sign(_npv(flows, high)) < 0
+    for _ in range(iterations):
+        mid = (low + high) / 2
+        same = np.sign(_npv(flows, mid)) == sign
+        low, high = np.where(same, mid, low), np.where(same, high, mid)
+    return np.where(bracketed, (low + high) / 2, np.nan)
+
+
+def irr(flows: np.ndarray, guess: float = 0.1, tol: float = 1e-9, iterations: int = 50) -> np.ndarray:
+    """Internal rate of return of each row of ``flows`` (last axis: periods 0..n).
+    Newton's method on all rows at once; rows it does not settle are bisected,
+    and are NaN if their NPV never changes sign."""
+    periods = np.arange(flows.shape[-1])
+    rate = np.full(flows.shape[:-1], guess)
+    converged = np.zeros(rate.shape, dtype=bool)
+    for _ in range(iterations):
+        discount = (1 + rate[..., None]) ** -periods
+        npv = (flows * discount).sum(axis=-1)
+        slope = -(flows * periods * discount).sum(axis=-1) / (1 + rate)
+        step = np.divide(npv, slope, out=np.zeros_like(npv), where=slope != 0)
+        rate = np.maximum(rate - np.where(converged, 0, step), -0.99)
+        converged |= np.abs(step) < tol
+        if converged.all():
+            break
+    # a flat NPV far out (e.g. flows that never turn positive) also stops the steps
+    converged &= np.abs(_npv(flows, rate)) <= 1e-7 * np.abs(flows).sum(axis=-1)
+    if not converged.all():
+        rate[~converged] = _bisect(flows[~converged])
+    return rate
+
+
+def value(market: Market, portfolio: Portfolio, scenarios: pd.DataFrame,
+          years: int = HOLD_YEARS) -> dict[str, np.ndarray]:
+    """Per property and scenario (``properties x scenarios`` arrays): price,
+    year-one NOI, exit value, DCF value, NPV, unlevered and levered IRR and
+    equity multiple."""
+    noi = net_operating_income(market, portfolio, scenarios, years + 1)  # the year after the hold prices the exit
+    price = purchase_price(market, portfolio)[:, None]
+    terms = {name: scenarios[name].to_numpy(float)[None, :] for name in SCENARIO_DEFAULTS}
+    exit_cap = market.cap_rate[portfolio.submarket][:, None] + terms['exit_cap_spread']
+    exit_value = noi[..., years] / exit_cap * (1 - SALE_COST)
+
+    discount = (1 + terms['discount_rate'][..., None]) ** -np.arange(1, years + 1)  # 1 x scenarios x years
+    dcf = (noi[..., :years] * discount).sum(axis=-1) + exit_value * discount[..., -1]
+
+    flows = np.concatenate([np.broadcast_to(-price, noi.shape[:2])[..., None], noi[..., :years]], axis=-1)
+    flows[..., -1] += exit_value
+    loan = price * terms['ltv']
+    levered = flows - np.concatenate([np.zeros(noi.shape[:2] + (1,)),
+                                      np.broadcast_to((loan * terms['interest_rate'])[..., None],
+                                                      noi.shape[:2] + (years,))], axis=-1)
+    levered[..., 0] += loan
+    levered[..., -1] -= loan
+    equity = -levered[..., 0]
+    return {
+        'price': np.broadcast_to(price, dcf.shape),
+        'noi': noi[..., 0],
+        'exit_value': exit_value,
+        'dcf_value': dcf,
+        'npv': dcf - price,
+        'irr': irr(flows),
+        'levered_irr': irr(levered),
+        'equity_multiple': levered[..., 1:].sum(axis=-1) / equity,
+    }
+
+
+# -- summaries -------------------------------------------------------------
+
+def submarket_summary(market: Market, portfolio: Portfolio, scenarios: pd.DataFrame,
+                      results: dict[str, np.ndarray] | None = None) -> pd.DataFrame:
+    """Per submarket, across its properties and all scenarios: the going-in
+    terms and the 10th, 50th and 90th percentiles of value and returns."""
+    results = results if results is not None else value(market, portfolio, scenarios)
+    rows = []
+    for index, name in enumerate(market.submarkets):
+        mine = portfolio.submarket == index
+        if not mine.any():
+            continue
+        row = {
+            'submarket': name,
+            'properties': int(mine.sum()),
+            'scenarios': len(scenarios),
+            'units': float(portfolio.units[mine].sum()),
+            'cap_rate': market.cap_rate[index],
+            'rent': market.rent[index],
+            'rent_growth': market.rent_growth[index],
+            'occupancy': market.occupancy[index],
+            'defaults': market.defaults[index] if market.defaults else '',
+            'price': results['price'][mine, 0].sum(),
+            'noi': np.median(results['noi'][mine].sum(axis=0)),
+        }
+        for measure in ('dcf_value', 'irr', 'levered_irr', 'equity_multiple'):
+            values = results[measure][mine]
+            values = values.sum(axis=0) if measure == 'dcf_value' else values.ravel()
+            low, mid, high = np.nanpercentile(values, [10, 50, 90])
+            row.update({f'{measure}_p10': low, f'{measure}_p50': mid, f'{measure}_p90': high})
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def build_valuation(datasets: dict[str, Dataset] | None = None, out_dir=VALUATION_DIR) -> dict[str, int]:
+    """Write ``submarkets.csv``; returns the submarket and scenario counts."""
+    market = load_market(datasets)
+    scenarios = scenario_grid(**DEFAULT_GRID)
+    summary = submarket_summary(market, representative_portfolio(market), scenarios)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    summary.to_csv(out_dir / 'submarkets.csv', index=False, float_format='%.4f')
+    return {'submarkets': len(summary), 'scenarios': len(scenarios)}
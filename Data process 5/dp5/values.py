@@ -0,0 +1,202 @@
+"""Vectorized extraction of typed values from display strings.
+
+Many Metric/Value tables store numbers the way they were shown in a report:
+``'$72,336'``, ``'4.30%'``, ``'+9,700 jobs'``, ``'45,000+ globally'``,
+``'$127 - $279 ($189 average)'``. ``parse_values`` turns a whole column of such
+strings into numeric ``value``/``value_low``/``value_high`` plus ``unit``,
+``qualifier`` and ``period`` with a handful of ``Series.str`` regex passes,
+never a Python loop over rows.
+
+``build_typed`` does this for every dataset at once: all candidate cells are
+stacked into one Series, parsed in a single pass and split back per table.
+"""
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .datasets import DERIVED_DIR, Dataset, discover_datasets, read_dataset
+
+TYPED_DIR = DERIVED_DIR / 'typed'
+
+_FLAGS = re.IGNORECASE
+_NUM = r'\d[\d,]*(?:\.\d+)?|\.\d+'
+_QUALIFIER_WORDS = r'~|≈|#|over\s|more than\s|about\s|approx\.?\s|approximately\s|up to\s|under\s|nearly\s'
+_SCALE = r'trillion|billion|million|thousand|[kmb](?![a-z])'
+
+_LEAD = (
+    r'^\s*(?P<prefix>' + _QUALIFIER_WORDS + r')?\s*'
+    r'(?P<sign>[+\-−])?\s*(?P<cur>\$)?\s*(?P<num>' + _NUM + r')\s*(?P<scale>' + _SCALE + r')?\s*'
+    r'(?P<pct>%)?\s*(?P<plus>\+)?\s*(?P<scale_post>' + _SCALE + r')?'
+    r'(?:\s*(?:-|–|to)\s*\$?\s*(?P<num2>' + _NUM + r')\s*(?P<scale2>' + _SCALE + r')?\s*%?)?'
+    r'(?P<rest>.*)$'
+)
+_AVERAGE = r'\(\s*\$?\s*(?P<avg>' + _NUM + r')\s*(?P<avg_scale>' + _SCALE + r')?\s*%?\s*(?:average|avg|mean)\s*\)'
+_RANGE = r'\(\s*\$?\s*(?P<lo>' + _NUM + r')\s*%?\s*(?:-|–|to)\s*\$?\s*(?P<hi>' + _NUM + r')\s*%?\s*range\s*\)'
+_UNIT_WORD = r'^\s*(?P<word>[a-z]+)'
+# Cheap test used to pick value columns before the full parse
+_LEAD_NUMBER = r'^\s*(?:' + _QUALIFIER_WORDS + r')?\s*[+\-−]?\s*\$?\s*(?:\d|\.\d)'
+
+_MONTHS = r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?'
+_PERIOD = (
+    r'(?P<period>' + _MONTHS + r'\s+\d{4}\s*[-–]\s*' + _MONTHS + r'\s+\d{4}'
+    r'|q[1-4]\s+\d{4}'
+    r'|' + _MONTHS + r'\s+\d{4}'
+    r'|(?:19|20)\d{2}\s*[-–]\s*(?:19|20)?\d{2}'
+    r'|(?:19|20)\d{2})'
+)
+
+SCALES = {'k': 1e3, 'thousand': 1e3, 'm': 1e6, 'million': 1e6, 'b': 1e9, 'billion': 1e9, 'trillion': 1e12}
+
+# Words after a number that name what is being counted
+COUNT_UNITS = {
+    'jobs', 'listings', 'teus', 'residents', 'students', 'companies', 'startups', 'employers',
+    'centers', 'people', 'persons', 'units', 'households', 'years', 'days', 'months',
+    'acres', 'participants', 'members', 'universities', 'institutions', 'workers',
+}
+
+TYPED_COLUMNS = ('value', 'value_low', 'value_high', 'unit', 'qualifier', 'period')
+
+# A text column is treated as a value column when this share of its cells parse
+MIN_PARSED_SHARE = 0.5
+
+
+def _to_number(digits: pd.Series) -> pd.Series:
+    return pd.to_numeric(digits.str.replace(',', '', regex=False), errors='coerce')
+
+
+def _mask(condition: pd.Series) -> np.ndarray:
+    """Nullable boolean Series -> plain bool array (missing counts as False)."""
+    return condition.fillna(False).to_numpy(dtype=bool)
+
+
+def _scale(*groups: pd.Series) -> pd.Series:
+    """Multiplier from the first non-empty scale group."""
+    word = groups[0]
+    for other in groups[1:]:
+        word = word.fillna(other)
+    return word.str.lower().map(SCALES).fillna(1.0).astype(float)
+
+
+def parse_values(strings: pd.Series, labels: pd.Series | None = None) -> pd.DataFrame:
+    """Parse display strings into typed columns (see ``TYPED_COLUMNS``).
+
+    ``labels`` (e.g. the Metric column) are searched for the period first,
+    since most tables put "(May 2025)" in the metric name.
+    """
+    text = strings.astype('string')
+    lead = text.str.extract(_LEAD, flags=_FLAGS)
+    average = text.str.extract(_AVERAGE, flags=_FLAGS)
+    spread = text.str.extract(_RANGE, flags=_FLAGS)
+
+    scale = _scale(lead['scale'], lead['scale_post'])
+    sign = np.where(_mask(lead['sign'].isin(['-', '−'])), -1.0, 1.0)
+    main = _to_number(lead['num']) * scale * sign
+    upper = _to_number(lead['num2']) * _scale(lead['scale2'], lead['scale'], lead['scale_post'])
+    avg = _to_number(average['avg']) * _scale(average['avg_scale'], lead['scale'], lead['scale_post'])
+
+    has_upper = upper.notna()
+    low = main.where(has_upper).fillna(_to_number(spread['lo']))
+    high = upper.where(has_upper).fillna(_to_number(spread['hi']))
+    # An "(N average)" note only refines a range; elsewhere it describes something else
+    value = main.where(~has_upper, avg.where(has_upper).fillna((low + high) / 2))
+
+    rest_word = lead['rest'].str.extract(_UNIT_WORD, flags=_FLAGS)['word'].str.lower()
+    prefix = lead['prefix'].str.strip().str.lower()
+    unit = pd.Series(
+        np.select(
+            [_mask(lead['cur'].notna()), _mask(lead['pct'].notna()),
+             _mask(prefix == '#'), _mask(rest_word.isin(COUNT_UNITS))],
+            ['USD', 'percent', 'rank', rest_word.fillna('').to_numpy(dtype=object)],
+            default=None,
+        ),
+        index=text.index, dtype='string',
+    )
+    qualifier = pd.Series(
+        np.select(
+            [_mask(lead['plus'].notna() | prefix.isin(['over', 'more than'])),
+             _mask(prefix.isin(['up to', 'under'])),
+             _mask(prefix.isin(['~', '≈', 'about', 'approx', 'approx.', 'approximately', 'nearly'])),
+             _mask(low.notna() & high.notna()),
+             _mask(text.str.contains('projected', case=False, na=False))],
+            ['at_least', 'at_most', 'approx', 'range', 'projected'],
+            default=None,
+        ),
+        index=text.index, dtype='string',
+    )
+
+    period = text.str.extract(_PERIOD, flags=_FLAGS)['period']
+    if labels is not None:
+        period = labels.astype('string').str.extract(_PERIOD, flags=_FLAGS)['period'].fillna(period)
+
+    parsed = main.notna()
+    return pd.DataFrame({
+        'value': value.where(parsed),
+        'value_low': low.where(parsed),
+        'value_high': high.where(parsed),
+        'unit': unit.where(parsed),
+        'qualifier': qualifier.where(parsed),
+        'period': period.str.strip(),
+    }, index=text.index)
+
+
+def _is_text(column: pd.Series) -> bool:
+    return column.dtype == object or pd.api.types.is_string_dtype(column.dtype)
+
+
+def _snake(name: str) -> str:
+    out = ''.join(ch.lower() if ch.isalnum() else '_' for ch in name)
+    return '_'.join(filter(None, out.split('_')))
+
+
+def value_columns(frame: pd.DataFrame) -> list[str]:
+    """Text columns (other than the leading label column) that mostly hold numbers."""
+    candidates = [c for c in frame.columns[1:] if _is_text(frame[c])]
+    if not candidates:
+        return []
+    lead = frame[candidates].astype('string')
+    share = lead.apply(lambda col: col.str.match(_LEAD_NUMBER, case=False, na=False).mean())
+    return [c for c in candidates if share[c] >= MIN_PARSED_SHARE]
+
+
+def typed_frame(frame: pd.DataFrame, parsed: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """Append parsed columns to ``frame``; names are bare when there is one value column."""
+    out = frame.copy()
+    single = len(parsed) == 1
+    for column, typed in parsed.items():
+        prefix = '' if single else _snake(column) + '_'
+        for name in TYPED_COLUMNS:
+            out[prefix + name] = typed[name].to_numpy()
+    return out
+
+
+def build_typed(datasets: dict[str, Dataset] | None = None, out_dir: Path = TYPED_DIR) -> dict[str, Path]:
+    """Write a typed copy of every dataset that has display-string value columns."""
+    datasets = datasets if datasets is not None else discover_datasets()
+    frames = {name: read_dataset(ds) for name, ds in datasets.items()}
+
+    pieces, labels = [], []
+    for name, frame in frames.items():
+        label = frame[frame.columns[0]].astype('string')
+        for column in value_columns(frame):
+            index = pd.MultiIndex.from_arrays(
+                [[name] * len(frame), [column] * len(frame), frame.index], names=['dataset', 'column', 'row'])
+            pieces.append(pd.Series(frame[column].astype('string').to_numpy(), index=index))
+            labels.append(pd.Series(label.to_numpy(), index=index))
+    if not pieces:
+        return {}
+
+    parsed = parse_values(pd.concat(pieces), pd.concat(labels))
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = {}
+    for name, by_table in parsed.groupby(level='dataset', sort=False):
+        columns = {column: part.droplevel(['dataset', 'column'])
+                   for column, part in by_table.groupby(level='column', sort=False)}
+        path = out_dir / f'{name}.csv'
+        typed_frame(frames[name], columns).to_csv(path, index=False)
+        written[name] = path
+    return written
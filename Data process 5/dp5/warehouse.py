@@ -0,0 +1,235 @@
+"""Every dataset in one embedded SQLite file, indexed for cross-topic lookups.
+
+``build_warehouse`` loads each dataset (the typed copy when there is one) into
+``derived/warehouse.sqlite`` as a table named after the dataset, with
+snake_case column names. Columns that identify a place or a time get an
+index, and a role in the ``_columns`` catalog:
+
+- ``zip_code``: zip codes, stored as text;
+- ``neighborhood``: neighborhood/area names, matched through a normalized
+  ``<column>_key`` (``'The Heights'`` and ``'Heights'`` both become ``heights``);
+- ``submarket``: submarket names, matched the same way;
+- ``period``: year, month, date and period columns.
+
+When the ``facts`` stage has run, its fact table is loaded as ``facts`` with
+one ``dim_<dimension>`` table per dictionary and an index on every code.
+
+``Warehouse`` is the query side::
+
+    with Warehouse() as wh:
+        wh.zip_profile('77007')          # every table's rows for a zip and its neighborhoods
+        wh.query('SELECT * FROM houston_zip_code_rents_2025 WHERE average_rent > ?', (2000,))
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+from pathlib import Path
+
+import pandas as pd
+
+from .columnar import is_fresh, load_registry, read_table
+from .datasets import DERIVED_DIR, Dataset, discover_datasets
+from .facts import DIMENSIONS, FACTS_DIR
+from .values import TYPED_DIR, _snake
+
+WAREHOUSE_PATH = DERIVED_DIR / 'warehouse.sqlite'
+
+# Column role -> snake_case column names that carry it
+ROLES = {
+    'zip_code': {'zip_code', 'zip', 'zipcode'},
+    'neighborhood': {'neighborhood', 'area'},
+    'submarket': {'submarket'},
+    'period': {'period', 'month', 'year', 'date', 'quarter', 'report_date'},
+}
+# Roles compared through a normalized key column rather than the raw value
+NAME_ROLES = ('neighborhood', 'submarket')
+
+SQL_TYPES = {'int64': 'INTEGER', 'float64': 'REAL', 'bool': 'INTEGER', 'string': 'TEXT', 'dictionary': 'TEXT'}
+
+
+def name_key(names: pd.Series) -> pd.Series:
+    """Normalized place name: lower case, no leading 'the', no parentheticals."""
+    key = names.astype('string').str.lower()
+    key = key.str.replace(r'\(.*?\)', ' ', regex=True).str.replace(r'^\s*the\s+', '', regex=True)
+    return key.str.replace(r'[^a-z0-9]+', ' ', regex=True).str.strip()
+
+
+def _role(column: str) -> str | None:
+    for role, names in ROLES.items():
+        if column in names or column.endswith('_' + role):
+            return role
+    return None
+
+
+def _source_frame(dataset: Dataset) -> tuple[pd.DataFrame, bool]:
+    typed = TYPED_DIR / f'{dataset.name}.csv'
+    if is_fresh(typed, dataset.path):
+        return pd.read_csv(typed), True
+    return read_table(dataset, categories=False), False
+
+
+def _sql_type(series: pd.Series, declared: str | None) -> str:
+    if declared is not None:
+        return SQL_TYPES[declared]
+    if pd.api.types.is_bool_dtype(series.dtype) or pd.api.types.is_integer_dtype(series.dtype):
+        return 'INTEGER'
+    if pd.api.types.is_float_dtype(series.dtype):
+        return 'REAL'
+    return 'TEXT'
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _column_names(frame: pd.DataFrame) -> list[str]:
+    """snake_case names; a display column shadowed by its parsed twin (``Value`` vs
+    ``value``) becomes ``<name>_text``."""
+    names = [_snake(str(c)) for c in frame.columns]
+    seen = set()
+    for i in reversed(range(len(names))):
+        name = names[i]
+        while name in seen:
+            name += '_text'
+        names[i] = name
+        seen.add(name)
+    return names
+
+
+def _load(conn: sqlite3.Connection, dataset: Dataset, declared: dict[str, str]) -> int:
+    frame, typed = _source_frame(dataset)
+    values, catalog = {}, []  # catalog rows: (dataset, column, source column, type, role)
+    for source, name in zip(frame.columns, _column_names(frame)):
+        series = frame[source]
+        role = _role(name)
+        sql_type = 'TEXT' if role == 'zip_code' else _sql_type(series, declared.get(str(source)))
+        values[name] = series.astype('string') if sql_type == 'TEXT' else series
+        if role in NAME_ROLES:
+            catalog.append((dataset.name, name, str(source), sql_type, None))
+            name = f'{name}_key'
+            values[name] = name_key(series)
+        catalog.append((dataset.name, name, str(source), sql_type, role))
+
+    table = _quote(dataset.name)
+    conn.execute(f'CREATE TABLE {table} ({", ".join(f"{_quote(c[1])} {c[3]}" for c in catalog)})')
+    rows = pd.DataFrame(values).astype(object)
+    rows = rows.where(rows.notna(), None)
+    conn.executemany(f'INSERT INTO {table} VALUES ({", ".join("?" * len(catalog))})',
+                     rows.itertuples(index=False, name=None))
+    for _, column, _, _, role in catalog:
+        if role is not None:
+            conn.execute(f'CREATE INDEX {_quote(f"ix_{dataset.name}_{column}")} ON {table} ({_quote(column)})')
+    conn.executemany('INSERT INTO _columns VALUES (?, ?, ?, ?, ?)', catalog)
+    conn.execute('INSERT INTO _datasets VALUES (?, ?, ?, ?, ?)',
+                 (dataset.name, dataset.topic, str(dataset.path), len(frame), int(typed)))
+    return len(frame)
+
+
+def _load_facts(conn: sqlite3.Connection, directory: Path = FACTS_DIR) -> int:
+    facts = pd.read_csv(directory / 'facts.csv')
+    facts = facts.astype(object).where(facts.notna(), None)
+    conn.execute('CREATE TABLE facts (' + ', '.join(
+        f'{c} INTEGER' if c.endswith('_id') else f'{c} REAL' if c.startswith('value') else f'{c} TEXT'
+        for c in facts.columns) + ')')
+    conn.executemany(f'INSERT INTO facts VALUES ({", ".join("?" * len(facts.columns))})',
+                     facts.itertuples(index=False, name=None))
+    for dim in DIMENSIONS:
+        names = pd.read_csv(directory / f'{dim}.csv', keep_default_na=False)
+        conn.execute(f'CREATE TABLE dim_{dim} (id INTEGER PRIMARY KEY, name TEXT UNIQUE)')
+        conn.executemany(f'INSERT INTO dim_{dim} VALUES (?, ?)',
+                         zip(names['id'].tolist(), names['name'].astype(str).tolist()))
+        conn.execute(f'CREATE INDEX ix_facts_{dim}_id ON facts ({dim}_id)')
+    return len(facts)
+
+
+def build_warehouse(datasets: dict[str, Dataset] | None = None, path: Path = WAREHOUSE_PATH) -> dict[str, int]:
+    """Rebuild the warehouse file from scratch; returns rows loaded per dataset."""
+    datasets = datasets if datasets is not None else discover_datasets()
+    registry = {name: dict(map(tuple, columns)) for name, columns in load_registry().items()}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    tmp.unlink(missing_ok=True)
+    loaded = {}
+    conn = sqlite3.connect(tmp)
+    try:
+        with conn:
+            conn.execute('CREATE TABLE _datasets (name TEXT PRIMARY KEY, topic TEXT, source TEXT, '
+                         'rows INTEGER, typed INTEGER)')
+            conn.execute('CREATE TABLE _columns (dataset TEXT, name TEXT, source_name TEXT, type TEXT, role TEXT)')
+            conn.execute('CREATE INDEX ix__columns_role ON _columns (role)')
+            for name, dataset in datasets.items():
+                loaded[name] = _load(conn, dataset, registry.get(name, {}))
+            if (FACTS_DIR / 'facts.csv').exists():
+                loaded['facts'] = _load_facts(conn)
+        conn.execute('ANALYZE')
+    finally:
+        conn.close()
+    try:
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return loaded
+
+
+class Warehouse:
+    """Read-only query access to a built warehouse file."""
+
+    def __init__(self, path: Path = WAREHOUSE_PATH):
+        if not Path(path).exists():
+            raise FileNotFoundError(f'{path} does not exist; run `python -m dp5 stage warehouse`')
+        self.path = Path(path)
+        self.conn = sqlite3.connect(f'file:{self.path}?mode=ro', uri=True, check_same_thread=False)
+
+    def query(self, sql: str, params=()) -> pd.DataFrame:
+        cursor = self.conn.execute(sql, params)
+        names = [d[0] for d in cursor.description or ()]
+        return pd.DataFrame.from_records(cursor.fetchall(), columns=names)
+
+    def tables(self) -> pd.DataFrame:
+        return self.query('SELECT * FROM _datasets ORDER BY name')
+
+    def columns(self, role: str, dataset: str | None = None) -> list[tuple[str, str]]:
+        """``(dataset, column)`` pairs to filter on for a role (the key column for names)."""
+        sql = 'SELECT dataset, name FROM _columns WHERE role = ?'
+        params = (role,) if dataset is None else (role, dataset)
+        if dataset is not None:
+            sql += ' AND dataset = ?'
+        return self.conn.execute(sql + ' ORDER BY dataset, name', params).fetchall()
+
+    def find(self, role: str, value) -> dict[str, pd.DataFrame]:
+        """Rows of every table whose ``role`` column matches ``value``."""
+        if role not in ROLES:
+            raise ValueError(f'unknown role {role!r}; expected one of {", ".join(ROLES)}')
+        if role in NAME_ROLES:
+            value = name_key(pd.Series([value])).iloc[0]
+        elif role == 'zip_code':
+            value = str(value)
+        found = {}
+        for dataset, column in self.columns(role):
+            rows = self.query(f'SELECT * FROM {_quote(dataset)} WHERE {_quote(column)} = ?', (value,))
+            if len(rows):
+                found[dataset] = rows
+        return found
+
+    def zip_profile(self, zip_code) -> dict[str, pd.DataFrame]:
+        """Rows for a zip code, plus rows for the neighborhoods those rows name."""
+        found = self.find('zip_code', zip_code)
+        names = set()
+        for dataset, rows in found.items():
+            for _, column in self.columns('neighborhood', dataset):
+                names.update(rows[column].dropna())
+        for name in sorted(names):
+            for dataset, rows in self.find('neighborhood', name).items():
+                found.setdefault(dataset, rows)
+        return found
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
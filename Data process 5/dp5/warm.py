@@ -0,0 +1,146 @@
+"""Warm execution mode: run scripts inside long-lived, pre-imported interpreters.
+
+Each worker process imports pandas, numpy and plotly once, then executes the
+scripts it is handed with ``exec`` after changing into the script's folder.
+All scripts of a topic folder go to the same worker. The data builders of a
+folder (``script.py`` -> ``script_1.py`` -> ...) share one namespace, as the
+notebook cells they were exported from did, which is what lets scripts such
+as ``Education and Workforce Demographics_ Harris Count/script_2.py`` use
+``pd`` without importing it. Chart scripts get a fresh namespace each.
+"""
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from multiprocessing import get_context
+from pathlib import Path
+
+from . import DATA_ROOT
+from .graph import Script
+from .runner import ScriptResult, _log_path, renders_images
+
+HEAVY_MODULES = ('numpy', 'pandas', 'plotly.graph_objects', 'plotly.express', 'plotly.io')
+
+# Names every notebook cell could rely on, seeded into each namespace
+NOTEBOOK_GLOBALS = {'pd': 'pandas', 'np': 'numpy'}
+
+_worker = {'startup': None, 'reported': False, 'namespaces': {}, 'render': None}
+
+
+def _start_worker(render_env: dict[str, str] | None, columnar: bool = False):
+    start = time.perf_counter()
+    for name in HEAVY_MODULES:
+        importlib.import_module(name)
+    if columnar:
+        from .columnar import install as install_columnar
+        install_columnar()
+    if render_env:
+        from .render import RemoteRenderer, install
+        renderer = RemoteRenderer(render_env['DP5_RENDER_ADDRESS'], render_env['DP5_RENDER_AUTHKEY'])
+        _worker['render'] = (renderer, install)
+    _worker['startup'] = time.perf_counter() - start
+
+
+def _fresh_namespace(path: str) -> dict:
+    namespace = {name: sys.modules[module] for name, module in NOTEBOOK_GLOBALS.items()}
+    namespace.update(__name__='__main__', __file__=path, __builtins__=__builtins__)
+    return namespace
+
+
+def _exec_script(path: str, folder: str, shared: bool, use_render: bool, log_path: str,
+                 profile_dir: str | None = None):
+    if shared:
+        namespace = _worker['namespaces'].setdefault(folder, _fresh_namespace(path))
+        namespace['__file__'] = path
+    else:
+        namespace = _fresh_namespace(path)
+
+    from plotly.basedatatypes import BaseFigure
+    original = (BaseFigure.write_image, BaseFigure.to_image)
+    if use_render and _worker['render'] is not None:
+        renderer, install = _worker['render']
+        install(renderer)
+
+    os.makedirs(os.path.dirname(log_path), exist_ok=True)
+    os.chdir(folder)
+    sys.argv = [path]
+    start = time.perf_counter()
+    returncode = 0
+    with open(log_path, 'w', encoding='utf-8') as log, redirect_stdout(log), redirect_stderr(log):
+        try:
+            with open(path, encoding='utf-8') as fh:
+                code = compile(fh.read(), path, 'exec')
+            if profile_dir is not None:
+                from .profiling import profile_call
+                profile_call(lambda: exec(code, namespace), Path(path).relative_to(DATA_ROOT).as_posix(),
+                             Path(profile_dir))
+            else:
+                exec(code, namespace)
+        except SystemExit as exc:
+            returncode = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+        except BaseException:
+            traceback.print_exc()
+            returncode = 1
+        finally:
+            BaseFigure.write_image, BaseFigure.to_image = original
+    elapsed = time.perf_counter() - start
+
+    startup = None
+    if not _worker['reported']:
+        _worker['reported'] = True
+        startup = _worker['startup']
+    return returncode, elapsed, startup
+
+
+class WarmPool:
+    """``workers`` pre-imported interpreters, with topic folders pinned to one each."""
+
+    def __init__(self, workers: int, render_env: dict[str, str] | None = None, columnar: bool = False,
+                 profile_dir=None):
+        ctx = get_context('spawn')
+        self.render_env = render_env
+        self.profile_dir = str(profile_dir) if profile_dir is not None else None
+        self._pools = [
+            ProcessPoolExecutor(max_workers=1, mp_context=ctx, initializer=_start_worker,
+                                initargs=(render_env, columnar))
+            for _ in range(max(1, workers))
+        ]
+        self._assigned: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.startups: list[float] = []
+
+    def _pool_for(self, script: Script) -> ProcessPoolExecutor:
+        folder = str(script.folder)
+        with self._lock:
+            if folder not in self._assigned:
+                self._assigned[folder] = len(self._assigned) % len(self._pools)
+            return self._pools[self._assigned[folder]]
+
+    def execute(self, script: Script) -> ScriptResult:
+        log_path = str(_log_path(script))
+        future = self._pool_for(script).submit(
+            _exec_script, str(script.path), str(script.folder), script.kind == 'data',
+            renders_images(script), log_path, self.profile_dir,
+        )
+        returncode, elapsed, startup = future.result()
+        if startup is not None:
+            with self._lock:
+                self.startups.append(startup)
+        status = 'ok' if returncode == 0 else 'failed'
+        return ScriptResult(script, status, elapsed, returncode, log_path)
+
+    def close(self):
+        for pool in self._pools:
+            pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
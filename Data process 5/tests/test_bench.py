@@ -0,0 +1,31 @@
+from dp5.bench import BUDGETS, Measurement, compare, format_report, load_baseline, save_baseline
+
+
+def statuses(runs_by_name, baseline):
+    return [c.status for c in compare([Measurement(name, 'warm', runs) for name, runs in runs_by_name], baseline)]
+
+
+def test_compare_flags_changes_beyond_the_threshold_and_floor():
+    baseline = {'results': {f'{name} [warm]': {'median': median} for name, median in
+                            (('slow', 1.0), ('fast', 1.0), ('jitter', 0.01), ('steady', 1.0))}}
+    assert statuses([('slow', [1.3]), ('fast', [0.7]), ('jitter', [0.025]), ('steady', [1.2]), ('added', [1.0])],
+                    baseline) == ['regressed', 'improved', 'ok', 'ok', 'new']
+    assert statuses([('model/cohort', [BUDGETS['model/cohort'] + 0.1])], baseline) == ['over budget']
+    failed = compare([Measurement('slow', 'warm', [], 'build/x failed')], baseline)
+    assert failed[0].status == 'failed'
+    assert '1 regressed' in format_report(compare([Measurement('slow', 'warm', [1.3])], baseline))
+
+
+def test_save_baseline_keeps_entries_not_rerun(tmp_path):
+    path = tmp_path / 'benchmarks.json'
+    save_baseline([Measurement('a', 'cold', [0.3, 0.1, 0.2]), Measurement('b', 'warm', [0.5])], path)
+    save_baseline([Measurement('b', 'warm', [0.4]), Measurement('c', 'warm', [], 'failed')], path)
+    results = load_baseline(path)['results']
+    assert list(results) == ['a [cold]', 'b [warm]']
+    assert results['a [cold]']['median'] == 0.2 and results['a [cold]']['runs'] == 3
+    assert results['b [warm]']['median'] == 0.4
+
+
+def test_every_budget_has_a_baseline():
+    results = load_baseline()['results']
+    assert all(any(key.startswith(f'{name} [') for key in results) for name in BUDGETS)
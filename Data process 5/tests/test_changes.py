@@ -0,0 +1,79 @@
+import json
+
+import pandas as pd
+
+from dp5.changes import build_changes, diff, read_snapshot, snapshot, write_snapshot
+from dp5.datasets import Dataset
+
+FRAME = pd.DataFrame({'Zip_Code': [77002, 77007, 77019], 'Average_Rent': [1800, 1995, 2100]})
+
+
+def test_diff_without_snapshot_inserts_everything():
+    changeset, current = diff(None, FRAME, ['Zip_Code'])
+    assert changeset.counts() == {'inserted': 3, 'updated': 0, 'deleted': 0, 'unchanged': 0}
+    assert current['Zip_Code'].tolist() == [77002, 77007, 77019]
+
+
+def test_diff_finds_inserted_updated_and_deleted_rows():
+    new = pd.DataFrame({'Zip_Code': [77007, 77019, 77098], 'Average_Rent': [1995, 2150, 1900]})
+    changeset, _ = diff(snapshot(FRAME, ['Zip_Code']), new, ['Zip_Code'])
+    assert changeset.counts() == {'inserted': 1, 'updated': 1, 'deleted': 1, 'unchanged': 1}
+    assert changeset.inserted['Zip_Code'].tolist() == [77098]
+    assert changeset.updated['Average_Rent'].tolist() == [2150]
+    assert changeset.deleted['Zip_Code'].tolist() == [77002]
+    assert changeset.to_frame()['_change'].tolist() == ['insert', 'update', 'delete']
+
+
+def test_diff_of_unchanged_frame_is_empty(tmp_path):
+    write_snapshot(snapshot(FRAME, ['Zip_Code']), tmp_path / 'rents.csv')
+    changeset, _ = diff(read_snapshot(tmp_path / 'rents.csv'), FRAME, ['Zip_Code'])
+    assert len(changeset) == 0 and changeset.unchanged == 3
+
+
+def test_snapshot_with_another_key_counts_as_all_deleted():
+    previous = snapshot(FRAME, ['Zip_Code', 'Average_Rent'])
+    changeset, current = diff(previous, FRAME, ['Zip_Code'])
+    assert changeset.counts() == {'inserted': 3, 'updated': 0, 'deleted': 3, 'unchanged': 0}
+    assert list(changeset.deleted.columns) == ['Zip_Code', 'Average_Rent']
+    assert list(current.columns) == ['_key', '_row', 'Zip_Code']
+
+
+def write_dataset(tmp_path, name: str, frame: pd.DataFrame) -> Dataset:
+    path = tmp_path / 'data' / f'{name}.csv'
+    path.parent.mkdir(exist_ok=True)
+    frame.to_csv(path, index=False)
+    return Dataset(name, path)
+
+
+def test_build_changes_against_previous_run(tmp_path):
+    out = tmp_path / 'changes'
+    rents = write_dataset(tmp_path, 'rents', FRAME)
+    years = write_dataset(tmp_path, 'years', pd.DataFrame({'Year': [2025, 2030], 'Population': [1, 2]}))
+    assert build_changes({'rents': rents, 'years': years}, out) == {
+        'rents': {'key': ['Zip_Code'], 'inserted': 3, 'updated': 0, 'deleted': 0, 'unchanged': 0},
+        'years': {'key': ['Year'], 'inserted': 2, 'updated': 0, 'deleted': 0, 'unchanged': 0},
+    }
+
+    FRAME.assign(Average_Rent=[1800, 1995, 2200]).to_csv(rents.path, index=False)
+    assert build_changes({'rents': rents, 'years': years}, out) == {
+        'rents': {'key': ['Zip_Code'], 'inserted': 0, 'updated': 1, 'deleted': 0, 'unchanged': 2},
+    }
+    assert pd.read_csv(out / 'rents.csv').to_dict('records') == [
+        {'_change': 'update', 'Zip_Code': 77019, 'Average_Rent': 2200}]
+    assert not (out / 'years.csv').exists()
+    assert json.loads((out / 'changes.json').read_text())['years']['unchanged'] == 2
+
+
+def test_build_changes_deletes_every_row_of_a_dataset_that_disappeared(tmp_path):
+    out = tmp_path / 'changes'
+    rents = write_dataset(tmp_path, 'rents', FRAME)
+    build_changes({'rents': rents}, out)
+
+    assert build_changes({}, out) == {
+        'rents': {'key': ['Zip_Code'], 'inserted': 0, 'updated': 0, 'deleted': 3, 'unchanged': 0},
+    }
+    deleted = pd.read_csv(out / 'rents.csv')
+    assert deleted['_change'].tolist() == ['delete'] * 3
+    assert deleted['Zip_Code'].tolist() == [77002, 77007, 77019]
+    assert not (out / 'state' / 'rents.csv').exists()
+    assert build_changes({}, out) == {}
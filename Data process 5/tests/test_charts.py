@@ -0,0 +1,30 @@
+import subprocess
+import sys
+
+from dp5 import DATA_ROOT
+from dp5.bench import BUDGETS
+from dp5.charts import abbreviate, percent, thousands, truncate
+
+
+def run_cold(code: str) -> str:
+    proc = subprocess.run([sys.executable, '-c', code], cwd=DATA_ROOT, capture_output=True, text=True, check=True)
+    return proc.stdout.strip()
+
+
+def test_plotly_is_imported_on_first_use_only():
+    assert run_cold('import sys, dp5.charts; print(sorted(m for m in sys.modules if m.startswith("plotly")))') == '[]'
+
+
+def test_first_figure_fits_the_startup_budget():
+    code = ('import sys, time; t = time.perf_counter(); from dp5.charts import go; '
+            'go.Figure(go.Bar(x=[0], y=[0])); print(time.perf_counter() - t, "plotly.express" in sys.modules)')
+    runs = [run_cold(code).split() for _ in range(3)]
+    assert all(express == 'False' for _, express in runs)
+    assert min(float(seconds) for seconds, _ in runs) < BUDGETS['startup/charts']
+
+
+def test_labels():
+    assert thousands([48250, 1234], prefix='$') == ['$48k', '$1k']
+    assert abbreviate([1234, 1.7e6]) == ['1.2k', '1.7m']
+    assert percent([4.3, 12.5], 1) == ['4.3%', '12.5%']
+    assert truncate(['Downtown/Montrose/River Oaks', 'Katy']) == ['Downtown/Montro', 'Katy']
@@ -0,0 +1,55 @@
+import pytest
+
+from dp5 import DATA_ROOT
+from dp5.chartspec import ChartSpec, SpecError, build_all, build_charts, load_specs
+
+ROWS = [{'Zip': '77007', 'Year': 2024, 'Rent': 1500.0}, {'Zip': '77007', 'Year': 2025, 'Rent': 1650.0},
+        {'Zip': '77098', 'Year': 2025, 'Rent': 2100.0}, {'Zip': '77098', 'Year': 2024, 'Rent': 2000.0}]
+
+
+def spec(**fields) -> ChartSpec:
+    return ChartSpec(DATA_ROOT / 'topic', {'output': 'rent.png', 'data': ROWS, **fields})
+
+
+def test_transforms_templates_and_row_values():
+    chart = spec(filter='Year == 2025', derive={'Growth': 'Rent / 1000'}, sort={'by': 'Rent', 'ascending': False},
+                 title={'template': 'Top: {Zip}'}, labels={'x': 'Zip'}, legend='top',
+                 traces=[{'type': 'bar', 'x': 'Zip', 'y': 'Growth',
+                          'text': {'template': '${Rent:thousands:1} ({Growth:.2f})'},
+                          'marker': {'color': {'when': 'Rent > 2000', 'then': 'red', 'else': 'blue'}},
+                          'hovertext': {'map': 'Zip', 'values': {'77007': 'Heights'}, 'default': '?'}}])
+    [built] = build_charts(chart)
+    assert built.key == 'topic/rent.png' and built.path == DATA_ROOT / 'topic' / 'rent.png'
+    [trace] = built.figure['data']
+    assert trace['x'] == ['77098', '77007'] and trace['y'] == [2.1, 1.65]
+    assert trace['text'] == ['$2.1k (2.10)', '$1.6k (1.65)']
+    assert trace['marker']['color'] == ['red', 'blue']
+    assert trace['hovertext'] == ['?', 'Heights']
+    layout = built.figure['layout']
+    assert layout['title'] == {'text': 'Top: 77098'}  # the first row's
+    assert layout['xaxis'] == {'title': {'text': 'Zip'}}
+    assert layout['legend']['orientation'] == 'h'
+
+
+def test_split_traces_and_each_chart():
+    [chart] = build_charts(spec(traces=[{'type': 'scatter', 'mode': 'lines', 'x': 'Year', 'y': 'Rent',
+                                         'split': 'Zip', 'colors': {'77098': '#000'}}]))
+    first, second = chart.figure['data']
+    assert (first['name'], first['y']) == ('77007', [1500.0, 1650.0])
+    assert 'marker' not in first  # no colour mapped for it
+    assert second['marker'] == {'color': '#000'} and second['line'] == {'color': '#000'}
+    charts = build_charts(spec(output='rent_{Zip}.png', each='Zip', traces=[{'type': 'bar', 'x': 'Year', 'y': 'Rent'}]))
+    assert [c.key for c in charts] == ['topic/rent_77007.png', 'topic/rent_77098.png']
+    assert charts[1].figure['data'][0]['y'] == [2100.0, 2000.0]
+
+
+def test_unknown_column_names_the_chart():
+    with pytest.raises(SpecError, match=r"topic/rent.png: no column 'Price'"):
+        build_charts(spec(traces=[{'type': 'bar', 'x': 'Zip', 'y': 'Price'}]))
+
+
+def test_every_checked_in_spec_builds():
+    specs = load_specs()
+    charts = build_all(specs)
+    assert len(charts) >= len(specs) > 0
+    assert all(c.figure['data'] and c.path.suffix in ('.png', '.svg', '.webp', '.jpg') for c in charts)
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dp5 import cohort
+from dp5.datasets import discover_datasets, read_dataset
+
+
+def test_first_year_grows_by_the_stated_total_change():
+    components = read_dataset(discover_datasets()['migration_components']).set_index('Component')['People']
+    regions = cohort.load_regions()
+    total = cohort.project(regions, cohort.SCENARIOS[:1], years=1)[0, 0].sum(axis=(1, 2))
+    assert total[1] - total[0] == pytest.approx(components['Total Change'], abs=1)
+    frame = cohort.projection_frame(regions, cohort.SCENARIOS[:1], years=1)
+    first = frame[(frame['county'] == cohort.BASE_COUNTY) & (frame['year'] == regions.base_year + 1)].iloc[0]
+    share = components['Total Change'] / components.drop('Total Change').sum()
+    assert first['natural_increase'] == pytest.approx(components.filter(like='Natural').iloc[0] * share, abs=1)
+    assert first['net_migration'] == pytest.approx(
+        (components.filter(like='International').iloc[0] + components.filter(like='Domestic').iloc[0]) * share)
+
+
+def test_batched_projection_matches_the_homogeneous_matrices():
+    regions = cohort.load_regions()
+    step = cohort.matrices(regions)
+    state = np.concatenate([regions.population.reshape(len(regions.names), -1),
+                            np.ones((len(regions.names), 1))], axis=1)
+    expected = [state]
+    for _ in range(3):
+        expected.append(np.einsum('scij,scj->sci', step, np.broadcast_to(expected[-1], step.shape[:-1])))
+    out = cohort.project(regions, years=3)
+    np.testing.assert_allclose(out[:, :, 3].reshape(*out.shape[:2], -1), expected[-1][..., :-1], rtol=1e-12)
+
+
+def test_five_year_groups_spreads_by_single_year():
+    groups = cohort.five_year_groups(pd.Series({'5-17': 13.0, '75+': 100.0}))
+    assert groups[1:4].tolist() == [5, 5, 3]
+    assert groups[15:].tolist() == [100 * s for s in cohort.OLDEST_SPLIT]
+    assert groups.sum() == pytest.approx(113)
+
+
+def test_median_age_of_an_even_population():
+    population = np.ones((2, cohort.N))  # 0 to 100, evenly
+    assert cohort.median_age(population) == pytest.approx(50)
+    assert cohort.population_between(population, 18, 65) == pytest.approx(2 * 47 / 5)
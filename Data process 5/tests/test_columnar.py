@@ -0,0 +1,45 @@
+import os
+
+import pandas as pd
+import pytest
+
+from dp5 import columnar
+from dp5.columnar import SchemaError, check_registry, infer_columns, read_table, to_arrow, write_twins
+from dp5.datasets import Dataset
+
+pytest.importorskip('pyarrow')
+
+FRAME = pd.DataFrame({'Zip_Code': [77007, 77098], 'Market_Tier': ['A', 'B'], 'Rent': [1850.5, 2100.0],
+                      'Units': [120, 80], 'Neighborhood': ['Heights', 'Upper Kirby']})
+
+
+def test_inferred_schema_keeps_zips_as_text_and_encodes_tiers():
+    assert infer_columns(FRAME) == [['Zip_Code', 'string'], ['Market_Tier', 'dictionary'], ['Rent', 'float64'],
+                                    ['Units', 'int64'], ['Neighborhood', 'string']]
+
+
+def test_drift_from_the_declared_schema_is_an_error():
+    columns = infer_columns(FRAME)
+    with pytest.raises(SchemaError, match='do not match'):
+        to_arrow(FRAME.drop(columns='Units'), columns)
+    with pytest.raises(SchemaError, match="'Rent' is not float64"):
+        to_arrow(FRAME.assign(Rent=['1,850', 'n/a']), columns)
+
+
+def test_twins_are_read_while_fresh(tmp_path, monkeypatch):
+    monkeypatch.setattr(columnar, 'PARQUET_DIR', tmp_path / 'parquet')
+    monkeypatch.setattr(columnar, 'ARROW_DIR', tmp_path / 'arrow')
+    path = tmp_path / 'rents.csv'
+    FRAME.to_csv(path, index=False)
+    write_twins(FRAME, 'rents', infer_columns(FRAME))
+    table = read_table(Dataset('rents', path))
+    assert table['Zip_Code'].tolist() == ['77007', '77098']  # the CSV would give integers
+    assert isinstance(table['Market_Tier'].dtype, pd.CategoricalDtype)
+    assert read_table(Dataset('rents', path), categories=False)['Market_Tier'].dtype != 'category'
+    later = path.stat().st_mtime_ns + 10 ** 9
+    os.utime(path, ns=(later, later))  # the CSV changed since
+    assert read_table(Dataset('rents', path))['Zip_Code'].tolist() == [77007, 77098]
+
+
+def test_every_dataset_matches_its_declared_schema():
+    assert check_registry() == {}
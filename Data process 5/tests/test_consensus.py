@@ -0,0 +1,36 @@
+import pandas as pd
+import pytest
+
+from dp5.consensus import Metric, consensus, summary_values
+from dp5.datasets import discover_datasets, read_dataset
+
+METRICS = (Metric('Active_Listings', 'Listings', 'listings', weighted=False), Metric('Rate', 'Rate', 'percent'))
+
+
+def test_weighted_mean_and_bootstrap_of_two_providers():
+    providers = pd.DataFrame({'Active_Listings': [1, 3], 'Rate': [10.0, 30.0]})
+    listings, rate = consensus(providers, METRICS).itertuples(index=False)
+    assert listings.value == 2  # a plain mean
+    assert rate.value == 25  # (1 x 10 + 3 x 30) / 4
+    # Resamples are both first (10), both second (30) or one each (25)
+    assert (rate.value_low, rate.value_high) == (10, 30)
+    assert (rate.source_min, rate.source_max, rate.sources) == (10, 30, 2)
+    assert rate.qualifier == 'listing-weighted, 95% bootstrap interval'
+
+
+def test_identical_providers_have_no_interval():
+    providers = pd.DataFrame({'Active_Listings': [5, 50, 500], 'Rate': [40.0] * 3})
+    rate = consensus(providers, METRICS).iloc[1]
+    assert rate['value'] == rate['value_low'] == rate['value_high'] == pytest.approx(40)
+
+
+def test_summary_rows_match_the_published_summary():
+    datasets = discover_datasets()
+    estimates = consensus(read_dataset(datasets['houston_str_market_data']))
+    occupancy = estimates.set_index('metric').loc['Average Occupancy Rate']
+    weighted = (8656 * 43.1 + 13358 * 59 + 10809 * 59 + 20161 * 49 + 13000 * 45) / 65984
+    assert occupancy['value'] == pytest.approx(weighted)
+    assert occupancy['value_low'] < occupancy['value'] < occupancy['value_high']
+    summary = read_dataset(datasets['houston_str_market_summary']).set_index('Metric')['Value']
+    for label, text in summary_values(estimates).items():
+        assert summary[label] == text
@@ -0,0 +1,75 @@
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from dp5 import dbload
+from dp5.datasets import Dataset, discover_datasets
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    monkeypatch.setattr(dbload, 'CHANGES_DIR', tmp_path / 'changes')  # keep snapshots out of derived/
+    path = tmp_path / 'dp5.db'
+    dbload.create_sqlite_schema(path, ['RentalMarket'])
+    return path
+
+
+def relabelled(tmp_path, zip_code: str, label: str) -> dict[str, Dataset]:
+    datasets = discover_datasets()
+    rents = pd.read_csv(datasets['houston_zip_code_rents_2025'].path)
+    rents.loc[rents['Zip_Code'] == int(zip_code), 'Neighborhood'] = label
+    path = tmp_path / 'houston_zip_code_rents_2025.csv'
+    rents.to_csv(path, index=False)
+    datasets['houston_zip_code_rents_2025'] = Dataset(path.stem, path)
+    return datasets
+
+
+def zip_rows(path, zip_code: str) -> list[tuple]:
+    with sqlite3.connect(path) as conn:
+        return conn.execute('SELECT "submarket", "neighborhood" FROM "RentalMarket" WHERE "zipCode" = ?',
+                            (zip_code,)).fetchall()
+
+
+def row_count(path) -> int:
+    with sqlite3.connect(path) as conn:
+        return conn.execute('SELECT COUNT(*) FROM "RentalMarket"').fetchone()[0]
+
+
+@pytest.mark.parametrize('full', [False, True])
+def test_relabelled_zip_updates_its_row(database, tmp_path, full):
+    url = f'sqlite:///{database}'
+    dbload.load_all(url, ['RentalMarket'])
+    rows = row_count(database)
+    assert zip_rows(database, '77007') == [('Heights', None)]
+
+    [result] = dbload.load_all(url, ['RentalMarket'], full=full,
+                               datasets=relabelled(tmp_path, '77007', 'Washington Avenue'))
+    assert zip_rows(database, '77007') == [('Washington Avenue', None)]
+    assert row_count(database) == rows
+    assert result.inserted == result.deleted == 0
+    if not full:
+        assert result.updated == 1
+
+
+def test_kinds_match_their_own_key():
+    spec = dbload.MODELS['RentalMarket']
+    frame = pd.DataFrame({'zipCode': ['77007', None, None], 'neighborhood': [None, 'Heights', None],
+                          'submarket': ['Heights', None, 'Heights'], 'reportDate': dbload.REPORT_DATE})
+    assert dbload.row_kinds(frame, spec).tolist() == [0, 1, 2]
+    keys = dbload.match_keys(frame, spec)
+    assert keys['submarket'].isna().tolist() == [True, True, False]
+
+
+def test_snapshot_with_another_key_reloads_every_row(database):
+    url = f'sqlite:///{database}'
+    dbload.load_all(url, ['RentalMarket'])
+    rows = row_count(database)
+    state = dbload._state_dir(url) / 'RentalMarket.csv'
+    previous = pd.read_csv(state, dtype=str)
+    previous.insert(2, 'occupancyClass', None)  # as if keyed on another column as well
+    previous.to_csv(state, index=False)
+
+    [result] = dbload.load_all(url, ['RentalMarket'])
+    assert result.deleted == result.inserted == rows
+    assert row_count(database) == rows
@@ -0,0 +1,43 @@
+import pandas as pd
+import pytest
+
+from dp5.datasets import Dataset
+from dp5.facts import Facts, fact_columns, metric_names
+
+
+@pytest.fixture
+def facts(tmp_path) -> Facts:
+    tables = {
+        'harris_county_income_stats': pd.DataFrame({
+            'Metric': ['Median Household Income (Harris County)', 'Median Household Income (Texas)',
+                       'Poverty Rate (2023)'],
+            'Value': ['$70,789', '$75,780', '16.5%'], 'Source': ['ACS', 'ACS', 'ACS']}),
+        'houston_jobs': pd.DataFrame({'Sector': ['Energy', 'Health Care'], 'Value': ['+9,700 jobs', '12,000 jobs'],
+                                      'Period': ['2024', '2024']}),
+        'houston_rents': pd.DataFrame({'Zip_Code': [77007], 'Average_Rent': [1995]}),  # not a fact table
+    }
+    datasets = {}
+    for name, frame in tables.items():
+        frame.to_csv(tmp_path / f'{name}.csv', index=False)
+        datasets[name] = Dataset(name, tmp_path / f'{name}.csv')
+    return Facts.build(datasets)
+
+
+def test_metric_names_drop_geography_and_periods():
+    labels = pd.Series(['Median Household Income (Harris County)', 'Job Growth Houston Metro (2024)'])
+    assert metric_names(labels).tolist() == ['Median Household Income', 'Job Growth']
+    assert fact_columns(pd.DataFrame(columns=['Zip_Code', 'Average_Rent'])) is None
+
+
+def test_facts_are_coded_by_dimension(facts):
+    assert len(facts.frame) == 5
+    income = facts.metric('Median Household Income')
+    assert dict(zip(income['geography'], income['value'])) == {'Harris County': 70789, 'Texas': 75780}
+    poverty = facts.select(metric='Poverty Rate').iloc[0]
+    assert (poverty['geography'], poverty['period'], poverty['unit'], poverty['value']) == \
+        ('Harris County', '2023', 'percent', 16.5)  # geography from the dataset name
+    jobs = facts.select(dataset='houston_jobs')
+    assert set(jobs['geography']) == {'Houston Metro'} and set(jobs['unit']) == {'jobs'}
+    assert facts.pivot(metric='Median Household Income').loc['Median Household Income', 'Texas'] == 75780
+    with pytest.raises(KeyError, match='unknown metric'):
+        facts.metric('Rainfall')
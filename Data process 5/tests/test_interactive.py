@@ -0,0 +1,42 @@
+import json
+import os
+
+from dp5 import DATA_ROOT
+from dp5.charts import template_spec
+from dp5.chartspec import Chart
+from dp5.interactive import MANIFEST_FILE, export_interactive, trim
+
+
+def chart(key: str, y: list) -> Chart:
+    figure = {'data': [{'type': 'bar', 'x': ['a', 'b'], 'y': y}],
+              'layout': {'template': template_spec(), 'title': {'text': key}}}
+    return Chart(key, DATA_ROOT / key, figure)
+
+
+def test_trim_rounds_to_significant_digits():
+    assert trim({'y': [1234.56789, 0.000123456789, 2.0, float('nan')], 'name': 'x'}, 4) == \
+        {'y': [1235, 0.0001235, 2, None], 'name': 'x'}
+
+
+def test_export_shares_the_template_and_skips_unchanged_files(tmp_path):
+    [path] = export_interactive([chart('topic/rent.png', [1 / 3, 2.0])], tmp_path)
+    assert path == tmp_path / 'topic' / 'rent.json'
+    assert json.loads(path.read_text()) == {'data': [{'type': 'bar', 'x': ['a', 'b'], 'y': [0.333333, 2]}],
+                                            'layout': {'title': {'text': 'topic/rent.png'}}}
+    manifest = json.loads((tmp_path / MANIFEST_FILE).read_text())
+    assert manifest['charts'] == {'topic/rent.png': {'path': 'topic/rent.json', 'bytes': path.stat().st_size}}
+    assert json.loads((tmp_path / manifest['template']).read_text()) == template_spec()
+    assert (tmp_path / manifest['plotly']).exists()
+
+    os.utime(path, (0, 0))
+    export_interactive([chart('topic/rent.png', [1 / 3, 2.0])], tmp_path)
+    assert path.stat().st_mtime == 0
+
+
+def test_export_without_merge_removes_stale_charts(tmp_path):
+    export_interactive([chart('topic/a.png', [1]), chart('topic/b.png', [2])], tmp_path)
+    export_interactive([chart('topic/c.png', [3])], tmp_path, merge=True)
+    assert sorted(json.loads((tmp_path / MANIFEST_FILE).read_text())['charts']) == \
+        ['topic/a.png', 'topic/b.png', 'topic/c.png']
+    export_interactive([chart('topic/a.png', [1])], tmp_path)
+    assert sorted(p.name for p in (tmp_path / 'topic').iterdir()) == ['a.json']
@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+from dp5 import graph, manifest
+from dp5.graph import Script
+from dp5.manifest import Manifest, order_only_deps
+from dp5.runner import ScriptResult, incremental, run_graph
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    monkeypatch.setattr(graph, 'DATA_ROOT', tmp_path)
+    monkeypatch.setattr(manifest, 'DATA_ROOT', tmp_path)
+    folder = tmp_path / 'Topic'
+    folder.mkdir()
+    (folder / 'script.py').write_text("import pandas as pd\npd.read_csv('a.csv').to_csv('b.csv')\n")
+    (folder / 'a.csv').write_text('x\n1\n')
+    (folder / 'b.csv').write_text('x\n1\n')
+    return folder
+
+
+def script(folder) -> Script:
+    return Script(folder / 'script.py', {folder / 'a.csv'}, {folder / 'b.csv'})
+
+
+def test_fresh_until_an_input_or_output_changes(tree, tmp_path):
+    built = Manifest(tmp_path / 'manifest.json')
+    s = script(tree)
+    fingerprint = built.fingerprint(s, set())
+    built.record(s, fingerprint)
+    built.save()
+
+    loaded = Manifest(tmp_path / 'manifest.json')
+    assert loaded.is_fresh(s, loaded.fingerprint(s, set()))
+    (tree / 'b.csv').write_text('x\n2\n')  # output edited by hand
+    assert not loaded.is_fresh(s, fingerprint)
+    (tree / 'a.csv').write_text('x\n3\n')
+    assert loaded.fingerprint(s, set()) != fingerprint
+
+
+def test_chained_script_source_is_part_of_the_fingerprint(tree, tmp_path):
+    (tree / 'script_1.py').write_text("print('first')\n")
+    before = Script(tree / 'script_1.py')
+    built = Manifest(tmp_path / 'manifest.json')
+    fingerprint = built.fingerprint(script(tree), {before})
+    (tree / 'script_1.py').write_text("print('changed')\n")
+    assert built.fingerprint(script(tree), {before}) != fingerprint
+    producer = Script(tree / 'make_a.py', outputs={tree / 'a.csv'})
+    assert order_only_deps(script(tree), {before, producer}) == {before}
+
+
+def test_hashes_are_cached_by_size_and_mtime(tree, tmp_path):
+    built = Manifest(tmp_path / 'manifest.json')
+    path = tree / 'a.csv'
+    first = built.file_hash(path)
+    stat = path.stat()
+    path.write_text('x\n9\n')  # same size
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert built.file_hash(path) == first  # only stat is consulted
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert built.file_hash(path) != first
+    assert built.file_hash(tree / 'missing.csv') is None
+
+
+def test_incremental_skips_fresh_scripts_and_downstream_of_failures(tree, tmp_path):
+    first, second = script(tree), Script(tree / 'script_1.py', {tree / 'b.csv'}, {tree / 'c.csv'})
+    (tree / 'script_1.py').write_text("print('second')\n")
+    deps = {first: set(), second: {first}}
+    ran, outcome = [], {}
+
+    def execute(s):
+        ran.append(s.name)
+        (tree / 'c.csv').write_text('x\n')
+        return ScriptResult(s, outcome.get(s.name, 'ok'))
+
+    built = Manifest(tmp_path / 'manifest.json')
+    statuses = {r.script.name: r.status for r in run_graph(deps, 2, incremental(built, deps, execute))}
+    assert statuses == {'script.py': 'ok', 'script_1.py': 'ok'}
+    statuses = {r.script.name: r.status for r in run_graph(deps, 2, incremental(built, deps, execute))}
+    assert statuses == {'script.py': 'cached', 'script_1.py': 'cached'} and len(ran) == 2
+
+    (tree / 'a.csv').write_text('x\n5\n')
+    outcome['script.py'] = 'failed'
+    statuses = {r.script.name: r.status for r in run_graph(deps, 2, incremental(built, deps, execute))}
+    assert statuses == {'script.py': 'failed', 'script_1.py': 'skipped'}
+    assert first.key not in built.scripts  # forgotten, so it runs next time
@@ -0,0 +1,51 @@
+import json
+import time
+
+import pytest
+
+from dp5.profiling import by_topic, categorize, load_summaries, profile_call, write_collapsed
+
+
+def test_categorize_charts_each_stack_to_its_first_matching_category():
+    stacks = {
+        'a.py:1(main);<frozen importlib._bootstrap>:1(_find_and_load)': 1.0,
+        'a.py:1(main);dp5/render.py:10(render_set);pandas/io/common.py:1(get_handle)': 2.0,  # render beats io
+        'a.py:1(main);pandas/io/parsers.py:1(read_csv)': 0.5,
+        'a.py:1(main);numpy/core.py:1(dot)': 0.25,
+    }
+    assert categorize(stacks) == {'import': 1.0, 'compute': 0.25, 'render': 2.0, 'io': 0.5}
+
+
+def test_write_collapsed_drops_short_stacks(tmp_path):
+    path = tmp_path / 'x.collapsed'
+    write_collapsed({'b;c': 0.002, 'a': 0.00001}, path)
+    assert path.read_text() == 'b;c 2000\n'
+
+
+def spin(seconds: float) -> list:
+    end, chunks = time.perf_counter() + seconds, []
+    while time.perf_counter() < end:
+        chunks.append(bytearray(10_000))
+    return chunks
+
+
+def test_profile_call_writes_all_three_files(tmp_path):
+    assert len(profile_call(lambda: spin(0.05)[:1], 'topic/script_1.py', tmp_path)) == 1
+    base = tmp_path / 'topic__script_1'
+    assert {p.suffix for p in tmp_path.iterdir()} == {'.prof', '.collapsed', '.json'}
+    summary = json.loads(base.with_suffix('.json').read_text())
+    assert summary['script'] == 'topic/script_1.py' and summary['topic'] == 'topic'
+    assert summary['wall'] >= 0.05
+    assert summary['compute'] > 0 and summary['peak_mb'] > 0
+    assert 'test_profiling.py' in base.with_suffix('.collapsed').read_text()
+    [row] = by_topic(load_summaries(tmp_path))
+    assert row['topic'] == 'topic' and row['scripts'] == 1
+
+
+def test_profile_is_written_when_the_script_fails(tmp_path):
+    def fail():
+        raise ValueError('boom')
+
+    with pytest.raises(ValueError):
+        profile_call(fail, 'topic/broken.py', tmp_path)
+    assert (tmp_path / 'topic__broken.json').exists()
@@ -0,0 +1,142 @@
+import json
+import struct
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from dp5.render import (RemoteRenderer, RenderResult, RenderService, _render_set, cache_key, figure_json,
+                        infer_format, install, serve)
+from dp5.render_cache import RenderCache
+
+FIGURE = {'data': [{'type': 'bar', 'x': [1, 2], 'y': [3, 4]}], 'layout': {}}
+
+
+def service_with(tmp_path, cached_formats, monkeypatch):
+    cache = RenderCache(tmp_path / 'cache')
+    for fmt in cached_formats:
+        cache.put(cache_key(figure_json(FIGURE), fmt, 600, 400, 1), fmt, b'image')
+    service = RenderService(workers=1, cache=cache)
+    rendered = []
+
+    def dispatch(finish, task, *args):  # stands in for the Kaleido workers
+        rendered.append(args[1])
+        future = Future()
+        future.set_result(None)
+        return future
+    monkeypatch.setattr(service, '_dispatch', dispatch)
+    return service, cache, rendered
+
+
+def targets(tmp_path):
+    return [(tmp_path / 'chart.png', 'png', 1), (tmp_path / 'chart.svg', 'svg', 1)]
+
+
+def test_fully_cached_set_is_copied_from_the_cache(tmp_path, monkeypatch):
+    service, cache, rendered = service_with(tmp_path, ['png', 'svg'], monkeypatch)
+    results = service.submit_set(FIGURE, targets(tmp_path), 600, 400).result()
+    assert [r.cached for r in results] == [True, True] and not rendered
+    assert (cache.hits, cache.misses) == (2, 0)
+    assert (tmp_path / 'chart.svg').read_bytes() == b'image'
+
+
+def test_partly_cached_set_is_rendered_without_counting_hits(tmp_path, monkeypatch):
+    service, cache, rendered = service_with(tmp_path, ['png'], monkeypatch)
+    service.submit_set(FIGURE, targets(tmp_path), 600, 400)
+    assert len(rendered) == 1
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_concurrent_puts_of_one_image_do_not_clobber_each_other(tmp_path):
+    cache = RenderCache(tmp_path / 'cache')
+    images = [bytes([i]) * 50_000 for i in range(8)]
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda data: cache.put('same', 'png', data), images * 4))
+    assert (tmp_path / 'cache' / 'same.png').read_bytes() in images
+    assert not list((tmp_path / 'cache').glob('*.tmp'))
+
+
+def decode_png(data: bytes) -> np.ndarray:
+    """RGB pixels of an 8-bit, non-interlaced RGB or RGBA PNG."""
+    pos, idat, header = 8, [], None
+    while pos < len(data):
+        length, kind = struct.unpack('>I4s', data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + length]
+        if kind == b'IHDR':
+            header = struct.unpack('>IIBBBBB', body)
+        elif kind == b'IDAT':
+            idat.append(body)
+        pos += 12 + length
+    width, height, depth, color, _, _, interlace = header
+    assert depth == 8 and interlace == 0 and color in (2, 6)
+    channels = 4 if color == 6 else 3
+    raw = np.frombuffer(zlib.decompress(b''.join(idat)), np.uint8).reshape(height, 1 + width * channels)
+    out = np.zeros((height, width * channels), np.int32)
+    prev = np.zeros(width * channels, np.int32)
+    for y in range(height):
+        kind, line = raw[y, 0], raw[y, 1:].astype(np.int32)
+        if kind == 0:
+            row = line
+        elif kind == 2:
+            row = (line + prev) & 255
+        else:  # sub, average, paeth: each byte depends on the one to its left
+            row = np.zeros_like(line)
+            for x in range(len(line)):
+                a = row[x - channels] if x >= channels else 0
+                b = prev[x]
+                c = prev[x - channels] if x >= channels else 0
+                if kind == 1:
+                    guess = a
+                elif kind == 3:
+                    guess = (a + b) // 2
+                else:
+                    pa, pb, pc = abs(b - c), abs(a - c), abs(a + b - 2 * c)
+                    guess = a if pa <= pb and pa <= pc else b if pb <= pc else c
+                row[x] = (line[x] + guess) & 255
+        out[y] = row
+        prev = row
+    return out.reshape(height, width, channels)[..., :3]
+
+
+@pytest.mark.parametrize('scale', [1, 2])
+def test_png_from_the_svg_matches_a_direct_render(tmp_path, scale):
+    pytest.importorskip('kaleido')
+    import plotly.io as pio
+    figure = {'data': [{'type': 'bar', 'x': ['Heights', 'Katy', 'Midtown'], 'y': [3, 1, 2], 'text': ['3', '1', '2']}],
+              'layout': {'title': {'text': 'Rent growth (%)'}}}
+    _render_set(json.dumps(figure), [(str(tmp_path / 'chart.png'), 'png', scale)], 300, 200)
+    via_svg = decode_png((tmp_path / 'chart.png').read_bytes())
+    direct = decode_png(pio.to_image(figure, format='png', width=300, height=200, scale=scale, validate=False))
+    assert via_svg.shape == direct.shape == (200 * scale, 300 * scale, 3)
+    difference = np.abs(via_svg - direct).max(axis=-1)
+    assert difference.mean() < 1 and (difference > 32).mean() < 0.005
+
+
+def test_infer_format():
+    assert infer_format('chart.JPG', None) == 'jpeg'
+    assert infer_format('chart.svg', '.PNG') == 'png'
+    assert infer_format(None, None) == 'png'
+
+
+def test_scripts_reach_the_service_over_its_socket(tmp_path, monkeypatch):
+    pytest.importorskip('plotly')
+    import plotly.graph_objects as go
+    from plotly.basedatatypes import BaseFigure
+    service, calls = RenderService(workers=1), []
+
+    def render(fig, path=None, format=None, width=None, height=None, scale=None):
+        calls.append((json.loads(fig)['data'][0]['type'], path, format, width, scale))
+        return RenderResult(None if path else b'image', path, format, 0.01)
+    monkeypatch.setattr(service, 'render', render)
+    renderer = RemoteRenderer.from_env(serve(service))
+    for name in ('write_image', 'to_image'):  # install() patches these for the rest of the process
+        monkeypatch.setattr(BaseFigure, name, getattr(BaseFigure, name))
+    install(renderer, log=lambda line: None)
+
+    figure = go.Figure(go.Bar(x=[1, 2], y=[3, 4]))
+    figure.write_image(tmp_path / 'chart.jpg', width=300)
+    assert figure.to_image(format='svg', scale=2) == b'image'
+    assert calls == [('bar', str((tmp_path / 'chart.jpg').resolve()), 'jpeg', 300, None),
+                     ('bar', None, 'svg', None, 2)]
+    assert RemoteRenderer.from_env({}) is None
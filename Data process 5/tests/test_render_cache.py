@@ -0,0 +1,40 @@
+import json
+import os
+
+from dp5.render_cache import RenderCache, cache_key
+
+FIGURE = {'data': [{'type': 'bar', 'y': [3, 4]}], 'layout': {'title': {'text': 'Rents'}}}
+
+
+def test_key_is_canonical_in_the_figure_and_strict_in_the_options():
+    figure = json.dumps(FIGURE)
+    key = cache_key(figure, 'png', 600, 400, 1)
+    assert cache_key(json.dumps(FIGURE, indent=2, sort_keys=True), 'png', 600, 400, 1) == key
+    assert cache_key('{"layout": {"title": {"text": "Rents"}}, "data": [{"y": [3, 4], "type": "bar"}]}',
+                     'png', 600, 400, 1) == key
+    others = {cache_key(figure, 'svg', 600, 400, 1), cache_key(figure, 'png', 600, 400, 2),
+              cache_key(json.dumps({**FIGURE, 'layout': {}}), 'png', 600, 400, 1)}
+    assert len(others) == 3 and key not in others
+
+
+def test_least_recently_used_images_are_evicted_first(tmp_path):
+    cache = RenderCache(tmp_path, max_bytes=300)
+    for age, key in enumerate('abc'):
+        cache.put(key, 'png', bytes(100))
+        os.utime(tmp_path / f'{key}.png', (1_000_000 + age, 1_000_000 + age))
+    cache = RenderCache(tmp_path, max_bytes=300)  # picks the entries and their ages up from disk
+    assert cache.get('a', 'png') is not None  # now the most recent
+    cache.put('d', 'png', bytes(100))
+    assert sorted(p.stem for p in tmp_path.iterdir()) == ['a', 'c', 'd']
+    assert cache.get('b', 'png') is None
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'hit_rate': 0.5, 'evictions': 1, 'entries': 3,
+                                  'bytes': 300, 'max_bytes': 300}
+
+
+def test_put_copies_a_rendered_file(tmp_path):
+    source = tmp_path / 'chart.png'
+    source.write_bytes(b'rendered')
+    cache = RenderCache(tmp_path / 'cache')
+    cache.put('k', 'png', source=source)
+    assert ('k', 'png') in cache and ('k', 'svg') not in cache
+    assert cache.get('k', 'png').read_bytes() == b'rendered'
@@ -0,0 +1,67 @@
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from dp5 import dbload
+from dp5.datasets import discover_datasets
+from dp5.rentindex import latest_by_bedroom, load_observations, normalize_observations, rent_index
+
+RENTS = [1000, 1100, 1200, 1300, 1400, 1500, 1600, 1700, 1800, 5000]
+
+
+def observations() -> pd.DataFrame:
+    raw = pd.DataFrame({
+        'Zip_Code': ['77007'] * 10 + ['77098', '77098', 'TX 77098'],
+        'Beds': ['2 bd'] * 10 + ['studio', '?', '1'],
+        'Date': ['2025-03-04'] * 10 + ['2025-01-10', '2025-02-01', '2025-02-20'],
+        'Monthly_Rent': RENTS + [1200, 2000, 150],  # 150 is below RENT_RANGE
+    })
+    return normalize_observations(raw)
+
+
+def test_statistics_of_one_cell():
+    index = rent_index(observations())
+    [row] = index[(index['zip'] == '77007') & (index['bedrooms'] == '2BR')].itertuples()
+    assert row.month == '2025-03'
+    assert row.observations == 10
+    assert row.median == 1450
+    assert row.p25 == 1225  # position 2.25 between 1200 and 1300
+    assert row.p75 == 1675
+    assert row.trimmed_mean == pytest.approx(1450)  # 1000 and 5000 cut
+
+
+def test_unknown_bedrooms_count_only_toward_all():
+    index = rent_index(observations()).set_index(['zip', 'bedrooms', 'month'])
+    assert index.loc[('77098', 'All', '2025-02'), 'observations'] == 1
+    assert index.loc[('77098', 'All', '2025-01'), 'median'] == 1200
+    assert ('77098', '1BR', '2025-02') not in index.index  # its only rent is out of range
+    assert len(index.xs('77007', level='zip')) == 2  # 2BR and All
+
+
+def test_latest_by_bedroom_takes_each_zips_latest_month():
+    latest = latest_by_bedroom(rent_index(observations()))
+    assert latest.loc['77007', '2BR'] == 1450
+    assert latest.loc['77098', 'All'] == 2000
+    assert pd.isna(latest.loc['77098', 'Studio'])  # January, not the latest month
+
+
+def test_snapshot_fallback_indexes_the_average_rent_as_all(tmp_path):
+    datasets = discover_datasets()
+    snapshot = pd.read_csv(datasets['houston_zip_code_rents_2025'].path)
+    index = rent_index(load_observations(tmp_path / 'none', datasets))
+    assert set(index['bedrooms']) == {'All'}
+    assert set(index['month']) == {'2025-01'}
+    medians = index.set_index('zip')['median']
+    assert medians.to_dict() == dict(zip(snapshot['Zip_Code'].astype(str), snapshot['Average_Rent'].astype(float)))
+
+
+def test_zip_rows_load_the_snapshot_rent(tmp_path, monkeypatch):
+    monkeypatch.setattr(dbload, 'CHANGES_DIR', tmp_path / 'changes')
+    path = tmp_path / 'dp5.db'
+    dbload.create_sqlite_schema(path, ['RentalMarket'])
+    dbload.load_all(f'sqlite:///{path}', ['RentalMarket'])
+    snapshot = pd.read_csv(discover_datasets()['houston_zip_code_rents_2025'].path)
+    with sqlite3.connect(path) as conn:
+        rents = dict(conn.execute('SELECT "zipCode", "avgRentAll" FROM "RentalMarket" WHERE "zipCode" IS NOT NULL'))
+    assert rents == dict(zip(snapshot['Zip_Code'].astype(str), snapshot['Average_Rent'].astype(float)))
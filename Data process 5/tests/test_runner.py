@@ -0,0 +1,17 @@
+from dp5 import DATA_ROOT
+from dp5.graph import Script
+from dp5.runner import ScriptResult, run_graph
+
+
+def test_failure_skips_everything_downstream():
+    a, b, c, d = (Script(DATA_ROOT / 'Topic' / f'{name}.py') for name in 'abcd')
+    deps = {a: set(), b: {a}, c: {b}, d: set()}
+    ran = []
+
+    def execute(script):
+        ran.append(script.path.stem)
+        return ScriptResult(script, 'failed' if script is a else 'ok')
+
+    statuses = {r.script.path.stem: r.status for r in run_graph(deps, 2, execute)}
+    assert statuses == {'a': 'failed', 'b': 'skipped', 'c': 'skipped', 'd': 'ok'}
+    assert sorted(ran) == ['a', 'd']
@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+
+from dp5.strcalendar import booking_chance, demand_factors, simulate_calendar
+from dp5.strsim import load_market
+
+
+def test_booking_chance_averages_the_occupancy_and_stays_under_one():
+    demand, _ = demand_factors()
+    occupancy = np.array([0.1, 0.5, 0.8, 0.95, 1.0])
+    chance = booking_chance(occupancy, demand)
+    assert chance.max() <= 1
+    np.testing.assert_allclose(chance.mean(axis=1), occupancy, atol=1e-9)
+    # Under the cap the chance is simply occupancy x demand
+    np.testing.assert_allclose(chance[:2], occupancy[:2, None] * demand, atol=1e-12)
+    assert (chance[3] == 1).sum() > 0 and chance[3].min() > 0.95 * demand.min()
+
+
+def test_simulated_occupancy_matches_the_market():
+    market = load_market()
+    calendar = simulate_calendar(market, listings=20_000, seed=1)
+    booked = np.unpackbits(calendar.booked, axis=1, count=calendar.days).mean()
+    assert booked == pytest.approx(market.occupancy.mean(), abs=0.005)
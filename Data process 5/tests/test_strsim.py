@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from dp5.strsim import NIGHTS, SHARD, Market, _beta_parameters, load_market, revenue_percentiles, simulate
+
+
+def market(fee: float = 275.0) -> Market:
+    return Market(neighborhoods=('Midtown', 'EaDo'), occupancy=np.array([0.5, 0.6]), adr=np.array([200.0, 150.0]),
+                  reported_revenue=np.array([36000.0, 32000.0]), occupancy_cv=0.2, adr_cv=0.3, fee=fee)
+
+
+def test_beta_parameters_by_moments():
+    a, b = _beta_parameters(np.array([0.5]), 0.2)
+    assert a[0] == pytest.approx(12) and b[0] == pytest.approx(12)  # variance 0.01
+    a, b = _beta_parameters(np.array([0.9]), 0.5)
+    assert a / (a + b) == pytest.approx(0.9)
+    # capped: (0.5 x 0.9)^2 is more than a Beta with mean 0.9 can have
+    assert a * b / ((a + b) ** 2 * (a + b + 1)) == pytest.approx(0.99 * 0.9 * 0.1)
+
+
+def test_mean_revenue_is_occupancy_times_nights_times_adr_less_the_fee():
+    m = market()
+    revenue = simulate(m, draws=400_000, seed=7)
+    expected = m.occupancy * NIGHTS * m.adr - m.fee
+    np.testing.assert_allclose(revenue.mean(axis=1), expected, rtol=0.01)
+    # independent occupancy and ADR: CV of the product = sqrt((1 + 0.2^2)(1 + 0.3^2) - 1)
+    gross = revenue + m.fee
+    np.testing.assert_allclose(gross.std(axis=1) / gross.mean(axis=1), np.sqrt(1.04 * 1.09 - 1), rtol=0.02)
+
+
+def test_workers_do_not_change_the_draws():
+    m = market()
+    draws = 2 * (SHARD + 100)  # two shards per neighborhood
+    np.testing.assert_array_equal(simulate(m, draws, seed=3), simulate(m, draws, seed=3, workers=2))
+
+
+def test_percentiles_and_the_tree_market():
+    m = market()
+    revenue = np.tile(np.arange(101.0), (2, 1))
+    table = revenue_percentiles(m, revenue, percentiles=(5, 50, 95))
+    assert table['neighborhood'].tolist() == ['Midtown', 'EaDo', 'All neighborhoods']
+    assert table[['p5', 'p50', 'p95']].iloc[0].tolist() == [5, 50, 95]
+    assert table['draws'].tolist() == [101, 101, 202]
+    assert table['reported'].iloc[-1] == 34000
+    assert load_market().fee == 275
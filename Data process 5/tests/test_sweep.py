@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dp5 import cohort
+from dp5.sweep import grid, parse_axis, run_sweep
+
+
+def test_axes_and_grid():
+    np.testing.assert_allclose(parse_axis('0.5:1:3'), [0.5, 0.75, 1])
+    np.testing.assert_allclose(parse_axis('0.9,1.1'), [0.9, 1.1])
+    parameters = grid(international=[0.5, 1.0], domestic=[0.5, 1.0, 1.5])
+    assert len(parameters) == 6
+    assert parameters[['international', 'domestic']].iloc[1].tolist() == [0.5, 1.0]
+    assert (parameters[['fertility', 'mortality']] == 1).all().all()
+    with pytest.raises(ValueError, match='unknown sweep parameter'):
+        grid(tourism=[1.0])
+
+
+def test_fan_chart_percentiles_across_scenarios():
+    regions = cohort.load_regions()
+    parameters = grid(international=[0.0, 0.5, 1.0])
+    fan = run_sweep(parameters, regions, years=5, fan_measures=('population',), percentiles=(0, 50, 100))
+    harris = fan[(fan['county'] == cohort.BASE_COUNTY) & (fan['year'] == regions.base_year + 5)].iloc[0]
+    scenarios = [cohort.Scenario(str(i), international=v) for i, v in enumerate(parameters['international'])]
+    totals = cohort.project(regions, scenarios, years=5)[:, 0, -1].sum(axis=(1, 2))
+    # population rises with international migration, so the median is the middle scenario
+    assert [harris['p0'], harris['p50'], harris['p100']] == pytest.approx(totals.tolist(), rel=1e-6)
+    assert harris['scenarios'] == 3
+
+
+def test_parquet_rows_do_not_depend_on_workers(tmp_path):
+    pytest.importorskip('pyarrow')
+    regions = cohort.load_regions()
+    parameters = grid(international=[0.5, 1.0], domestic=[0.5, 1.5])
+    for workers in (1, 2):
+        run_sweep(parameters, regions, years=3, workers=workers, chunk=1, summary=False,
+                  out=tmp_path / f'{workers}.parquet')
+    one, two = (pd.read_parquet(tmp_path / f'{w}.parquet').sort_values(['scenario', 'county', 'year'],
+                                                                        ignore_index=True) for w in (1, 2))
+    assert one['scenario'].nunique() == 4
+    pd.testing.assert_frame_equal(one, two)
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dp5.datasets import Dataset
+from dp5.timeseries import Panel, build_timeseries
+
+
+def long_rows(months: int = 15, start: str = '2024-01') -> pd.DataFrame:
+    periods = pd.period_range(start, periods=months, freq='M').astype(str)
+    rows = pd.DataFrame({'level': 'zip', 'name': np.repeat(['77007', '77098'], months),
+                         'month': np.tile(periods, 2), 'rent': np.r_[1000 + 10 * np.arange(months),
+                                                                      2000 + 20 * np.arange(months)]})
+    return rows.drop(index=months + 4)  # 77098 has no May 2024
+
+
+def test_growth_and_rolling_mean():
+    panel = Panel.from_long(long_rows(), ['rent'])
+    assert panel.shape == (2, 15)
+    rent = panel.values['rent']
+    mom = panel.growth('rent', 1)
+    assert np.isnan(mom[:, 0]).all()
+    assert mom[0, 1] == pytest.approx(1010 / 1000 - 1)
+    assert np.isnan(mom[1, 4:6]).all()  # the gap and the month after it
+    yoy = panel.yoy('rent')
+    assert yoy[0, 12] == pytest.approx(1120 / 1000 - 1)
+    assert np.isnan(yoy[:, :12]).all()
+    means = panel.rolling_mean('rent', 3)
+    assert means[0, 2] == pytest.approx(1010)  # linear: the middle month
+    assert np.isnan(means[1, 4:7]).all() and means[1, 7] == pytest.approx(rent[1, 6])
+
+
+def test_derive_from_a_start_matches_the_full_derivation():
+    panel = Panel.from_long(long_rows(), ['rent'])
+    full, tail = panel.derive(), panel.derive(start=13)
+    for column in full:
+        np.testing.assert_array_equal(tail[column], full[column][:, 13:])
+
+
+def test_append_matches_building_at_once():
+    rows = long_rows()
+    first = rows[rows['month'] < '2025-01']
+    whole = Panel.from_long(rows, ['rent'])
+    joined = Panel.from_long(first, ['rent']).append(Panel.from_long(rows[rows['month'] >= '2025-01'], ['rent']))
+    assert joined.periods.equals(whole.periods)
+    np.testing.assert_array_equal(joined.values['rent'], whole.values['rent'])
+    with pytest.raises(ValueError):
+        Panel.from_long(first, ['rent']).append(Panel.from_long(rows[rows['month'] >= '2025-02'], ['rent']))
+
+
+def test_resample_to_quarters():
+    panel = Panel.from_long(long_rows(months=15, start='2023-12'), ['rent'])
+    quarters = panel.resample('Q')
+    assert quarters.periods.astype(str).tolist() == ['2023Q4', '2024Q1', '2024Q2', '2024Q3', '2024Q4', '2025Q1']
+    rent = quarters.values['rent']
+    assert np.isnan(rent[:, 0]).all()  # only December
+    assert rent[0, 1] == pytest.approx(1020)  # 1010, 1020, 1030
+    assert np.isnan(rent[1, 2])  # 77098 misses April 2024
+    assert panel.resample('Q', 'last').values['rent'][0, 1] == 1030
+
+
+def test_stage_appends_new_months(tmp_path):
+    rows = pd.DataFrame({'Month': pd.period_range('2024-01', periods=18, freq='M').strftime('%b %Y'),
+                         'Average_Rent': 1800 + np.arange(18), 'Occupancy_Rate': 90.0})
+    path = tmp_path / 'houston_rental_trends.csv'
+    datasets = {'houston_rental_trends': Dataset(path.stem, path)}
+    rows.iloc[:12].to_csv(path, index=False)
+    out = tmp_path / 'out'
+    assert build_timeseries(datasets, out)['appended'] == 12
+    rows.to_csv(path, index=False)
+    assert build_timeseries(datasets, out)['appended'] == 6
+    appended = pd.read_csv(out / 'monthly.csv')
+    assert build_timeseries(datasets, tmp_path / 'fresh')['appended'] == 18
+    pd.testing.assert_frame_equal(appended, pd.read_csv(tmp_path / 'fresh' / 'monthly.csv'))
+    assert appended['rent_yoy'].iloc[12] == pytest.approx(1812 / 1800 - 1)
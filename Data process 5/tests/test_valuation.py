@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from dp5 import valuation
+from dp5.valuation import irr
+
+
+def annuity(rate: float, years: int) -> list[float]:
+    payment = 100 * rate / (1 - (1 + rate) ** -years)
+    return [-100.0] + [payment] * years
+
+
+def test_irr_closed_forms():
+    flows = np.array([[-100, 110, 0, 0], [-100, 0, 0, 133.1], [-100, 5, 5, 105], annuity(0.07, 3)])
+    np.testing.assert_allclose(irr(flows), [0.10, 0.10, 0.05, 0.07], atol=1e-10)
+
+
+def test_irr_falls_back_to_bisection(monkeypatch):
+    bisected = []
+    bisect = valuation._bisect
+    monkeypatch.setattr(valuation, '_bisect', lambda flows: bisected.append(len(flows)) or bisect(flows))
+    flows = np.array([[-100] + [0] * 9 + [5000], [-100, 110] + [0] * 9])
+    # From a guess of 500% the first row's discounting is too flat for Newton to settle
+    rates = irr(flows, guess=5.0)
+    assert bisected == [1]
+    np.testing.assert_allclose(rates, [50 ** 0.1 - 1, 0.10], atol=1e-9)
+
+
+def test_irr_is_nan_without_a_sign_change():
+    rates = irr(np.array([[-100.0, -10.0], [100.0, 10.0], [-100.0, 110.0]]))
+    assert np.isnan(rates[:2]).all() and rates[2] == pytest.approx(0.10)
+
+
+def test_npv_is_zero_discounting_at_the_irr():
+    market = valuation.load_market()
+    portfolio = valuation.representative_portfolio(market)
+    rates = valuation.value(market, portfolio, valuation.scenario_grid())['irr'][:, 0]
+    at_irr = valuation.value(market, portfolio, valuation.scenario_grid(discount_rate=rates))
+    prices = at_irr['price'][:, 0]
+    np.testing.assert_allclose(np.diagonal(at_irr['npv']) / prices, 0, atol=1e-9)
@@ -0,0 +1,53 @@
+import pandas as pd
+import pytest
+
+from dp5.values import parse_values, typed_frame, value_columns
+
+CASES = [
+    # string, value, low, high, unit, qualifier
+    ('$72,336', 72336, None, None, 'USD', None),
+    ('4.30%', 4.3, None, None, 'percent', None),
+    ('+9,700 jobs', 9700, None, None, 'jobs', None),
+    ('-2.5%', -2.5, None, None, 'percent', None),
+    ('45,000+ globally', 45000, None, None, None, 'at_least'),
+    ('$1.2 billion', 1.2e9, None, None, 'USD', None),
+    ('$127 - $279 ($189 average)', 189, 127, 279, 'USD', 'range'),
+    ('51.0% (43-59% range)', 51, 43, 59, 'percent', 'range'),
+    ('8,656 - 20,161 listings', 14408.5, 8656, 20161, 'listings', 'range'),
+    ('~3.5 million', 3.5e6, None, None, None, 'approx'),
+    ('up to 500 units', 500, None, None, 'units', 'at_most'),
+    ('#3 nationally', 3, None, None, 'rank', None),
+    ('Strong', None, None, None, None, None),
+]
+
+
+def same(actual, expected) -> bool:
+    if expected is None:
+        return pd.isna(actual)
+    return not pd.isna(actual) and actual == pytest.approx(expected)
+
+
+@pytest.mark.parametrize('text, value, low, high, unit, qualifier', CASES, ids=[c[0] for c in CASES])
+def test_parse_values(text, value, low, high, unit, qualifier):
+    row = parse_values(pd.Series([text])).iloc[0]
+    assert same(row['value'], value)
+    assert same(row['value_low'], low)
+    assert same(row['value_high'], high)
+    assert (None if pd.isna(row['unit']) else row['unit']) == unit
+    assert (None if pd.isna(row['qualifier']) else row['qualifier']) == qualifier
+
+
+def test_period_comes_from_the_label_first():
+    parsed = parse_values(pd.Series(['4.1% in 2024', '4.1% in 2024', '$5']),
+                          pd.Series(['Unemployment (May 2025)', 'Unemployment', 'Fee']))
+    assert parsed['period'].tolist()[:2] == ['May 2025', '2024']
+    assert pd.isna(parsed['period'].iloc[2])
+
+
+def test_value_columns_and_typed_frame():
+    frame = pd.DataFrame({'Metric': ['Jobs', 'Rate', 'Leader'], 'Value': ['+9,700 jobs', '4.3%', '$1.2B'],
+                          'Notes': ['strong', 'steady', 'n/a']})
+    assert value_columns(frame) == ['Value']
+    typed = typed_frame(frame, {'Value': parse_values(frame['Value'])})
+    assert typed['value'].tolist() == [9700, 4.3, 1.2e9]
+    assert typed['unit'].tolist() == ['jobs', 'percent', 'USD']
@@ -0,0 +1,40 @@
+import pandas as pd
+import pytest
+
+from dp5 import warehouse
+from dp5.datasets import discover_datasets
+from dp5.warehouse import Warehouse, build_warehouse, name_key
+
+
+def test_name_key():
+    names = pd.Series(['The Heights', 'Heights', 'Downtown (CBD)', 'Sugar Land/Stafford'])
+    assert name_key(names).tolist() == ['heights', 'heights', 'downtown', 'sugar land stafford']
+
+
+@pytest.fixture
+def built(tmp_path, monkeypatch):
+    monkeypatch.setattr(warehouse, 'FACTS_DIR', tmp_path / 'no-facts')
+    datasets = {name: dataset for name, dataset in discover_datasets().items()
+                if name in ('houston_zip_code_rents_2025', 'houston_neighborhood_comparison')}
+    path = tmp_path / 'warehouse.sqlite'
+    assert build_warehouse(datasets, path) == {'houston_zip_code_rents_2025': 14,
+                                               'houston_neighborhood_comparison': 10}
+    with Warehouse(path) as wh:
+        yield wh
+
+
+def test_zip_profile_follows_the_zips_neighborhood(built):
+    profile = built.zip_profile(77007)
+    assert profile['houston_zip_code_rents_2025']['zip_code'].tolist() == ['77007']
+    # the zip table says 'Heights', the comparison 'The Heights'
+    assert profile['houston_neighborhood_comparison']['neighborhood'].tolist() == ['The Heights']
+
+
+def test_catalog_and_indexes(built):
+    assert built.columns('zip_code') == [('houston_zip_code_rents_2025', 'zip_code')]
+    assert built.columns('neighborhood', 'houston_neighborhood_comparison') == [
+        ('houston_neighborhood_comparison', 'neighborhood_key')]
+    plan = built.query('EXPLAIN QUERY PLAN SELECT * FROM houston_zip_code_rents_2025 WHERE zip_code = ?', ('77007',))
+    assert 'USING INDEX' in plan['detail'].iloc[0]
+    with pytest.raises(ValueError, match='unknown role'):
+        built.find('county', 'Harris')
@@ -0,0 +1,27 @@
+import pytest
+
+from dp5 import graph, runner
+from dp5.graph import Script
+from dp5.warm import WarmPool
+
+
+@pytest.fixture
+def folder(tmp_path, monkeypatch):
+    monkeypatch.setattr(graph, 'DATA_ROOT', tmp_path)
+    monkeypatch.setattr(runner, 'LOG_DIR', tmp_path / 'logs')
+    topic = tmp_path / 'Topic'
+    topic.mkdir()
+    (topic / 'script.py').write_text('rows = [1, 2, 3]\n')
+    # like the exported notebook cells: relies on the earlier cell's names and on pd
+    (topic / 'script_1.py').write_text("pd.DataFrame({'x': rows}).to_csv('out.csv', index=False)\n")
+    (topic / 'chart_script.py').write_text('print(rows)\n')
+    return topic
+
+
+def test_data_scripts_of_a_folder_share_a_namespace_and_charts_do_not(folder):
+    with WarmPool(1) as pool:
+        results = [pool.execute(Script(folder / name)) for name in ('script.py', 'script_1.py', 'chart_script.py')]
+    assert [r.status for r in results] == ['ok', 'ok', 'failed']
+    assert (folder / 'out.csv').read_text().split() == ['x', '1', '2', '3']
+    assert "NameError: name 'rows' is not defined" in (folder.parent / 'logs' / 'Topic__chart_script.py.log').read_text()
+    assert len(pool.startups) == 1
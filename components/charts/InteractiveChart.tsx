@@ -0,0 +1,113 @@
+'use client'
+
+import { useEffect, useRef, useState } from 'react'
+
+// Written by `python3 -m dp5 charts --interactive --out ../public/charts`
+const CHARTS_BASE = '/charts'
+
+interface ChartManifest {
+  plotly: string
+  plotly_version: string
+  template: string
+  precision: number
+  charts: Record<string, { path: string; bytes: number }>
+}
+
+interface PlotlyStatic {
+  newPlot: (el: HTMLElement, data: unknown[], layout: object, config: object) => Promise<unknown>
+  purge: (el: HTMLElement) => void
+}
+
+declare global {
+  interface Window {
+    Plotly?: PlotlyStatic
+  }
+}
+
+interface InteractiveChartProps {
+  // Chart key as in the manifest, e.g. 'Harris County Texas Multifamily Investment Market/houston_cap_rates.png'
+  chart: string
+  height?: number
+  className?: string
+}
+
+// Shared by every chart on the page: the manifest, template and plotly.js load once
+let manifestPromise: Promise<ChartManifest> | null = null
+let templatePromise: Promise<object> | null = null
+let plotlyPromise: Promise<PlotlyStatic> | null = null
+
+function fetchJson<T>(path: string): Promise<T> {
+  return fetch(`${CHARTS_BASE}/${encodeURI(path)}`).then((response) => {
+    if (!response.ok) throw new Error(`${path}: ${response.status}`)
+    return response.json() as Promise<T>
+  })
+}
+
+function loadManifest() {
+  manifestPromise ??= fetchJson<ChartManifest>('manifest.json')
+  return manifestPromise
+}
+
+function loadTemplate(manifest: ChartManifest) {
+  templatePromise ??= fetchJson<object>(manifest.template)
+  return templatePromise
+}
+
+function loadPlotly(manifest: ChartManifest) {
+  plotlyPromise ??= new Promise<PlotlyStatic>((resolve, reject) => {
+    if (window.Plotly) return resolve(window.Plotly)
+    const script = document.createElement('script')
+    script.src = `${CHARTS_BASE}/${manifest.plotly}`
+    script.async = true
+    script.onload = () => (window.Plotly ? resolve(window.Plotly) : reject(new Error('plotly.js did not load')))
+    script.onerror = () => {
+      plotlyPromise = null
+      reject(new Error(`failed to load ${manifest.plotly}`))
+    }
+    document.head.appendChild(script)
+  })
+  return plotlyPromise
+}
+
+export function InteractiveChart({ chart, height = 450, className = '' }: InteractiveChartProps) {
+  const container = useRef<HTMLDivElement>(null)
+  const [error, setError] = useState<string | null>(null)
+
+  useEffect(() => {
+    let cancelled = false
+    let plotly: PlotlyStatic | null = null
+    const el = container.current
+
+    async function draw() {
+      const manifest = await loadManifest()
+      const entry = manifest.charts[chart]
+      if (!entry) throw new Error(`unknown chart ${chart}`)
+      const [Plotly, template, figure] = await Promise.all([
+        loadPlotly(manifest),
+        loadTemplate(manifest),
+        fetchJson<{ data: unknown[]; layout: object }>(entry.path),
+      ])
+      if (cancelled || !el) return
+      plotly = Plotly
+      await Plotly.newPlot(el, figure.data, { ...figure.layout, template, autosize: true, width: undefined, height },
+        { responsive: true, displaylogo: false })
+    }
+
+    draw().catch((err: Error) => {
+      if (!cancelled) setError(err.message)
+    })
+    return () => {
+      cancelled = true
+      if (plotly && el) plotly.purge(el)
+    }
+  }, [chart, height])
+
+  if (error) {
+    return (
+      <div className={`flex items-center justify-center text-sm text-gray-500 ${className}`} style={{ height }}>
+        Chart unavailable
+      </div>
+    )
+  }
+  return <div ref={container} className={className} style={{ height }} />
+}
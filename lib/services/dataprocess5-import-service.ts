@@ -634,12 +634,22 @@ export class DataProcess5ImportService {
     }
   }
 
+  // Prefer the typed copy written by the Python pipeline (`python3 -m dp5 stage typed`).
+  // It keeps every original column, so the mappings above read it like the source CSV;
+  // they still parse the display columns themselves and do not use the added
+  // value/value_low/value_high/unit/qualifier/period columns. The bulk loader
+  // (`python3 -m dp5 load`) is the path that reads typed values.
+  private resolveDataFile(filePath: string): string {
+    const typed = path.join(this.basePath, 'derived', 'typed', path.basename(filePath))
+    return fs.existsSync(typed) ? typed : filePath
+  }
+
   // Helper method to parse CSV files
   private async parseCSV(filePath: string): Promise<any[]> {
     return new Promise((resolve, reject) => {
       const records: any[] = []
       
-      fs.createReadStream(filePath)
+      fs.createReadStream(this.resolveDataFile(filePath))
         .pipe(csv.parse({ 
           columns: true, 
           skip_empty_lines: true,